@@ -22,6 +22,9 @@ from mcp.client.stdio import stdio_client
 
 def format_response(result: Any) -> Dict[str, Any]:
     """Parse and format MCP tool response"""
+    if result.structuredContent is not None:
+        return result.structuredContent
+
     if not result.content or len(result.content) == 0:
         return {"error": "Empty response"}
 
@@ -30,20 +33,10 @@ def format_response(result: Any) -> Dict[str, Any]:
         return {"error": "No text content"}
 
     try:
-        import ast
-
-        response_data = ast.literal_eval(content_item.text)
-
-        # Extract actual data from nested structure
-        if isinstance(response_data, list) and len(response_data) > 0:
-            actual_response = response_data[0]
-            if "text" in actual_response:
-                return ast.literal_eval(actual_response["text"])
-
-        return response_data
-
-    except (ValueError, SyntaxError) as e:
-        return {"error": f"Parse error: {e}", "raw": content_item.text}
+        return json.loads(content_item.text)
+    except ValueError:
+        # Error messages are plain text
+        return {"error": content_item.text}
 
 
 async def main() -> None:
@@ -10,8 +10,8 @@ Example queries:
 - "Order number 91000092 details please"
 """
 
-import ast
 import asyncio
+import json
 import os
 from typing import Any, Dict, Optional
 
@@ -144,29 +144,20 @@ Examples:
                     )
 
                     # Parse the MCP response
-                    if entity_result.content and len(entity_result.content) > 0:
+                    actual_data = entity_result.structuredContent
+                    if actual_data is None and entity_result.content:
                         content_item = entity_result.content[0]
                         if hasattr(content_item, "text"):
                             try:
-                                response_data = ast.literal_eval(content_item.text)
-                                if (
-                                    isinstance(response_data, list)
-                                    and len(response_data) > 0
-                                ):
-                                    actual_response = response_data[0]
-                                    if "text" in actual_response:
-                                        actual_data = ast.literal_eval(
-                                            actual_response["text"]
-                                        )
-                                        if "data" in actual_data:
-                                            print(
-                                                "✅ Order data retrieved successfully"
-                                            )
-                                            return actual_data["data"]
-                            except (ValueError, SyntaxError) as e:
+                                actual_data = json.loads(content_item.text)
+                            except ValueError as e:
                                 print(f"❌ Error parsing response: {e}")
                                 return None
 
+                    if isinstance(actual_data, dict) and "data" in actual_data:
+                        print("✅ Order data retrieved successfully")
+                        return actual_data["data"]
+
                     print("❌ No order data found")
                     return None
 
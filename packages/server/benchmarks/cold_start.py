@@ -0,0 +1,105 @@
+"""Cold-start benchmark of the stdio server
+
+Spawns the server the way MCP clients do (one process per session) and
+measures the time from process start, through ``cli_main()``, to a
+successful ``initialize`` and ``list_tools``.
+
+Usage:
+    python benchmarks/cold_start.py [--runs 10] [--save]
+
+``--save`` records the result as the new baseline in
+``benchmarks/cold_start_baseline.json``; otherwise the result is compared
+with the recorded baseline.
+"""
+
+import argparse
+import asyncio
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from mcp import StdioServerParameters
+from mcp.client.session import ClientSession
+from mcp.client.stdio import stdio_client
+
+from sap_mcp_server.utils.serialization import dumps, loads
+
+BASELINE_PATH = Path(__file__).with_name("cold_start_baseline.json")
+SERVER_COMMAND = "from sap_mcp_server.transports.stdio import cli_main; cli_main()"
+
+
+async def measure_once(workdir: str) -> Dict[str, float]:
+    """Start one server process and time the handshake and tool listing"""
+    # No SAP credentials, so the background SAP warm-up is skipped
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("SAP_", "MCP_"))
+    }
+    params = StdioServerParameters(
+        command=sys.executable, args=["-c", SERVER_COMMAND], env=env, cwd=workdir
+    )
+
+    started = time.perf_counter()
+    async with stdio_client(params, errlog=open(os.devnull, "w")) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            initialized = time.perf_counter()
+            tools = await session.list_tools()
+            listed = time.perf_counter()
+
+    if not tools.tools:
+        raise RuntimeError("Server listed no tools")
+    return {"initialize": initialized - started, "list_tools": listed - started}
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Reduce samples to min/median milliseconds per phase"""
+    return {
+        phase: {
+            "min_ms": round(min(s[phase] for s in samples) * 1000, 1),
+            "median_ms": round(statistics.median(s[phase] for s in samples) * 1000, 1),
+        }
+        for phase in ("initialize", "list_tools")
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--save", action="store_true", help="Record as baseline")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # The first run warms the OS file cache and .pyc files
+        await measure_once(workdir)
+        samples = [await measure_once(workdir) for _ in range(args.runs)]
+    result = summarize(samples)
+
+    for phase, timings in result.items():
+        line = f"{phase:<12}min {timings['min_ms']:>7.1f} ms   "
+        line += f"median {timings['median_ms']:>7.1f} ms"
+        if BASELINE_PATH.exists() and not args.save:
+            baseline = loads(BASELINE_PATH.read_text())["result"][phase]
+            change = timings["median_ms"] / baseline["median_ms"] - 1
+            line += f"   ({change:+.0%} vs baseline)"
+        print(line)
+
+    if args.save:
+        record = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": args.runs,
+            "result": result,
+        }
+        BASELINE_PATH.write_text(dumps(record) + "\n")
+        print(f"Saved baseline to {BASELINE_PATH}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""Microbenchmark of the JSON backends on SAP-like OData v2 payloads
+
+Usage:
+    python benchmarks/json_backends.py [--entities 1000] [--repeat 20]
+
+Install the optional backends with ``pip install -e ".[fast]"`` (and
+``pip install msgspec``) to compare them with the standard library.
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from sap_mcp_server.utils.serialization import available_backends
+
+
+def make_entity(index: int) -> Dict[str, Any]:
+    """Build one sales-order-like entity in the OData v2 JSON format"""
+    key = f"{91000000 + index:010d}"
+    uri = f"https://sap.example.com/sap/opu/odata/sap/ZSD_SRV/OrderSet('{key}')"
+    return {
+        "__metadata": {
+            "id": uri,
+            "uri": uri,
+            "type": "ZSD_SRV.Order",
+            "etag": f"W/\"datetime'2024-05-{index % 28 + 1:02d}T10%3A15%3A00'\"",
+        },
+        "Vbeln": key,
+        "Auart": "ZOR",
+        "Vkorg": "1000",
+        "Kunnr": f"{100000 + index % 500:010d}",
+        "Erdat": f"/Date({1714521600000 + index * 86400000})/",
+        "Erzet": "PT10H15M00S",
+        "Netwr": f"{index * 13.37:.2f}",
+        "Waerk": "EUR",
+        "Bstnk": f"PO-{index}-ÄÖÜ",
+        "Gbstk": "A" if index % 3 else "C",
+        "Items": {"__deferred": {"uri": f"{uri}/Items"}},
+        "Partners": {"__deferred": {"uri": f"{uri}/Partners"}},
+    }
+
+
+def make_payload(entities: int) -> Dict[str, Any]:
+    """Build an entity set response with an inline count"""
+    return {
+        "d": {
+            "__count": str(entities),
+            "results": [make_entity(i) for i in range(entities)],
+        }
+    }
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """Return the fastest of ``repeat`` timed calls in milliseconds"""
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    backends = available_backends()
+    payload = make_payload(args.entities)
+    reference = backends["json"][1](payload)
+    print(
+        f"OData v2 payload: {args.entities} entities, "
+        f"{len(reference.encode('utf-8')) / 1024:.0f} KiB"
+    )
+    print(f"{'backend':<10}{'loads ms':>12}{'dumps ms':>12}{'loads x':>10}")
+
+    timings = {}
+    for name, (decode, encode) in backends.items():
+        assert decode(reference) == payload, f"{name} round trip differs"
+        timings[name] = (
+            best_of(args.repeat, lambda: decode(reference)),
+            best_of(args.repeat, lambda: encode(payload, None)),
+        )
+
+    baseline = timings["json"][0]
+    for name, (loads_ms, dumps_ms) in timings.items():
+        print(
+            f"{name:<10}{loads_ms:>12.2f}{dumps_ms:>12.2f}"
+            f"{baseline / loads_ms:>9.1f}x"
+        )
+
+    skipped = [name for name in ("orjson", "msgspec") if name not in backends]
+    if skipped:
+        print(f"Not installed: {', '.join(skipped)}")
+
+
+if __name__ == "__main__":
+    main()
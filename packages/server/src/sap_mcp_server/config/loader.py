@@ -1,10 +1,10 @@
 """YAML configuration loader for SAP services"""
 
 import logging
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
-import yaml
 from pydantic import ValidationError
 
 from .schemas import ServicesYAMLConfig
@@ -18,38 +18,94 @@ class ServiceConfigurationError(Exception):
     pass
 
 
+# Seconds between checks of the services file for changes
+DEFAULT_RELOAD_INTERVAL = 2.0
+
+# File state used to detect changes: (mtime in ns, size), None if missing
+FileSignature = Optional[Tuple[int, int]]
+
+
 class ServicesConfigLoader:
-    """Loader for SAP services configuration from YAML files"""
+    """Loader for SAP services configuration from YAML files
+
+    The loaded configuration is an immutable snapshot. When the YAML file
+    changes (modification time or size), the next ``load()`` after the
+    reload interval parses it and swaps in a new snapshot; callers that
+    still hold the previous one are unaffected. An invalid file is logged
+    and the current snapshot is kept.
+    """
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize the configuration loader
 
         Args:
             config_path: Path to services YAML file. If None, uses default location.
+            reload_interval: Seconds between checks for file changes (0 disables
+                hot reload)
+            clock: Monotonic time source (injectable for tests)
         """
         self.config_path = config_path
+        self.reload_interval = reload_interval
+        self._clock = clock
         self._config: Optional[ServicesYAMLConfig] = None
+        self._signature: FileSignature = None
+        self._next_check = 0.0
+        self.reload_count = 0
 
     def load(self) -> ServicesYAMLConfig:
         """
-        Load and validate services configuration from YAML
+        Get the services configuration, reloading it if the file changed
 
         Returns:
             ServicesYAMLConfig: Validated configuration object
 
         Raises:
-            ServiceConfigurationError: If configuration cannot be loaded or is invalid
+            ServiceConfigurationError: If the initial configuration cannot be
+                loaded or is invalid
         """
-        if self._config is not None:
-            return self._config
+        config = self._config
+        if config is None:
+            return self._load_file()
+
+        if self.reload_interval > 0 and self._clock() >= self._next_check:
+            self._next_check = self._clock() + self.reload_interval
+            signature = self._file_signature()
+            if signature != self._signature:
+                try:
+                    config = self._load_file()
+                    self.reload_count += 1
+                except ServiceConfigurationError as e:
+                    # Do not retry until the file changes again
+                    self._signature = signature
+                    logger.error(f"Keeping current services configuration: {e}")
+        return config
+
+    def _file_signature(self) -> FileSignature:
+        if self.config_path is None:
+            return None
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
+    def _load_file(self) -> ServicesYAMLConfig:
+        """Parse the YAML file and swap in the new configuration snapshot"""
         # Determine config file path
         if self.config_path is None:
             # Default location: config/services.yaml relative to package
             package_dir = Path(__file__).parent.parent
             self.config_path = package_dir.parent.parent / "config" / "services.yaml"
 
+        # Taken before reading, so a change during the read is seen next time
+        self._signature = self._file_signature()
+        self._next_check = self._clock() + self.reload_interval
         if not self.config_path.exists():
             logger.warning(
                 f"Services configuration file not found: {self.config_path}. "
@@ -57,6 +113,8 @@ class ServicesConfigLoader:
             )
             return self._load_default_config()
 
+        import yaml
+
         try:
             # Validate path security (prevent directory traversal)
             resolved_path = self.config_path.resolve()
@@ -73,30 +131,35 @@ class ServicesConfigLoader:
                 logger.warning("Empty YAML configuration, using defaults")
                 return self._load_default_config()
 
-            # Validate with Pydantic
-            self._config = ServicesYAMLConfig(**yaml_data)
+            # Validate with Pydantic, then swap the snapshot in one assignment
+            config = ServicesYAMLConfig(**yaml_data)
+            self._config = config
             logger.info(
-                f"Loaded {len(self._config.services)} services from {self.config_path}"
+                f"Loaded {len(config.services)} services from {self.config_path}"
             )
-            return self._config
+            return config
 
         except yaml.YAMLError as e:
             raise ServiceConfigurationError(
                 f"Failed to parse YAML configuration: {str(e)}"
             )
         except ValidationError as e:
-            raise ServiceConfigurationError(
-                f"Invalid service configuration: {str(e)}"
-            )
+            raise ServiceConfigurationError(f"Invalid service configuration: {str(e)}")
         except Exception as e:
             raise ServiceConfigurationError(
                 f"Failed to load service configuration: {str(e)}"
             )
 
     def reload(self) -> ServicesYAMLConfig:
-        """Reload configuration from file"""
-        self._config = None
-        return self.load()
+        """Reload configuration from file
+
+        Raises:
+            ServiceConfigurationError: If the file is invalid; the current
+                configuration is kept
+        """
+        config = self._load_file()
+        self.reload_count += 1
+        return config
 
     def _is_safe_path(self, path: Path) -> bool:
         """
@@ -129,7 +192,12 @@ class ServicesConfigLoader:
         Returns:
             ServicesYAMLConfig: Default configuration with generic auth endpoint
         """
-        from .schemas import AuthEndpointConfig, EntityConfig, GatewayConfig, ServiceConfig
+        from .schemas import (
+            AuthEndpointConfig,
+            EntityConfig,
+            GatewayConfig,
+            ServiceConfig,
+        )
 
         logger.info("Loading default service configuration")
 
@@ -137,7 +205,9 @@ class ServicesConfigLoader:
             gateway=GatewayConfig(
                 base_url_pattern="https://{host}:{port}/sap/opu/odata",
                 metadata_suffix="/$metadata",
-                service_catalog_path="/sap/opu/odata/IWFND/CATALOGSERVICE;v=2/ServiceCollection",
+                service_catalog_path=(
+                    "/sap/opu/odata/IWFND/CATALOGSERVICE;v=2/ServiceCollection"
+                ),
                 auth_endpoint=AuthEndpointConfig(
                     use_catalog_metadata=True,  # Use generic catalog for authentication
                     service_id=None,
@@ -170,6 +240,7 @@ class ServicesConfigLoader:
 
 # Global loader instance
 _loader: Optional[ServicesConfigLoader] = None
+_reload_interval = DEFAULT_RELOAD_INTERVAL
 
 
 def get_services_config(
@@ -178,6 +249,9 @@ def get_services_config(
     """
     Get services configuration (singleton pattern)
 
+    The file is checked for changes at most every reload interval and a
+    changed file is swapped in without replacing the loader.
+
     Args:
         config_path: Optional path to configuration file
         reload: Force reload from file
@@ -187,12 +261,27 @@ def get_services_config(
     """
     global _loader
 
-    if _loader is None or reload:
-        _loader = ServicesConfigLoader(config_path)
+    if _loader is None:
+        _loader = ServicesConfigLoader(config_path, reload_interval=_reload_interval)
+        return _loader.load()
+
+    if reload:
+        if config_path is not None:
+            _loader.config_path = config_path
+        return _loader.reload()
 
     return _loader.load()
 
 
+def set_reload_interval(seconds: float) -> None:
+    """Set how often the services file is checked for changes (0 disables)"""
+    global _reload_interval
+
+    _reload_interval = seconds
+    if _loader is not None:
+        _loader.reload_interval = seconds
+
+
 def reload_services_config() -> ServicesYAMLConfig:
     """Reload services configuration from file"""
     return get_services_config(reload=True)
@@ -1,8 +1,8 @@
 """Pydantic models for SAP service configuration from YAML"""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class EntityConfig(BaseModel):
@@ -17,6 +17,12 @@ class EntityConfig(BaseModel):
     default_select: Optional[List[str]] = Field(
         None, description="Default fields to select"
     )
+    cache_ttl: Optional[float] = Field(
+        None,
+        ge=0,
+        description="Seconds to cache reads of this entity set (0 disables, "
+        "unset inherits from the service)",
+    )
 
     @field_validator("name")
     @classmethod
@@ -40,6 +46,19 @@ class ServiceConfig(BaseModel):
         default_factory=dict, description="Custom HTTP headers for this service"
     )
     description: Optional[str] = Field(None, description="Service description")
+    cache_ttl: Optional[float] = Field(
+        None,
+        ge=0,
+        description="Seconds to cache reads from this service (0 disables, "
+        "unset uses the global default)",
+    )
+
+    _entities_by_name: Dict[str, EntityConfig] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Index entity sets by name; the first of duplicate names wins
+        for entity in reversed(self.entities):
+            self._entities_by_name[entity.name] = entity
 
     @field_validator("version")
     @classmethod
@@ -57,10 +76,7 @@ class ServiceConfig(BaseModel):
 
     def get_entity(self, entity_name: str) -> Optional[EntityConfig]:
         """Get entity configuration by name"""
-        for entity in self.entities:
-            if entity.name == entity_name:
-                return entity
-        return None
+        return self._entities_by_name.get(entity_name)
 
 
 class AuthEndpointConfig(BaseModel):
@@ -131,8 +147,74 @@ class GatewayConfig(BaseModel):
         return v
 
 
+class CacheConfig(BaseModel):
+    """Configuration for the read-only response cache"""
+
+    enabled: bool = Field(True, description="Cache GET responses from SAP")
+    max_entries: int = Field(
+        256, ge=0, description="Maximum cached responses per connection (LRU)"
+    )
+    default_ttl: float = Field(
+        0.0,
+        ge=0,
+        description="Seconds to cache reads when no service/entity TTL is set "
+        "(0: only services and entity sets with a cache_ttl are cached)",
+    )
+
+
+class ProjectionConfig(BaseModel):
+    """Configuration for the default $select of entity reads"""
+
+    prune_from_metadata: bool = Field(
+        True,
+        description="Without select or default_select, use the service metadata "
+        "to leave out heavyweight properties",
+    )
+    excluded_types: List[str] = Field(
+        default_factory=lambda: ["Edm.Binary", "Edm.Stream"],
+        description="Edm types left out of the default projection",
+    )
+    max_text_length: int = Field(
+        1024,
+        ge=0,
+        description="Strings with a larger MaxLength are left out of the default "
+        "projection",
+    )
+
+
+class OutputConfig(BaseModel):
+    """Configuration for the size budget of query results"""
+
+    enabled: bool = Field(True, description="Split oversized results into pages")
+    max_rows: int = Field(200, ge=1, description="Maximum rows per page")
+    max_bytes: int = Field(
+        262144, ge=0, description="Maximum JSON bytes of rows per page (0 = no limit)"
+    )
+    cursor_ttl: float = Field(
+        600.0, ge=0, description="Seconds a continuation cursor stays valid"
+    )
+    max_stored_results: int = Field(
+        32, ge=0, description="Maximum results kept for continuation (LRU)"
+    )
+
+
+class ValidationConfig(BaseModel):
+    """Configuration for checking reads against the service metadata"""
+
+    enabled: bool = Field(
+        True,
+        description="Reject unknown entity sets and properties, and filter "
+        "literals or keys of the wrong type, before calling SAP",
+    )
+
+
 class ServicesYAMLConfig(BaseModel):
-    """Root configuration model for services YAML file"""
+    """Root configuration model for services YAML file
+
+    Lookups by service ID and path use indexes built at validation time, so
+    a loaded configuration is treated as an immutable snapshot: reloading
+    builds a new instance instead of modifying this one.
+    """
 
     gateway: GatewayConfig = Field(
         default_factory=GatewayConfig, description="Gateway URL configuration"
@@ -140,13 +222,33 @@ class ServicesYAMLConfig(BaseModel):
     services: List[ServiceConfig] = Field(
         default_factory=list, description="List of SAP OData services"
     )
+    cache: CacheConfig = Field(
+        default_factory=CacheConfig, description="Response cache configuration"
+    )
+    projection: ProjectionConfig = Field(
+        default_factory=ProjectionConfig,
+        description="Default $select projection configuration",
+    )
+    output: OutputConfig = Field(
+        default_factory=OutputConfig, description="Query result size budget"
+    )
+    validation: ValidationConfig = Field(
+        default_factory=ValidationConfig,
+        description="Metadata-based request validation configuration",
+    )
+
+    _services_by_id: Dict[str, ServiceConfig] = PrivateAttr(default_factory=dict)
+    _services_by_path: Dict[str, ServiceConfig] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Index services by ID and path; the first of duplicates wins
+        for service in reversed(self.services):
+            self._services_by_id[service.id] = service
+            self._services_by_path[service.path] = service
 
     def get_service(self, service_id: str) -> Optional[ServiceConfig]:
         """Get service configuration by ID"""
-        for service in self.services:
-            if service.id == service_id:
-                return service
-        return None
+        return self._services_by_id.get(service_id)
 
     def list_service_ids(self) -> List[str]:
         """Get list of all service IDs"""
@@ -158,3 +260,25 @@ class ServicesYAMLConfig(BaseModel):
         if service:
             return service.get_entity(entity_name)
         return None
+
+    def get_service_by_path(self, service_path: str) -> Optional[ServiceConfig]:
+        """Get service configuration by service path"""
+        return self._services_by_path.get(service_path)
+
+    def get_cache_ttl(self, service_path: str, entity_set: str) -> float:
+        """Get the response cache TTL for reads from an entity set
+
+        The entity TTL takes precedence over the service TTL, which takes
+        precedence over the global default.
+        """
+        if not self.cache.enabled:
+            return 0.0
+
+        service = self.get_service_by_path(service_path)
+        if service:
+            entity = service.get_entity(entity_set)
+            if entity and entity.cache_ttl is not None:
+                return entity.cache_ttl
+            if service.cache_ttl is not None:
+                return service.cache_ttl
+        return self.cache.default_ttl
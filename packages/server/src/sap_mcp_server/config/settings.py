@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -21,6 +21,58 @@ class SAPConnectionConfig(BaseSettings):
     )
     timeout: int = Field(30, description="Request timeout in seconds")
     retry_attempts: int = Field(3, description="Number of retry attempts")
+    connect_timeout: Optional[float] = Field(
+        None, description="Timeout for acquiring a connection in seconds"
+    )
+    read_timeout: Optional[float] = Field(
+        None, description="Timeout between reads of response data in seconds"
+    )
+    pool_size: int = Field(100, description="Maximum pooled HTTP connections")
+    pool_size_per_host: int = Field(
+        10, description="Maximum pooled HTTP connections per SAP host (0 = no limit)"
+    )
+    keepalive_timeout: float = Field(
+        15.0, description="Seconds an idle pooled connection is kept open"
+    )
+    dns_cache_ttl: int = Field(300, description="DNS cache lifetime in seconds")
+    auth_mode: str = Field(
+        "eager",
+        description="Authentication mode: 'eager' logs in up front, 'lazy' sends "
+        "credentials on the first data request and fetches the CSRF token on demand",
+    )
+    token_lifetime: int = Field(
+        1800, description="Assumed SAP session and CSRF token lifetime in seconds"
+    )
+    token_refresh_enabled: bool = Field(
+        True, description="Renew the authentication token in the background"
+    )
+    token_refresh_lead_time: int = Field(
+        120, description="Seconds before token expiry to start the background refresh"
+    )
+    token_refresh_jitter: int = Field(
+        30, description="Maximum random seconds added to the refresh lead time"
+    )
+
+    metadata_cache_ttl: int = Field(
+        86400, description="Seconds cached service metadata is used before revalidation"
+    )
+    metadata_cache_persist: bool = Field(
+        True, description="Persist parsed service metadata across restarts"
+    )
+    metadata_cache_dir: Optional[str] = Field(
+        None,
+        description="Directory for persisted metadata "
+        "(default: ~/.cache/sap-mcp-server/metadata)",
+    )
+
+    max_filter_length: int = Field(
+        2048,
+        description="Maximum URL-encoded $filter length; longer key lists are "
+        "split into concurrent requests (0 = never split)",
+    )
+    filter_chunk_parallel: int = Field(
+        4, description="Maximum concurrent requests for a split key-list filter"
+    )
 
     model_config = {"env_prefix": "SAP_"}
 
@@ -38,6 +90,52 @@ class SAPConnectionConfig(BaseSettings):
             raise ValueError("Port must be between 1 and 65535")
         return v
 
+    @field_validator("pool_size", "pool_size_per_host", "dns_cache_ttl")
+    @classmethod
+    def validate_pool_limits(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Pool limits must not be negative")
+        return v
+
+    @field_validator("auth_mode")
+    @classmethod
+    def validate_auth_mode(cls, v: str) -> str:
+        v = v.strip().lower()
+        if v not in ("eager", "lazy"):
+            raise ValueError("Auth mode must be 'eager' or 'lazy'")
+        return v
+
+    @field_validator("token_lifetime")
+    @classmethod
+    def validate_token_lifetime(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Token lifetime must be positive")
+        return v
+
+    @field_validator("metadata_cache_ttl")
+    @classmethod
+    def validate_metadata_cache_ttl(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Metadata cache TTL must not be negative")
+        return v
+
+    @field_validator("token_refresh_lead_time", "token_refresh_jitter")
+    @classmethod
+    def validate_refresh_timing(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Token refresh timing must not be negative")
+        return v
+
+    @model_validator(mode="after")
+    def validate_refresh_window(self) -> "SAPConnectionConfig":
+        lead = self.token_refresh_lead_time + self.token_refresh_jitter
+        if self.token_refresh_enabled and self.token_lifetime <= lead:
+            raise ValueError(
+                "Token lifetime must be greater than the refresh lead time "
+                "plus jitter"
+            )
+        return self
+
 
 class MCPServerConfig(BaseSettings):
     """MCP server configuration"""
@@ -45,12 +143,35 @@ class MCPServerConfig(BaseSettings):
     host: str = Field("0.0.0.0", description="Server bind address")
     port: int = Field(8000, description="Server port")
     log_level: str = Field("INFO", description="Logging level")
-    max_workers: int = Field(1, description="Maximum worker threads")
+    max_workers: int = Field(
+        1, description="Worker pool size for decoding large SAP responses"
+    )
+    decode_offload_threshold: int = Field(
+        262144,
+        description="Response size in characters from which JSON decoding runs "
+        "in the worker pool (0 = never)",
+    )
+    decode_executor: str = Field(
+        "thread", description="Worker pool type for decoding: thread or process"
+    )
+    json_backend: str = Field(
+        "auto", description="JSON library: auto, orjson, msgspec or json"
+    )
     debug: bool = Field(False, description="Enable debug mode")
     reload: bool = Field(False, description="Enable auto-reload")
     services_config_path: Optional[str] = Field(
         None, description="Path to services YAML configuration file"
     )
+    services_reload_interval: float = Field(
+        2.0,
+        description="Seconds between checks of the services file for changes "
+        "(0 disables hot reload)",
+    )
+    stats_log_interval: float = Field(
+        300.0,
+        description="Seconds between debug logs of connection pool statistics "
+        "(0 disables)",
+    )
 
     model_config = {"env_prefix": "MCP_"}
 
@@ -62,6 +183,52 @@ class MCPServerConfig(BaseSettings):
             raise ValueError(f"Log level must be one of: {valid_levels}")
         return v.upper()
 
+    @field_validator("max_workers")
+    @classmethod
+    def validate_max_workers(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("Max workers must be at least 1")
+        return v
+
+    @field_validator("decode_offload_threshold")
+    @classmethod
+    def validate_decode_offload_threshold(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Decode offload threshold must not be negative")
+        return v
+
+    @field_validator("decode_executor")
+    @classmethod
+    def validate_decode_executor(cls, v: str) -> str:
+        v = v.strip().lower()
+        if v not in ("process", "thread"):
+            raise ValueError("Decode executor must be 'process' or 'thread'")
+        return v
+
+    @field_validator("services_reload_interval")
+    @classmethod
+    def validate_services_reload_interval(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("Services reload interval must not be negative")
+        return v
+
+    @field_validator("stats_log_interval")
+    @classmethod
+    def validate_stats_log_interval(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("Statistics log interval must not be negative")
+        return v
+
+    @field_validator("json_backend")
+    @classmethod
+    def validate_json_backend(cls, v: str) -> str:
+        v = v.strip().lower()
+        if v not in ("auto", "orjson", "msgspec", "json"):
+            raise ValueError(
+                "JSON backend must be 'auto', 'orjson', 'msgspec' or 'json'"
+            )
+        return v
+
 
 class SecurityConfig(BaseSettings):
     """Security configuration"""
@@ -2,13 +2,15 @@
 
 import asyncio
 import logging
+import random
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
 
 import aiohttp
 
 from sap_mcp_server.config.settings import SAPConnectionConfig
+from sap_mcp_server.core.connection import build_connector, build_timeout
 from sap_mcp_server.core.exceptions import SAPAuthenticationError, SAPConnectionError
 
 if TYPE_CHECKING:
@@ -37,6 +39,115 @@ class AuthToken:
         return bool(self.csrf_token and not self.is_expired)
 
 
+TokenKey = Tuple[str, int, str, str]
+
+
+def token_key(config: SAPConnectionConfig) -> TokenKey:
+    """Build the token store key for an SAP connection"""
+    return (config.host, config.port, config.client, config.username)
+
+
+class TokenStore:
+    """Process-wide store of SAP authentication tokens
+
+    Tokens are shared by every authenticator with the same host, port, client
+    and user, and reused until they expire. Concurrent callers that find no
+    valid token wait on a single in-flight login instead of each starting
+    their own.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: Dict[TokenKey, AuthToken] = {}
+        self._inflight: Dict[TokenKey, "asyncio.Future[AuthToken]"] = {}
+
+    def get(self, key: TokenKey) -> Optional[AuthToken]:
+        """Get the stored token for a key if it is still valid"""
+        token = self._tokens.get(key)
+        if token and token.is_valid:
+            return token
+        return None
+
+    def put(self, key: TokenKey, token: AuthToken) -> None:
+        """Store a token for a key, replacing any previous token"""
+        self._tokens[key] = token
+
+    async def get_or_authenticate(
+        self, key: TokenKey, authenticate: Callable[[], Awaitable[AuthToken]]
+    ) -> AuthToken:
+        """Get a valid token for a key, logging in at most once concurrently
+
+        Args:
+            key: Token store key
+            authenticate: Coroutine factory performing the actual login
+
+        Returns:
+            Valid authentication token
+        """
+        token = self.get(key)
+        if token:
+            return token
+
+        return await self._join_login(key, authenticate)
+
+    async def refresh(
+        self, key: TokenKey, authenticate: Callable[[], Awaitable[AuthToken]]
+    ) -> AuthToken:
+        """Log in again even if the stored token is still valid
+
+        The stored token stays usable until the new one replaces it, so
+        callers are never blocked by a refresh.
+        """
+        return await self._join_login(key, authenticate)
+
+    async def _join_login(
+        self, key: TokenKey, authenticate: Callable[[], Awaitable[AuthToken]]
+    ) -> AuthToken:
+        """Wait on the in-flight login for a key, starting one if needed"""
+        login = self._inflight.get(key)
+        if login is None:
+            login = asyncio.ensure_future(self._login(key, authenticate))
+            self._inflight[key] = login
+
+        # Shield the shared login so one cancelled caller does not abort it
+        return await asyncio.shield(login)
+
+    async def _login(
+        self, key: TokenKey, authenticate: Callable[[], Awaitable[AuthToken]]
+    ) -> AuthToken:
+        """Run a login and store its token"""
+        try:
+            token = await authenticate()
+            self._tokens[key] = token
+            return token
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, key: TokenKey, token: Optional[AuthToken] = None) -> bool:
+        """Drop the stored token for a key
+
+        Args:
+            key: Token store key
+            token: If given, only drop the stored token if it is this one, so a
+                   stale rejection does not discard a newer token
+
+        Returns:
+            True if a token was dropped
+        """
+        current = self._tokens.get(key)
+        if current is None or (token is not None and current is not token):
+            return False
+        del self._tokens[key]
+        return True
+
+    def clear(self) -> None:
+        """Drop all stored tokens"""
+        self._tokens.clear()
+
+
+# Global token store instance
+token_store = TokenStore()
+
+
 class SAPAuthenticator:
     """Handles SAP Gateway authentication with CSRF tokens"""
 
@@ -45,57 +156,96 @@ class SAPAuthenticator:
         config: SAPConnectionConfig,
         auth_endpoint: Optional["AuthEndpointConfig"] = None,
         services_config: Optional["ServicesYAMLConfig"] = None,
+        store: Optional[TokenStore] = None,
+        session_provider: Optional[
+            Callable[[], Awaitable[aiohttp.ClientSession]]
+        ] = None,
     ):
         self.config = config
         self.auth_endpoint = auth_endpoint
         self.services_config = services_config
-        self._current_token: Optional[AuthToken] = None
-        self._auth_lock = asyncio.Lock()
+        self.token_store = store if store is not None else token_store
+        # Supplies the pooled session used for data requests, so login shares
+        # its connections and cookie jar instead of opening a throwaway session
+        self.session_provider = session_provider
+        self._token_key = token_key(config)
 
         # Build base URL (always use https, SSL verification is controlled separately)
         self.base_url = f"https://{self.config.host}:{self.config.port}"
 
     async def get_valid_token(self) -> AuthToken:
         """Get a valid authentication token, refreshing if necessary"""
-        async with self._auth_lock:
-            if self._current_token and self._current_token.is_valid:
-                return self._current_token
+        return await self.token_store.get_or_authenticate(self._token_key, self._login)
 
-            logger.info("Authenticating with SAP Gateway...")
-            self._current_token = await self._authenticate()
-            return self._current_token
+    async def refresh_token(self) -> AuthToken:
+        """Log in again ahead of expiry, keeping the current token usable"""
+        return await self.token_store.refresh(self._token_key, self._login)
 
-    async def _authenticate(self) -> AuthToken:
-        """Perform SAP authentication and get CSRF token"""
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+    def peek_token(self) -> Optional[AuthToken]:
+        """Get the stored token without logging in"""
+        return self.token_store.get(self._token_key)
 
-        # Create SSL context when verification is disabled (for self-signed certs)
-        ssl_context = None
-        if not self.config.verify_ssl:
-            import ssl
+    async def _login(self) -> AuthToken:
+        """Log in to SAP Gateway and return a fresh token"""
+        logger.info("Authenticating with SAP Gateway...")
+        return await self._authenticate()
 
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            logger.warning("SSL certificate verification is disabled")
+    async def _authenticate(self) -> AuthToken:
+        """Perform SAP authentication and get CSRF token"""
+        if self.session_provider is not None:
+            session = await self.session_provider()
+            return await self._authenticate_with(session)
 
         async with aiohttp.ClientSession(
-            timeout=timeout,
-            connector=aiohttp.TCPConnector(ssl=ssl_context if ssl_context else True),
+            timeout=build_timeout(self.config),
+            connector=build_connector(self.config),
+            cookie_jar=aiohttp.CookieJar(unsafe=True),
         ) as session:
-
-            # Step 1: Get initial session and CSRF token
-            csrf_token, cookies = await self._get_csrf_token(session)
-
-            # Step 2: Authenticate with credentials
-            await self._authenticate_session(session, csrf_token, cookies)
-
-            # Create token with expiration (SAP sessions typically last 30 minutes)
-            expires_at = datetime.utcnow() + timedelta(minutes=30)
-
-            return AuthToken(
-                csrf_token=csrf_token, cookies=cookies, expires_at=expires_at
-            )
+            return await self._authenticate_with(session)
+
+    async def _authenticate_with(self, session: aiohttp.ClientSession) -> AuthToken:
+        """Run the login handshake on the given session"""
+        # Step 1: Get initial session and CSRF token
+        csrf_token, cookies = await self._get_csrf_token(session)
+
+        # Step 2: Authenticate with credentials (session cookies from step 1
+        # are already in the session's cookie jar). Lazy mode skips it: the
+        # CSRF fetch already carried the credentials.
+        if self.config.auth_mode != "lazy":
+            await self._authenticate_session(session, csrf_token)
+
+        return self._build_token(csrf_token, cookies)
+
+    def _build_token(self, csrf_token: str, cookies: Dict[str, str]) -> AuthToken:
+        """Create a token with the configured lifetime"""
+        # SAP sessions typically last 30 minutes
+        expires_at = datetime.utcnow() + timedelta(seconds=self.config.token_lifetime)
+        return AuthToken(csrf_token=csrf_token, cookies=cookies, expires_at=expires_at)
+
+    def store_fetched_token(
+        self, response: aiohttp.ClientResponse
+    ) -> Optional[AuthToken]:
+        """Store a CSRF token piggybacked on a data response (lazy mode)
+
+        Args:
+            response: Response to a request sent with ``X-CSRF-Token: Fetch``
+
+        Returns:
+            The stored token, or None if the response carried no token
+        """
+        csrf_token = response.headers.get("X-CSRF-Token")
+        if not csrf_token or csrf_token.lower() == "required":
+            return None
+
+        existing = self.peek_token()
+        if existing is not None:
+            return existing
+
+        cookies = {name: morsel.value for name, morsel in response.cookies.items()}
+        token = self._build_token(csrf_token, cookies)
+        self.token_store.put(self._token_key, token)
+        logger.info("CSRF token obtained from data response")
+        return token
 
     def _get_csrf_endpoint_path(self) -> str:
         """Get CSRF token endpoint path from configuration"""
@@ -121,7 +271,9 @@ class SAPAuthenticator:
         csrf_path = self._get_csrf_endpoint_path()
         url = f"{self.base_url}{csrf_path}?sap-client={self.config.client}"
 
-        logger.info(f"Getting CSRF token from: {csrf_path}?sap-client={self.config.client}")
+        logger.info(
+            f"Getting CSRF token from: {csrf_path}?sap-client={self.config.client}"
+        )
 
         headers = {
             "X-CSRF-Token": "Fetch",
@@ -159,7 +311,7 @@ class SAPAuthenticator:
             )
 
     async def _authenticate_session(
-        self, session: aiohttp.ClientSession, csrf_token: str, cookies: Dict[str, str]
+        self, session: aiohttp.ClientSession, csrf_token: str
     ) -> None:
         """Authenticate the session with user credentials"""
 
@@ -167,7 +319,10 @@ class SAPAuthenticator:
         auth_path = self._get_auth_validation_path()
         url = f"{self.base_url}{auth_path}?sap-client={self.config.client}"
 
-        logger.info(f"Validating authentication with: {auth_path}?sap-client={self.config.client}")
+        logger.info(
+            f"Validating authentication with: "
+            f"{auth_path}?sap-client={self.config.client}"
+        )
 
         headers = {
             "X-CSRF-Token": csrf_token,
@@ -175,10 +330,6 @@ class SAPAuthenticator:
             "Authorization": self._build_auth_header(),
         }
 
-        # Set cookies from CSRF call
-        for name, value in cookies.items():
-            session.cookie_jar.update_cookies({name: value})
-
         try:
             async with session.get(url, headers=headers) as response:
                 if response.status == 200:
@@ -190,7 +341,8 @@ class SAPAuthenticator:
                 elif response.status == 401:
                     error_text = await response.text()
                     raise SAPAuthenticationError(
-                        f"Invalid credentials for user {self.config.username}: {error_text}",
+                        f"Invalid credentials for user {self.config.username}: "
+                        f"{error_text}",
                         status_code=401,
                     )
 
@@ -216,12 +368,23 @@ class SAPAuthenticator:
         encoded = base64.b64encode(credentials.encode()).decode()
         return f"Basic {encoded}"
 
-    async def invalidate_token(self) -> None:
-        """Invalidate the current token"""
-        async with self._auth_lock:
-            self._current_token = None
+    async def invalidate_token(self, token: Optional[AuthToken] = None) -> None:
+        """Invalidate the current token
+
+        Args:
+            token: The token that was rejected. If given, a newer token already
+                   obtained by another caller is kept.
+        """
+        if self.token_store.invalidate(self._token_key, token):
             logger.info("Authentication token invalidated")
 
+    def get_basic_auth_headers(self) -> Dict[str, str]:
+        """Get headers for reads authenticated by credentials alone"""
+        return {
+            "Authorization": self._build_auth_header(),
+            "Accept": "application/json",
+        }
+
     def get_auth_headers(self, token: AuthToken) -> Dict[str, str]:
         """Get headers for authenticated requests"""
         return {
@@ -230,3 +393,112 @@ class SAPAuthenticator:
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
+
+
+class TokenRefresher:
+    """Background task renewing an authenticator's token ahead of expiry
+
+    The refresh runs a configurable lead time (plus random jitter) before the
+    stored token expires, so no user request has to wait for a login on the
+    expiry boundary. Failures are logged and retried with backoff; callers
+    keep using the current token meanwhile.
+    """
+
+    def __init__(
+        self,
+        authenticator: SAPAuthenticator,
+        lead_time: float = 120.0,
+        jitter: float = 30.0,
+        retry_interval: float = 15.0,
+    ):
+        self.authenticator = authenticator
+        self.lead_time = lead_time
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.refresh_count = 0
+        self.failure_count = 0
+        self.last_error: Optional[str] = None
+        self._consecutive_failures = 0
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def running(self) -> bool:
+        """Check if the refresh task is running"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background refresh task"""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Started background token refresh "
+            f"(lead time {self.lead_time}s, jitter {self.jitter}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background refresh task"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def next_refresh_delay(self) -> Optional[float]:
+        """Seconds to wait before the next refresh attempt
+
+        After a refresh the delay is at least ``retry_interval``, so a token
+        that is already inside the lead time when issued (lifetime not longer
+        than lead time plus jitter) cannot cause back-to-back logins.
+
+        Returns:
+            Delay in seconds, or None if there is no token to renew yet
+        """
+        if self._consecutive_failures:
+            backoff: float = self.retry_interval * 2 ** (self._consecutive_failures - 1)
+            return min(backoff, max(self.lead_time, self.retry_interval))
+
+        token = self.authenticator.peek_token()
+        if token is None:
+            return None
+
+        remaining = (token.expires_at - datetime.utcnow()).total_seconds()
+        lead = self.lead_time + random.uniform(0, self.jitter)
+        minimum = self.retry_interval if self.refresh_count else 0.0
+        return max(remaining - lead, minimum)
+
+    async def _run(self) -> None:
+        """Refresh loop"""
+        while True:
+            delay = self.next_refresh_delay()
+            if delay is None:
+                # Nothing to renew until the first login stores a token
+                await asyncio.sleep(self.retry_interval)
+                continue
+
+            await asyncio.sleep(delay)
+            try:
+                await self.authenticator.refresh_token()
+                self.refresh_count += 1
+                self._consecutive_failures = 0
+                self.last_error = None
+                logger.info("Authentication token refreshed in background")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failure_count += 1
+                self._consecutive_failures += 1
+                self.last_error = str(e)
+                logger.warning(f"Background token refresh failed: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get refresh status for monitoring"""
+        return {
+            "running": self.running,
+            "refresh_count": self.refresh_count,
+            "failure_count": self.failure_count,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,362 @@
+"""OData $batch request builder and response parser"""
+
+import re
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+from sap_mcp_server.core.exceptions import SAPValidationError
+from sap_mcp_server.utils.serialization import dumps, loads
+
+CRLF = "\r\n"
+
+_BOUNDARY_PATTERN = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+_BLANK_LINE_PATTERN = re.compile(r"\r?\n\r?\n")
+_STATUS_LINE_PATTERN = re.compile(r"^HTTP/\d\.\d\s+(\d{3})(?:\s+(.*))?$")
+
+
+@dataclass
+class BatchResponse:
+    """Response to one operation inside a $batch"""
+
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: str = ""
+    reason: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Check if the operation succeeded"""
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        """Decode the response body as JSON (None for empty bodies)"""
+        return loads(self.body) if self.body.strip() else None
+
+
+def batch_error(response: BatchResponse) -> str:
+    """Describe a failed operation, using the SAP error message when present"""
+    message = response.body.strip()
+    try:
+        error = loads(message)["error"]["message"]
+        message = error["value"] if isinstance(error, dict) else str(error)
+    except (ValueError, KeyError, TypeError):
+        pass
+    status = f"{response.status} {response.reason}".strip()
+    return f"SAP request failed: {status} - {message}" if message else status
+
+
+@dataclass
+class BatchOperation:
+    """One request inside a $batch, resolved to its response after execution"""
+
+    method: str
+    path: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[str] = None
+    content_id: Optional[str] = None
+    response: Optional[BatchResponse] = None
+
+    def render(self) -> str:
+        """Render the operation as an embedded HTTP request"""
+        lines = [
+            "Content-Type: application/http",
+            "Content-Transfer-Encoding: binary",
+        ]
+        if self.content_id:
+            lines.append(f"Content-ID: {self.content_id}")
+        lines.append("")
+        lines.append(f"{self.method} {self.path} HTTP/1.1")
+
+        headers = dict(self.headers)
+        if self.body is not None:
+            headers.setdefault("Content-Type", "application/json")
+            headers["Content-Length"] = str(len(self.body.encode("utf-8")))
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        lines.append("")
+        lines.append(self.body or "")
+        return CRLF.join(lines)
+
+
+class BatchRequest:
+    """Builder for OData v2 multipart/mixed $batch requests
+
+    Retrieval operations are sent as top-level parts; modifying operations
+    are grouped into changesets, which SAP executes atomically. Each builder
+    method returns the BatchOperation whose ``response`` is filled in once
+    the batch has been executed.
+
+    Example:
+        >>> batch = BatchRequest()
+        >>> order = batch.get("OrderSet('1')")
+        >>> with batch.changeset() as changeset:
+        ...     changeset.update("OrderSet('2')", {"Status": "B"})
+        >>> content_type, body = batch.build()
+    """
+
+    def __init__(self, boundary: Optional[str] = None):
+        self.boundary = boundary or f"batch_{uuid.uuid4().hex}"
+        self._parts: List[Union[BatchOperation, "ChangeSet"]] = []
+
+    def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> BatchOperation:
+        """Add a retrieval operation
+
+        Args:
+            path: Resource path relative to the service root (e.g. "OrderSet('1')")
+            params: Query options
+            headers: Extra request headers
+
+        Returns:
+            The operation, resolved after execution
+        """
+        if params:
+            query = urlencode(params, safe="$',()")
+            path = f"{path}?{query}"
+        operation = BatchOperation(
+            method="GET",
+            path=path,
+            headers={"Accept": "application/json", **(headers or {})},
+        )
+        self._parts.append(operation)
+        return operation
+
+    def changeset(self) -> "ChangeSet":
+        """Add a changeset grouping modifying operations"""
+        changeset = ChangeSet()
+        self._parts.append(changeset)
+        return changeset
+
+    @property
+    def operations(self) -> List[BatchOperation]:
+        """All operations in request order"""
+        operations: List[BatchOperation] = []
+        for part in self._parts:
+            if isinstance(part, ChangeSet):
+                operations.extend(part.operations)
+            else:
+                operations.append(part)
+        return operations
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def build(self) -> Tuple[str, str]:
+        """Build the multipart request
+
+        Returns:
+            Tuple of (Content-Type header value, request body)
+        """
+        if not self._parts:
+            raise SAPValidationError("Cannot build an empty $batch request")
+
+        chunks = []
+        for part in self._parts:
+            chunks.append(f"--{self.boundary}")
+            chunks.append(part.render())
+        chunks.append(f"--{self.boundary}--")
+        chunks.append("")
+
+        content_type = f"multipart/mixed; boundary={self.boundary}"
+        return content_type, CRLF.join(chunks)
+
+    def resolve(self, content_type: Optional[str], body: str) -> List[BatchOperation]:
+        """Attach the responses from a $batch response to their operations
+
+        A failed changeset is answered by a single error response, which is
+        attached to every operation in that changeset.
+
+        Args:
+            content_type: Content-Type of the $batch response
+            body: Body of the $batch response
+
+        Returns:
+            All operations in request order, with ``response`` set
+        """
+        parsed = parse_batch_response(content_type, body)
+        if len(parsed) != len(self._parts):
+            raise SAPValidationError(
+                f"$batch response has {len(parsed)} parts, expected {len(self._parts)}"
+            )
+
+        for part, result in zip(self._parts, parsed):
+            if isinstance(part, ChangeSet):
+                if isinstance(result, list):
+                    if len(result) != len(part.operations):
+                        raise SAPValidationError(
+                            f"Changeset response has {len(result)} parts, "
+                            f"expected {len(part.operations)}"
+                        )
+                    for operation, response in zip(part.operations, result):
+                        operation.response = response
+                else:
+                    for operation in part.operations:
+                        operation.response = result
+            else:
+                if isinstance(result, list):
+                    raise SAPValidationError(
+                        "Unexpected changeset in $batch response for a retrieval"
+                    )
+                part.response = result
+
+        return self.operations
+
+
+class ChangeSet:
+    """Group of modifying operations executed atomically inside a $batch"""
+
+    def __init__(self, boundary: Optional[str] = None):
+        self.boundary = boundary or f"changeset_{uuid.uuid4().hex}"
+        self.operations: List[BatchOperation] = []
+
+    def __enter__(self) -> "ChangeSet":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def _add(
+        self, method: str, path: str, data: Optional[Dict[str, Any]]
+    ) -> BatchOperation:
+        operation = BatchOperation(
+            method=method,
+            path=path,
+            headers={"Accept": "application/json"},
+            body=dumps(data) if data is not None else None,
+            content_id=str(len(self.operations) + 1),
+        )
+        self.operations.append(operation)
+        return operation
+
+    def create(self, path: str, data: Dict[str, Any]) -> BatchOperation:
+        """Add a create (POST) operation"""
+        return self._add("POST", path, data)
+
+    def update(
+        self, path: str, data: Dict[str, Any], method: str = "PUT"
+    ) -> BatchOperation:
+        """Add an update (PUT, or MERGE/PATCH for partial updates) operation"""
+        return self._add(method.upper(), path, data)
+
+    def delete(self, path: str) -> BatchOperation:
+        """Add a delete operation"""
+        return self._add("DELETE", path, None)
+
+    def render(self) -> str:
+        """Render the changeset as a nested multipart part"""
+        if not self.operations:
+            raise SAPValidationError("Cannot build an empty changeset")
+
+        chunks = [f"Content-Type: multipart/mixed; boundary={self.boundary}", ""]
+        for operation in self.operations:
+            chunks.append(f"--{self.boundary}")
+            chunks.append(operation.render())
+        chunks.append(f"--{self.boundary}--")
+        return CRLF.join(chunks)
+
+
+def _split_headers(block: str) -> Tuple[Dict[str, str], str]:
+    """Split a MIME entity into its headers and content"""
+    match = _BLANK_LINE_PATTERN.search(block)
+    if match is None:
+        head, content = block, ""
+    else:
+        head, content = block[: match.start()], block[match.end() :]
+
+    headers: Dict[str, str] = {}
+    for line in re.split(r"\r?\n", head):
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers, content
+
+
+def _split_parts(body: str, boundary: str) -> List[str]:
+    """Split a multipart body into its parts"""
+    delimiter = re.compile(rf"(?:^|\r?\n)--{re.escape(boundary)}(--)?[ \t]*(?=\r?\n|$)")
+    parts: List[str] = []
+    position = None
+    for match in delimiter.finditer(body):
+        if position is not None:
+            parts.append(body[position : match.start()])
+        if match.group(1):
+            break
+        position = match.end()
+    return parts
+
+
+def _get_boundary(content_type: Optional[str], body: str) -> str:
+    """Get the multipart boundary from the Content-Type, or the body itself"""
+    if content_type:
+        match = _BOUNDARY_PATTERN.search(content_type)
+        if match:
+            return match.group(1)
+
+    for line in body.lstrip().splitlines():
+        if line.startswith("--"):
+            return line[2:].strip()
+        break
+    raise SAPValidationError("Cannot determine $batch response boundary")
+
+
+def _parse_http_response(content: str) -> BatchResponse:
+    """Parse an embedded HTTP response"""
+    content = content.lstrip("\r\n")
+    status_line, _, rest = content.partition("\n")
+    match = _STATUS_LINE_PATTERN.match(status_line.strip())
+    if not match:
+        raise SAPValidationError(
+            f"Invalid status line in $batch response: {status_line!r}"
+        )
+
+    headers: Dict[str, str]
+    if rest.startswith("\r\n") or rest.startswith("\n"):
+        # No headers: the body follows the status line after a blank line
+        headers, body = {}, rest.lstrip("\r\n")
+    else:
+        headers, body = _split_headers(rest)
+
+    return BatchResponse(
+        status=int(match.group(1)),
+        headers=headers,
+        body=body.rstrip("\r\n"),
+        reason=(match.group(2) or "").strip(),
+    )
+
+
+def parse_batch_response(
+    content_type: Optional[str], body: str
+) -> List[Union[BatchResponse, List[BatchResponse]]]:
+    """Parse a multipart/mixed $batch response
+
+    Args:
+        content_type: Content-Type of the response (for the boundary)
+        body: Response body
+
+    Returns:
+        One entry per top-level part: a BatchResponse for retrievals and
+        failed changesets, or a list of BatchResponses for a changeset
+    """
+    boundary = _get_boundary(content_type, body)
+    results: List[Union[BatchResponse, List[BatchResponse]]] = []
+
+    for part in _split_parts(body, boundary):
+        headers, content = _split_headers(part.lstrip("\r\n"))
+        part_type = headers.get("content-type", "")
+        if part_type.lower().startswith("multipart/mixed"):
+            changeset_boundary = _get_boundary(part_type, content)
+            results.append(
+                [
+                    _parse_http_response(_split_headers(inner.lstrip("\r\n"))[1])
+                    for inner in _split_parts(content, changeset_boundary)
+                ]
+            )
+        else:
+            results.append(_parse_http_response(content))
+
+    return results
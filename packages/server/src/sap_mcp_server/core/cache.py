@@ -0,0 +1,215 @@
+"""TTL + LRU cache for read-only SAP responses"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cache key: (normalized URL, sorted query parameters, SAP client)
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], str]
+
+
+class CacheEntry(NamedTuple):
+    """Cached value with its expiry time, invalidation tag and entity tag"""
+
+    value: Any
+    expires_at: float
+    tag: Optional[Hashable]
+    etag: Optional[str] = None
+
+
+def make_cache_key(
+    url: str, params: Optional[Mapping[str, str]], sap_client: str
+) -> CacheKey:
+    """Build a cache key that is independent of parameter order
+
+    Args:
+        url: Request URL
+        params: Query parameters
+        sap_client: SAP client number
+
+    Returns:
+        Hashable cache key
+    """
+    scheme, sep, rest = url.partition("://")
+    if sep:
+        host, slash, path = rest.partition("/")
+        url = f"{scheme.lower()}://{host.lower()}{slash}{path}"
+    items = tuple(
+        sorted((k, str(v)) for k, v in (params or {}).items() if k != "sap-client")
+    )
+    return (url.rstrip("/"), items, sap_client)
+
+
+class ResponseCache:
+    """Size-bounded LRU cache whose entries expire after a per-entry TTL
+
+    Entries carry an optional tag (e.g. the service path and entity set they
+    were read from) so that a write can drop every cached read it affects.
+    Each invalidation also bumps the tag's generation, so a read that was
+    sent before the write does not store its now stale response afterwards.
+    Expired entries that have an HTTP ETag are kept until evicted so they can
+    be revalidated with a conditional request instead of re-read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of entries before LRU eviction
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._tags: Dict[Hashable, Set[Hashable]] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.revalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= self._clock():
+            if entry.etag is None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def get_stale(self, key: Hashable) -> Optional[CacheEntry]:
+        """Get an expired entry that can be revalidated by its ETag"""
+        entry = self._entries.get(key)
+        if entry is None or entry.etag is None:
+            return None
+        return entry
+
+    def revalidated(
+        self, key: Hashable, ttl: float, etag: Optional[str] = None
+    ) -> Optional[Any]:
+        """Mark an entry as confirmed unchanged by the server for another TTL
+
+        Args:
+            key: Cache key
+            ttl: Seconds the entry stays fresh
+            etag: ETag the server confirmed; the entry must still carry it
+
+        Returns:
+            The cached value, or None if the entry is gone or was replaced
+        """
+        entry = self._entries.get(key)
+        if entry is None or (etag is not None and entry.etag != etag):
+            return None
+        self._entries[key] = entry._replace(expires_at=self._clock() + ttl)
+        self._entries.move_to_end(key)
+        self.revalidations += 1
+        return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float,
+        tag: Optional[Hashable] = None,
+        etag: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a value for ``ttl`` seconds (ignored if ttl <= 0)
+
+        Args:
+            generation: Generation of ``tag`` when the value was requested;
+                the value is not stored if the tag was invalidated since
+        """
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        if generation is not None and generation != self.generation(tag):
+            logger.debug(f"Not caching a response read before a write to {tag}")
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(value, self._clock() + ttl, tag, etag)
+        if tag is not None:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def generation(self, tag: Optional[Hashable]) -> int:
+        """Get the number of times a tag has been invalidated"""
+        return self._generations.get(tag, 0)
+
+    def invalidate(self, tag: Hashable) -> int:
+        """Drop every entry stored under a tag
+
+        Returns:
+            Number of entries removed
+        """
+        self._generations[tag] = self.generation(tag) + 1
+        keys = self._tags.pop(tag, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        if keys:
+            self.invalidations += len(keys)
+            logger.debug(f"Invalidated {len(keys)} cached response(s) for {tag}")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+        self._tags.clear()
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.tag is not None:
+            keys = self._tags.get(entry.tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[entry.tag]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "revalidations": self.revalidations,
+        }
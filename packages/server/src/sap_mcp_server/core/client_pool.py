@@ -0,0 +1,111 @@
+"""Process-wide registry of long-lived SAP clients"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Tuple
+
+from sap_mcp_server.config.settings import SAPConnectionConfig
+from sap_mcp_server.core.sap_client import SAPClient
+
+logger = logging.getLogger(__name__)
+
+ConnectionKey = Tuple[str, int, str, str]
+
+
+def connection_key(config: SAPConnectionConfig) -> ConnectionKey:
+    """Build the registry key identifying one SAP connection"""
+    return (config.host, config.port, config.client, config.username)
+
+
+class SAPClientPool:
+    """Registry of shared SAPClient instances keyed by SAP connection
+
+    Tools borrow clients from the pool instead of building a new client (and
+    with it a new HTTP session, TLS handshake and login) on every call. The
+    clients stay open until the pool is closed on server shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[ConnectionKey, SAPClient] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_client(self, config: SAPConnectionConfig) -> SAPClient:
+        """Get the shared client for a connection, creating it on first use"""
+        key = connection_key(config)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = SAPClient(config)
+                await client._ensure_session()
+                if config.token_refresh_enabled:
+                    client.start_token_refresh()
+                self._clients[key] = client
+                logger.info(
+                    f"Created pooled SAP client for {config.host}:{config.port} "
+                    f"(client {config.client}, user {config.username})"
+                )
+        return client
+
+    async def warm_up(
+        self, config: SAPConnectionConfig, authenticate: bool = True
+    ) -> SAPClient:
+        """Create the client for a connection ahead of the first tool call
+
+        Args:
+            config: SAP connection configuration
+            authenticate: If True, also log in so the first call finds a token
+
+        Returns:
+            The pooled client
+        """
+        client = await self.get_client(config)
+        if authenticate:
+            await client.authenticate()
+        return client
+
+    async def close(self) -> None:
+        """Close all pooled clients"""
+        async with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Error while closing pooled SAP client: {e}")
+
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled SAP client(s)")
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Get connection pool, token refresh and cache statistics per connection"""
+        stats = {}
+        for (host, port, client_no, username), client in self._clients.items():
+            stats[f"{username}@{host}:{port}/{client_no}"] = {
+                "pool": client.get_pool_stats(),
+                "token_refresh": client.get_token_refresh_status(),
+                "cache": client.get_cache_stats(),
+            }
+        return stats
+
+    def log_statistics(self) -> None:
+        """Log the statistics of every pooled client at debug level"""
+        for connection, stats in self.get_statistics().items():
+            logger.debug(f"SAP client {connection}: {stats}")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+# Global client pool instance
+client_pool = SAPClientPool()
+
+
+async def get_sap_client(config: SAPConnectionConfig) -> SAPClient:
+    """Get the shared SAP client for a connection from the global pool"""
+    return await client_pool.get_client(config)
@@ -0,0 +1,150 @@
+"""HTTP connection pool construction and instrumentation for SAP clients"""
+
+import logging
+import ssl
+import time
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from sap_mcp_server.config.settings import SAPConnectionConfig
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=2)
+def get_ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """Get the process-wide SSL context for SAP connections
+
+    Building an SSLContext loads the CA bundle, so it is created once per
+    verification mode and shared by all sessions.
+
+    Args:
+        verify_ssl: If False, certificate and hostname checks are disabled
+                    (for self-signed certificates)
+
+    Returns:
+        Cached SSL context
+    """
+    context = ssl.create_default_context()
+    if not verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        logger.warning("SSL certificate verification is disabled")
+    return context
+
+
+def build_timeout(config: SAPConnectionConfig) -> aiohttp.ClientTimeout:
+    """Build per-phase request timeouts from connection configuration"""
+    return aiohttp.ClientTimeout(
+        total=config.timeout,
+        connect=config.connect_timeout,
+        sock_read=config.read_timeout,
+    )
+
+
+def build_connector(config: SAPConnectionConfig) -> aiohttp.TCPConnector:
+    """Build a pooled TCP connector from connection configuration"""
+    return aiohttp.TCPConnector(
+        ssl=get_ssl_context(config.verify_ssl),
+        limit=config.pool_size,
+        limit_per_host=config.pool_size_per_host,
+        keepalive_timeout=config.keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=config.dns_cache_ttl,
+    )
+
+
+class ConnectionPoolMetrics:
+    """Connection pool gauges and acquire-wait timing for one HTTP session
+
+    Hooks into aiohttp request tracing to count requests in flight and new
+    and reused connections, and to time how long requests wait for a free
+    pooled connection.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.waiting = 0
+        self.wait_count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_request_end.append(self._on_request_done)
+        self.trace_config.on_request_exception.append(self._on_request_done)
+        self.trace_config.on_connection_queued_start.append(self._on_queued_start)
+        self.trace_config.on_connection_queued_end.append(self._on_queued_end)
+        self.trace_config.on_connection_create_end.append(self._on_create_end)
+        self.trace_config.on_connection_reuseconn.append(self._on_reuse)
+
+    async def _on_request_start(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.in_flight += 1
+
+    async def _on_request_done(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.in_flight = max(self.in_flight - 1, 0)
+
+    async def _on_queued_start(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        ctx.queued_at = time.perf_counter()
+        self.waiting += 1
+
+    async def _on_queued_end(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        wait = time.perf_counter() - getattr(ctx, "queued_at", time.perf_counter())
+        self.waiting = max(self.waiting - 1, 0)
+        self.wait_count += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    async def _on_create_end(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.connections_created += 1
+
+    async def _on_reuse(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.connections_reused += 1
+
+    def snapshot(
+        self, connector: Optional[aiohttp.BaseConnector] = None
+    ) -> Dict[str, Any]:
+        """Get current pool gauges
+
+        Args:
+            connector: Connector of the instrumented session, for its limits
+
+        Returns:
+            Dict of pool statistics
+        """
+        limit = limit_per_host = None
+        if connector is not None and not connector.closed:
+            limit = connector.limit
+            limit_per_host = connector.limit_per_host
+
+        acquisitions = self.connections_created + self.connections_reused
+        return {
+            "requests_in_flight": self.in_flight,
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "waiting": self.waiting,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "acquire_wait_count": self.wait_count,
+            "acquire_wait_total_ms": round(self.total_wait * 1000, 3),
+            "acquire_wait_max_ms": round(self.max_wait * 1000, 3),
+            "acquire_wait_avg_ms": (
+                round(self.total_wait * 1000 / acquisitions, 3) if acquisitions else 0.0
+            ),
+        }
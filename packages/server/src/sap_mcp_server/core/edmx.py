@@ -0,0 +1,349 @@
+"""Streaming EDMX ($metadata) parser producing a compact schema model"""
+
+import io
+import logging
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from xml.etree.ElementTree import Element, ParseError, iterparse
+
+from sap_mcp_server.core.exceptions import SAPValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class Property(NamedTuple):
+    """Structural property of an entity type"""
+
+    name: str
+    type: str
+    nullable: bool = True
+    max_length: Optional[int] = None
+
+
+class NavigationProperty(NamedTuple):
+    """Navigation property of an entity type"""
+
+    name: str
+    target_type: Optional[str]
+    many: bool
+
+
+class EntitySet(NamedTuple):
+    """Entity set exposed by the entity container"""
+
+    name: str
+    entity_type: str
+
+
+class EntityType:
+    """Entity type with its key and name-indexed properties"""
+
+    __slots__ = ("name", "namespace", "keys", "properties", "navigations", "_index")
+
+    def __init__(
+        self,
+        name: str,
+        namespace: str,
+        keys: Tuple[str, ...],
+        properties: Tuple[Property, ...],
+        navigations: Tuple[NavigationProperty, ...] = (),
+    ):
+        self.name = name
+        self.namespace = namespace
+        self.keys = keys
+        self.properties = properties
+        self.navigations = navigations
+        self._index: Dict[str, Union[Property, NavigationProperty]] = {
+            **{nav.name: nav for nav in navigations},
+            **{prop.name: prop for prop in properties},
+        }
+
+    @property
+    def qualified_name(self) -> str:
+        """Namespace-qualified type name"""
+        return f"{self.namespace}.{self.name}" if self.namespace else self.name
+
+    def get_property(self, name: str) -> Optional[Property]:
+        """Get a structural property by name"""
+        member = self._index.get(name)
+        return member if isinstance(member, Property) else None
+
+    def get_navigation(self, name: str) -> Optional[NavigationProperty]:
+        """Get a navigation property by name"""
+        member = self._index.get(name)
+        return member if isinstance(member, NavigationProperty) else None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __repr__(self) -> str:
+        return (
+            f"EntityType({self.qualified_name!r}, keys={self.keys!r}, "
+            f"properties={len(self.properties)})"
+        )
+
+
+class ServiceSchema:
+    """Compact model of a service's $metadata with indexed lookups"""
+
+    __slots__ = ("entity_types", "entity_sets")
+
+    def __init__(
+        self, entity_types: Iterable[EntityType], entity_sets: Iterable[EntitySet]
+    ):
+        types = list(entity_types)
+        self.entity_types: Dict[str, EntityType] = {
+            entity_type.qualified_name: entity_type for entity_type in types
+        }
+        # Unqualified names as well (the first namespace wins on a clash)
+        for entity_type in types:
+            self.entity_types.setdefault(entity_type.name, entity_type)
+        self.entity_sets: Dict[str, EntitySet] = {s.name: s for s in entity_sets}
+
+    def get_entity_type(self, name: str) -> Optional[EntityType]:
+        """Get an entity type by qualified or unqualified name"""
+        return self.entity_types.get(name)
+
+    def get_entity_set(self, name: str) -> Optional[EntitySet]:
+        """Get an entity set by name"""
+        return self.entity_sets.get(name)
+
+    def entity_type_for(self, entity_set: str) -> Optional[EntityType]:
+        """Get the entity type of an entity set"""
+        found = self.entity_sets.get(entity_set)
+        return self.entity_types.get(found.entity_type) if found else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict (see from_dict)"""
+        types = {t.qualified_name: t for t in self.entity_types.values()}
+        return {
+            "entity_types": [
+                {
+                    "name": t.name,
+                    "namespace": t.namespace,
+                    "keys": list(t.keys),
+                    "properties": [list(p) for p in t.properties],
+                    "navigations": [list(n) for n in t.navigations],
+                }
+                for t in types.values()
+            ],
+            "entity_sets": [list(s) for s in self.entity_sets.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ServiceSchema":
+        """Rebuild a schema converted with to_dict"""
+        return cls(
+            (
+                EntityType(
+                    name=t["name"],
+                    namespace=t["namespace"],
+                    keys=tuple(t["keys"]),
+                    properties=tuple(Property(*p) for p in t["properties"]),
+                    navigations=tuple(NavigationProperty(*n) for n in t["navigations"]),
+                )
+                for t in data["entity_types"]
+            ),
+            (EntitySet(*s) for s in data["entity_sets"]),
+        )
+
+
+def _local(tag: str) -> str:
+    """Strip the XML namespace from a tag"""
+    return tag.rpartition("}")[2]
+
+
+def _collection_target(type_name: Optional[str]) -> Tuple[Optional[str], bool]:
+    """Split an OData v4 navigation type into (element type, is collection)"""
+    if type_name and type_name.startswith("Collection(") and type_name.endswith(")"):
+        return type_name[len("Collection(") : -1], True
+    return type_name, False
+
+
+def _inherit_base_types(
+    entity_types: List[EntityType],
+    base_types: List[Optional[str]],
+    aliases: Dict[str, str],
+) -> List[EntityType]:
+    """Merge the keys, properties and navigations of base types into derived types"""
+    by_name = {t.qualified_name: t for t in entity_types}
+    bases: Dict[str, str] = {}
+    for entity_type, base in zip(entity_types, base_types):
+        if base:
+            alias, _, name = base.rpartition(".")
+            bases[entity_type.qualified_name] = f"{aliases.get(alias, alias)}.{name}"
+
+    def lineage(qualified_name: str) -> List[EntityType]:
+        """The type and its ancestors, root first (unknown bases end the chain)"""
+        chain: List[EntityType] = []
+        current: Optional[str] = qualified_name
+        while current in by_name and all(t.qualified_name != current for t in chain):
+            chain.append(by_name[current])
+            current = bases.get(current)
+        return chain[::-1]
+
+    resolved = []
+    for entity_type in entity_types:
+        chain = lineage(entity_type.qualified_name)
+        if len(chain) == 1:
+            resolved.append(entity_type)
+            continue
+        keys = next((t.keys for t in reversed(chain) if t.keys), ())
+        resolved.append(
+            EntityType(
+                entity_type.name,
+                entity_type.namespace,
+                keys,
+                tuple(p for t in chain for p in t.properties),
+                tuple(n for t in chain for n in t.navigations),
+            )
+        )
+    return resolved
+
+
+def parse_edmx(source: Union[str, bytes]) -> ServiceSchema:
+    """Parse an EDMX document incrementally into a ServiceSchema
+
+    Elements are discarded as soon as they have been processed, so memory
+    use stays proportional to the resulting model rather than the document.
+    Supports OData v2 (associations) and v4 (typed navigation properties,
+    derived entity types, which inherit the keys and properties of their
+    ``BaseType``).
+
+    Args:
+        source: EDMX document
+
+    Returns:
+        Compact schema model
+
+    Raises:
+        SAPValidationError: If the document is not well-formed XML
+    """
+    data = source.encode("utf-8") if isinstance(source, str) else source
+
+    # (name, namespace, keys, properties, navigations) per entity type
+    raw_types: List[
+        Tuple[str, str, Tuple[str, ...], Tuple[Property, ...], List[NavigationProperty]]
+    ] = []
+    entity_sets: List[EntitySet] = []
+    # v2 associations: qualified name -> role -> (type, multiplicity)
+    associations: Dict[str, Dict[str, Tuple[str, str]]] = {}
+    # v2 navigation properties awaiting association resolution
+    pending_navigations: List[Tuple[int, int, str, str]] = []
+    # Base type of each entity type in raw_types, and schema aliases
+    base_types: List[Optional[str]] = []
+    aliases: Dict[str, str] = {}
+
+    namespace = ""
+    current_type: Optional[str] = None
+    current_base: Optional[str] = None
+    current_association: Optional[str] = None
+    keys: List[str] = []
+    properties: List[Property] = []
+    navigations: List[NavigationProperty] = []
+    parents: List[Element] = []
+
+    try:
+        for event, element in iterparse(io.BytesIO(data), events=("start", "end")):
+            tag = _local(element.tag)
+            attrib = element.attrib
+
+            if event == "start":
+                parents.append(element)
+                if tag == "Schema":
+                    namespace = attrib.get("Namespace", "")
+                    if "Alias" in attrib:
+                        aliases[attrib["Alias"]] = namespace
+                elif tag == "EntityType":
+                    current_type = attrib.get("Name", "")
+                    current_base = attrib.get("BaseType")
+                    keys, properties, navigations = [], [], []
+                elif tag == "Association":
+                    current_association = f"{namespace}.{attrib.get('Name', '')}"
+                    associations[current_association] = {}
+                continue
+
+            parents.pop()
+            if current_type is not None:
+                if tag == "PropertyRef":
+                    keys.append(attrib["Name"])
+                elif tag == "Property":
+                    max_length = attrib.get("MaxLength", "")
+                    properties.append(
+                        Property(
+                            name=attrib["Name"],
+                            type=attrib.get("Type", "Edm.String"),
+                            nullable=attrib.get("Nullable", "true").lower() != "false",
+                            max_length=(
+                                int(max_length) if max_length.isdigit() else None
+                            ),
+                        )
+                    )
+                elif tag == "NavigationProperty":
+                    if "Relationship" in attrib:
+                        pending_navigations.append(
+                            (
+                                len(raw_types),
+                                len(navigations),
+                                attrib["Relationship"],
+                                attrib.get("ToRole", ""),
+                            )
+                        )
+                        navigations.append(
+                            NavigationProperty(attrib["Name"], None, False)
+                        )
+                    else:
+                        target, many = _collection_target(attrib.get("Type"))
+                        navigations.append(
+                            NavigationProperty(attrib["Name"], target, many)
+                        )
+                elif tag == "EntityType":
+                    raw_types.append(
+                        (
+                            current_type,
+                            namespace,
+                            tuple(keys),
+                            tuple(properties),
+                            navigations,
+                        )
+                    )
+                    base_types.append(current_base)
+                    current_type = None
+            elif current_association is not None and tag == "End":
+                associations[current_association][attrib.get("Role", "")] = (
+                    attrib.get("Type", ""),
+                    attrib.get("Multiplicity", ""),
+                )
+            elif tag == "Association":
+                current_association = None
+            elif tag == "EntitySet" and "EntityType" in attrib:
+                entity_sets.append(EntitySet(attrib["Name"], attrib["EntityType"]))
+
+            # Drop processed subtrees; the model keeps what is needed
+            if tag in ("EntityType", "Association", "EntitySet", "ComplexType"):
+                element.clear()
+                if parents:
+                    parents[-1].remove(element)
+    except ParseError as e:
+        raise SAPValidationError(f"Failed to parse metadata XML: {e}")
+
+    # Resolve v2 navigation targets through their associations
+    for type_index, nav_index, relationship, to_role in pending_navigations:
+        end = associations.get(relationship, {}).get(to_role)
+        if end is not None:
+            navs = raw_types[type_index][4]
+            navs[nav_index] = navs[nav_index]._replace(
+                target_type=end[0], many=end[1] == "*"
+            )
+
+    entity_types = [
+        EntityType(name, type_namespace, type_keys, type_properties, tuple(navs))
+        for name, type_namespace, type_keys, type_properties, navs in raw_types
+    ]
+    if any(base_types):
+        entity_types = _inherit_base_types(entity_types, base_types, aliases)
+
+    logger.debug(
+        f"Parsed EDMX with {len(entity_types)} entity type(s) "
+        f"and {len(entity_sets)} entity set(s)"
+    )
+    return ServiceSchema(entity_types, entity_sets)
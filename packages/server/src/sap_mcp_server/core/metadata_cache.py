@@ -0,0 +1,166 @@
+"""In-memory and on-disk cache of parsed OData service metadata"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional, cast
+
+from sap_mcp_server.utils.serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# Default location of the on-disk cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "sap-mcp-server" / "metadata"
+
+
+class MetadataEntry(NamedTuple):
+    """Parsed service metadata with the validator it was fetched with"""
+
+    metadata: Any
+    etag: Optional[str]
+    fetched_at: float
+
+
+class MetadataCache:
+    """Cache of parsed $metadata documents, keyed by system and service path
+
+    Entries younger than ``ttl`` seconds are served as is; older entries are
+    revalidated by the caller (with If-None-Match when an ETag is known).
+    With a cache directory, entries are also written to disk as JSON so a
+    restarted server can skip downloading and parsing the EDMX again.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 86400,
+        cache_dir: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the metadata cache
+
+        Args:
+            ttl: Seconds an entry is used without revalidation
+            cache_dir: Directory for persisted entries (None = memory only)
+            clock: Wall-clock time source (entries outlive the process)
+        """
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self._clock = clock
+        self._entries: Dict[str, MetadataEntry] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def lock(self, key: str) -> asyncio.Lock:
+        """Lock serializing fetches of one service's metadata"""
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    def is_fresh(self, entry: MetadataEntry) -> bool:
+        """Check if an entry can be used without revalidation"""
+        return self._clock() - entry.fetched_at < self.ttl
+
+    async def get(
+        self, key: str, decode: Optional[Callable[[Any], Any]] = None
+    ) -> Optional[MetadataEntry]:
+        """Get an entry from memory, falling back to disk
+
+        Args:
+            key: Cache key
+            decode: Rebuilds the parsed form from its stored JSON form
+        """
+        entry = self._entries.get(key)
+        if entry is None and self.cache_dir is not None:
+            entry = await asyncio.to_thread(self._load, key, decode)
+            if entry is not None:
+                self._entries[key] = entry
+                logger.info(f"Loaded cached metadata for {key} from disk")
+        return entry
+
+    async def put(
+        self,
+        key: str,
+        metadata: Any,
+        etag: Optional[str],
+        encode: Optional[Callable[[Any], Any]] = None,
+    ) -> MetadataEntry:
+        """Store freshly fetched metadata
+
+        Args:
+            key: Cache key
+            metadata: Parsed metadata
+            etag: ETag the metadata was served with
+            encode: Converts the parsed form to JSON-serializable data
+        """
+        entry = MetadataEntry(metadata, etag, self._clock())
+        self._entries[key] = entry
+        if self.cache_dir is not None:
+            await asyncio.to_thread(self._save, key, entry, encode)
+        return entry
+
+    async def touch(
+        self,
+        key: str,
+        entry: MetadataEntry,
+        encode: Optional[Callable[[Any], Any]] = None,
+    ) -> MetadataEntry:
+        """Mark an entry as revalidated (the server answered 304)"""
+        return await self.put(key, entry.metadata, entry.etag, encode)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (files on disk are kept)"""
+        self._entries.clear()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return cast(Path, self.cache_dir) / f"{digest}.json"
+
+    def _load(
+        self, key: str, decode: Optional[Callable[[Any], Any]]
+    ) -> Optional[MetadataEntry]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = loads(f.read())
+            if record.get("key") != key:
+                return None
+            return MetadataEntry(
+                metadata=(decode(record["metadata"]) if decode else record["metadata"]),
+                etag=record.get("etag"),
+                fetched_at=float(record["fetched_at"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable metadata cache file {path}: {e}")
+            return None
+
+    def _save(
+        self,
+        key: str,
+        entry: MetadataEntry,
+        encode: Optional[Callable[[Any], Any]],
+    ) -> None:
+        path = self._path(key)
+        record = {
+            "key": key,
+            "etag": entry.etag,
+            "fetched_at": entry.fetched_at,
+            "metadata": encode(entry.metadata) if encode else entry.metadata,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename so readers never see
+            # a partially written entry
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(dumps(record))
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write metadata cache file {path}: {e}")
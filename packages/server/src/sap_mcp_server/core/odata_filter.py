@@ -0,0 +1,515 @@
+"""OData $filter tokenizer, parser and canonical serialization"""
+
+import logging
+import re
+from functools import lru_cache, reduce
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import quote
+
+from sap_mcp_server.core.exceptions import SAPValidationError
+
+logger = logging.getLogger(__name__)
+
+# Binary operators by precedence (higher binds tighter), as in the OData spec
+BINARY_PRECEDENCE = {
+    "or": 1,
+    "and": 2,
+    "eq": 3,
+    "ne": 3,
+    "gt": 4,
+    "ge": 4,
+    "lt": 4,
+    "le": 4,
+    "add": 5,
+    "sub": 5,
+    "mul": 6,
+    "div": 6,
+    "mod": 6,
+}
+UNARY_PRECEDENCE = 7
+
+LOGICAL_OPERATORS = frozenset({"and", "or"})
+COMPARISON_OPERATORS = frozenset({"eq", "ne", "gt", "ge", "lt", "le"})
+
+# Comparison with its operands swapped: 5 lt X is X gt 5
+MIRRORED = {"eq": "eq", "ne": "ne", "gt": "lt", "ge": "le", "lt": "gt", "le": "ge"}
+
+# OData v2 filter functions, plus the common v4 ones
+FUNCTIONS = frozenset(
+    {
+        "substringof",
+        "startswith",
+        "endswith",
+        "contains",
+        "length",
+        "indexof",
+        "replace",
+        "substring",
+        "tolower",
+        "toupper",
+        "trim",
+        "concat",
+        "year",
+        "month",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "date",
+        "time",
+        "now",
+        "round",
+        "floor",
+        "ceiling",
+        "isof",
+        "cast",
+    }
+)
+
+# Prefixed literals such as datetime'2024-01-01T00:00:00'
+TYPED_LITERALS = {
+    "datetime": "Edm.DateTime",
+    "datetimeoffset": "Edm.DateTimeOffset",
+    "guid": "Edm.Guid",
+    "time": "Edm.Time",
+    "binary": "Edm.Binary",
+    "x": "Edm.Binary",
+}
+
+# Number suffixes and the Edm type they denote
+NUMBER_SUFFIXES = {
+    "L": "Edm.Int64",
+    "M": "Edm.Decimal",
+    "D": "Edm.Double",
+    "F": "Edm.Single",
+}
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<string>'(?:[^']|'')*')
+    | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?[LlMmDdFf]?(?![\w']))
+    | (?P<name>[A-Za-z_][A-Za-z0-9_]*(?:/[A-Za-z_][A-Za-z0-9_]*)*)
+    | (?P<punct>[(),-])
+    """,
+    re.VERBOSE,
+)
+
+
+class Token(NamedTuple):
+    """Lexical token with its position in the filter text"""
+
+    kind: str
+    text: str
+    pos: int
+
+
+class Literal(NamedTuple):
+    """Constant value; type is the Edm type, or None for null"""
+
+    type: Optional[str]
+    value: Any
+    text: str
+
+
+class PropertyRef(NamedTuple):
+    """Property or navigation path such as ``Customer/Name``"""
+
+    path: str
+
+
+class Call(NamedTuple):
+    """Function call such as ``startswith(Name,'A')``"""
+
+    name: str
+    args: Tuple["Node", ...]
+
+
+class UnaryOp(NamedTuple):
+    """``not`` or arithmetic negation"""
+
+    op: str
+    operand: "Node"
+
+
+class BinaryOp(NamedTuple):
+    """Logical, comparison or arithmetic operation"""
+
+    op: str
+    left: "Node"
+    right: "Node"
+
+
+Node = Union[Literal, PropertyRef, Call, UnaryOp, BinaryOp]
+
+
+def _syntax_error(message: str, pos: int) -> SAPValidationError:
+    return SAPValidationError(f"Invalid $filter at position {pos}: {message}")
+
+
+def tokenize(text: str) -> List[Token]:
+    """Split a filter expression into tokens
+
+    Raises:
+        SAPValidationError: On characters that cannot start a token
+    """
+    tokens: List[Token] = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN_PATTERN.match(text, pos)
+        if match is None:
+            raise _syntax_error(f"unexpected character '{text[pos]}'", pos)
+        kind = match.lastgroup or ""
+        if kind != "space":
+            tokens.append(Token(kind, match.group(), pos))
+        pos = match.end()
+    return tokens
+
+
+def _number_literal(text: str) -> Literal:
+    """Build a number literal; its text is kept as written"""
+    suffix = text[-1].upper() if text[-1].isalpha() and text[-1] not in "eE" else ""
+    digits = text[: len(text) - len(suffix)]
+    if suffix:
+        edm_type = NUMBER_SUFFIXES[suffix]
+    elif any(c in digits for c in ".eE"):
+        edm_type = "Edm.Double"
+    else:
+        edm_type = "Edm.Int32"
+
+    if edm_type in ("Edm.Int32", "Edm.Int64"):
+        return Literal(edm_type, int(digits), text)
+    return Literal(edm_type, float(digits), text)
+
+
+def _string_literal(quoted: str) -> str:
+    return quoted[1:-1].replace("''", "'")
+
+
+class _Parser:
+    """Recursive descent parser using precedence climbing"""
+
+    def __init__(self, text: str):
+        self.tokens = tokenize(text)
+        self.index = 0
+        self.length = len(text)
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def advance(self) -> Token:
+        token = self.peek()
+        if token is None:
+            raise _syntax_error("unexpected end of expression", self.length)
+        self.index += 1
+        return token
+
+    def expect(self, text: str) -> None:
+        token = self.advance()
+        if token.text != text:
+            raise _syntax_error(f"expected '{text}', found '{token.text}'", token.pos)
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise _syntax_error("empty expression", 0)
+        node = self.expression(1)
+        token = self.peek()
+        if token is not None:
+            raise _syntax_error(f"unexpected '{token.text}'", token.pos)
+        return node
+
+    def expression(self, min_precedence: int) -> Node:
+        left = self.unary()
+        while True:
+            token = self.peek()
+            if token is None or token.kind != "name":
+                return left
+            precedence = BINARY_PRECEDENCE.get(token.text)
+            if precedence is None:
+                raise _syntax_error(
+                    f"expected an operator, found '{token.text}'", token.pos
+                )
+            if precedence < min_precedence:
+                return left
+            self.advance()
+            right = self.expression(precedence + 1)
+            left = BinaryOp(token.text, left, right)
+
+    def unary(self) -> Node:
+        token = self.peek()
+        if token is not None and token.text in ("not", "-"):
+            self.advance()
+            return UnaryOp(token.text, self.unary())
+        return self.primary()
+
+    def primary(self) -> Node:
+        token = self.advance()
+        if token.text == "(":
+            node = self.expression(1)
+            self.expect(")")
+            return node
+        if token.kind == "string":
+            value = _string_literal(token.text)
+            return Literal("Edm.String", value, token.text)
+        if token.kind == "number":
+            return _number_literal(token.text)
+        if token.kind != "name":
+            raise _syntax_error(f"unexpected '{token.text}'", token.pos)
+
+        if token.text in ("true", "false"):
+            return Literal("Edm.Boolean", token.text == "true", token.text)
+        if token.text == "null":
+            return Literal(None, None, "null")
+        if token.text in BINARY_PRECEDENCE:
+            raise _syntax_error(f"missing operand before '{token.text}'", token.pos)
+
+        following = self.peek()
+        if following is not None and following.pos == token.pos + len(token.text):
+            prefix = token.text.lower()
+            if following.kind == "string" and prefix in TYPED_LITERALS:
+                self.advance()
+                value = _string_literal(following.text)
+                canonical_prefix = "binary" if prefix == "x" else prefix
+                return Literal(
+                    TYPED_LITERALS[prefix], value, f"{canonical_prefix}{following.text}"
+                )
+        if following is not None and following.text == "(":
+            return self.call(token)
+        return PropertyRef(token.text)
+
+    def call(self, name: Token) -> Call:
+        function = name.text.lower()
+        if function not in FUNCTIONS:
+            raise _syntax_error(f"unknown function '{name.text}'", name.pos)
+        self.expect("(")
+        args: List[Node] = []
+        token = self.peek()
+        if token is not None and token.text == ")":
+            self.advance()
+            return Call(function, ())
+        while True:
+            args.append(self.expression(1))
+            token = self.advance()
+            if token.text == ")":
+                return Call(function, tuple(args))
+            if token.text != ",":
+                raise _syntax_error(
+                    f"expected ',' or ')', found '{token.text}'", token.pos
+                )
+
+
+@lru_cache(maxsize=1024)
+def parse_filter(text: str) -> Node:
+    """Parse a $filter expression into an AST
+
+    Parses are memoized; the returned nodes are immutable.
+
+    Raises:
+        SAPValidationError: If the expression is malformed
+    """
+    return _Parser(text).parse()
+
+
+def _precedence(node: Node) -> int:
+    if isinstance(node, BinaryOp):
+        return BINARY_PRECEDENCE[node.op]
+    if isinstance(node, UnaryOp):
+        return UNARY_PRECEDENCE
+    return UNARY_PRECEDENCE + 1
+
+
+def to_filter_string(node: Node) -> str:
+    """Serialize an AST as a $filter expression with minimal parentheses"""
+    if isinstance(node, Literal):
+        return node.text
+    if isinstance(node, PropertyRef):
+        return node.path
+    if isinstance(node, Call):
+        return f"{node.name}({','.join(to_filter_string(a) for a in node.args)})"
+    if isinstance(node, UnaryOp):
+        operand = to_filter_string(node.operand)
+        if _precedence(node.operand) < UNARY_PRECEDENCE:
+            operand = f"({operand})"
+        if node.op == "not":
+            return f"not {operand}"
+        # Keep negated literals and negations apart ("--1" is not OData, and
+        # "-1" would parse back as a single literal)
+        if isinstance(node.operand, (Literal, UnaryOp)):
+            return f"- {operand}"
+        return f"-{operand}"
+
+    precedence = BINARY_PRECEDENCE[node.op]
+    left = to_filter_string(node.left)
+    if _precedence(node.left) < precedence:
+        left = f"({left})"
+    right = to_filter_string(node.right)
+    # Operators are left-associative
+    if _precedence(node.right) <= precedence:
+        right = f"({right})"
+    return f"{left} {node.op} {right}"
+
+
+def _flatten(node: Node, op: str) -> Iterator[Node]:
+    if isinstance(node, BinaryOp) and node.op == op:
+        yield from _flatten(node.left, op)
+        yield from _flatten(node.right, op)
+    else:
+        yield node
+
+
+def normalize(node: Node) -> Node:
+    """Rewrite an AST into the canonical form of equivalent filters
+
+    ``and``/``or`` chains are flattened, deduplicated and sorted, and
+    comparisons put a literal operand on the right.
+    """
+    if isinstance(node, Call):
+        return Call(node.name, tuple(normalize(arg) for arg in node.args))
+    if isinstance(node, UnaryOp):
+        return UnaryOp(node.op, normalize(node.operand))
+    if not isinstance(node, BinaryOp):
+        return node
+
+    if node.op in LOGICAL_OPERATORS:
+        operands = {
+            to_filter_string(operand): operand
+            for operand in (normalize(n) for n in _flatten(node, node.op))
+        }
+        ordered = [operands[key] for key in sorted(operands)]
+        result = ordered[0]
+        for operand in ordered[1:]:
+            result = BinaryOp(node.op, result, operand)
+        return result
+
+    left, right = normalize(node.left), normalize(node.right)
+    if (
+        node.op in COMPARISON_OPERATORS
+        and isinstance(left, Literal)
+        and not isinstance(right, Literal)
+    ):
+        return BinaryOp(MIRRORED[node.op], right, left)
+    return BinaryOp(node.op, left, right)
+
+
+@lru_cache(maxsize=1024)
+def canonical_filter(text: str) -> str:
+    """Get the canonical form of a $filter expression
+
+    Equivalent filters that differ in whitespace, redundant parentheses,
+    the order of ``and``/``or`` operands or the side of a compared literal
+    map to the same string, so they share a response cache entry. The
+    canonical form is a cache key; SAP is sent the filter as written.
+
+    The parser covers the OData v2 grammar; expressions it does not
+    understand (v4 lambda operators, ``in``/``has``, unquoted date and GUID
+    literals, ...) are returned unchanged and left to SAP to judge.
+    """
+    try:
+        return to_filter_string(normalize(parse_filter(text)))
+    except SAPValidationError as e:
+        logger.debug(f"Sending $filter as given: {e}")
+        return text
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Yield a node and all of its descendants, depth first"""
+    yield node
+    if isinstance(node, Call):
+        for arg in node.args:
+            yield from walk(arg)
+    elif isinstance(node, UnaryOp):
+        yield from walk(node.operand)
+    elif isinstance(node, BinaryOp):
+        yield from walk(node.left)
+        yield from walk(node.right)
+
+
+def _key_list(node: Node) -> Optional[List[BinaryOp]]:
+    """Get the terms of ``P eq v1 or P eq v2 ...`` on a single property"""
+    terms = list(_flatten(node, "or"))
+    if len(terms) < 2:
+        return None
+    paths = set()
+    for term in terms:
+        if not (
+            isinstance(term, BinaryOp)
+            and term.op == "eq"
+            and isinstance(term.left, PropertyRef)
+            and isinstance(term.right, Literal)
+        ):
+            return None
+        paths.add(term.left.path)
+    return terms if len(paths) == 1 else None  # type: ignore[return-value]
+
+
+def _encoded_length(text: str) -> int:
+    return len(quote(text, safe=""))
+
+
+def split_key_list(text: str, max_length: int) -> Optional[List[str]]:
+    """Split a filter on a long list of key values into shorter filters
+
+    Finds a disjunction of equality comparisons on one property, either as
+    the whole filter or as one operand of a top-level ``and``, and spreads
+    its terms over filters whose URL-encoded length stays within
+    ``max_length``. The other ``and`` operands are repeated in every chunk,
+    so the chunks together match exactly what the original filter matches.
+
+    Args:
+        text: $filter expression
+        max_length: Maximum URL-encoded length of each chunk's filter
+
+    Returns:
+        Canonical chunk filters, or None if the filter fits, has no key list
+        or cannot be parsed
+    """
+    if _encoded_length(text) <= max_length:
+        return None
+
+    try:
+        node = normalize(parse_filter(text))
+    except SAPValidationError:
+        return None
+    conjuncts = list(_flatten(node, "and"))
+    for index, conjunct in enumerate(conjuncts):
+        terms = _key_list(conjunct)
+        if terms is not None:
+            break
+    else:
+        return None
+    rest = conjuncts[:index] + conjuncts[index + 1 :]
+
+    # Budget per chunk: the repeated conditions, " and (...)" around the
+    # key list, and " or " between its terms
+    budget = max_length
+    if rest:
+        budget -= _encoded_length(to_filter_string(reduce(_and, rest)))
+        budget -= _encoded_length(" and ()")
+    separator = _encoded_length(" or ")
+
+    chunks: List[List[Node]] = []
+    used = 0
+    for term in terms:
+        size = _encoded_length(to_filter_string(term))
+        if chunks and used + separator + size <= budget:
+            chunks[-1].append(term)
+            used += separator + size
+        else:
+            chunks.append([term])
+            used = size
+    if len(chunks) < 2:
+        return None
+
+    return [
+        to_filter_string(normalize(reduce(_and, rest, reduce(_or, chunk))))
+        for chunk in chunks
+    ]
+
+
+def _and(left: Node, right: Node) -> Node:
+    return BinaryOp("and", left, right)
+
+
+def _or(left: Node, right: Node) -> Node:
+    return BinaryOp("or", left, right)
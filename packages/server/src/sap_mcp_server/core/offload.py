@@ -0,0 +1,165 @@
+"""Off-event-loop decoding of large SAP responses"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from sap_mcp_server.utils.serialization import loads
+
+logger = logging.getLogger(__name__)
+
+
+def decode_json(text: str, transform: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Decode a JSON document and optionally transform the result
+
+    Module-level so it can run in a process pool.
+    """
+    data = loads(text)
+    return transform(data) if transform is not None else data
+
+
+class ResponseDecoder:
+    """Decodes JSON responses inline or, above a size threshold, in a pool
+
+    Small responses are decoded on the event loop, where a pool round trip
+    would cost more than the parse. Responses of at least ``threshold``
+    characters, together with any transformation of the decoded data, are
+    handed to a worker pool so that one huge query does not stall other
+    tool calls and the MCP stdio reader.
+
+    The thread pool (the default) shares memory with the server and has no
+    startup or transfer cost, but JSON decoding holds the GIL. The process
+    pool keeps the event loop fully responsive, at the price of pickling
+    every decoded result back to the server and starting workers with
+    ``spawn``: forking a process that runs threads and an event loop can
+    leave a child blocked on a lock held by another thread.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 262144,
+        max_workers: int = 1,
+        executor: str = "thread",
+    ):
+        """
+        Initialize the decoder
+
+        Args:
+            threshold: Response size in characters from which to offload
+            max_workers: Worker pool size
+            executor: "thread" or "process"
+        """
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self.executor_kind = executor
+        self._executor: Optional[Executor] = None
+        self._stats: Dict[str, Dict[str, float]] = {
+            mode: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            for mode in ("inline", "offloaded")
+        }
+
+    def configure(
+        self,
+        threshold: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[str] = None,
+    ) -> None:
+        """Change the decoder settings, replacing any running pool"""
+        self.shutdown()
+        if threshold is not None:
+            self.threshold = threshold
+        if max_workers is not None:
+            self.max_workers = max_workers
+        if executor is not None:
+            self.executor_kind = executor
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            workers = max(1, self.max_workers)
+            if self.executor_kind == "thread":
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="sap-decode"
+                )
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            logger.info(
+                f"Started {self.executor_kind} pool with {workers} worker(s) "
+                f"for responses of {self.threshold}+ characters"
+            )
+        return self._executor
+
+    async def decode(
+        self, text: str, transform: Optional[Callable[[Any], Any]] = None
+    ) -> Any:
+        """Decode a JSON response, off the event loop if it is large
+
+        Args:
+            text: Response body
+            transform: Picklable function applied to the decoded data in the
+                same step (module-level when a process pool is used)
+
+        Returns:
+            Decoded (and transformed) data
+        """
+        offload = self.threshold > 0 and len(text) >= self.threshold
+        started = time.perf_counter()
+        if offload:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._get_executor(), decode_json, text, transform
+            )
+        else:
+            result = decode_json(text, transform)
+        elapsed = time.perf_counter() - started
+
+        stats = self._stats["offloaded" if offload else "inline"]
+        stats["count"] += 1
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+        if offload:
+            logger.debug(f"Decoded {len(text)} characters off-loop in {elapsed:.3f}s")
+        return result
+
+    async def apply(self, transform: Callable[[Any], Any], data: Any, size: int) -> Any:
+        """Transform already decoded data, off the event loop if it is large
+
+        Used where several responses are decoded and merged before the
+        transformation can run.
+
+        Args:
+            transform: Function as for ``decode``
+            data: Decoded data
+            size: Characters of the responses the data was decoded from
+
+        Returns:
+            Transformed data
+        """
+        if self.threshold > 0 and size >= self.threshold:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), transform, data)
+        return transform(data)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get decode counts and timings, inline and offloaded"""
+        return {
+            "threshold": self.threshold,
+            "executor": self.executor_kind,
+            "max_workers": self.max_workers,
+            **{mode: dict(stats) for mode, stats in self._stats.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global response decoder instance
+response_decoder = ResponseDecoder()
@@ -0,0 +1,181 @@
+"""Output size budget and continuation cursors for query results"""
+
+import logging
+import secrets
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sap_mcp_server.config.schemas import OutputConfig
+from sap_mcp_server.core.cache import ResponseCache
+from sap_mcp_server.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+
+class StoredResult(NamedTuple):
+    """Rows of an oversized result kept for continuation"""
+
+    rows: List[Any]
+    envelope: Optional[Dict[str, Any]]
+    service: str
+    entity_set: str
+
+
+def _split_result(
+    data: Any,
+) -> Optional[Tuple[List[Any], Optional[Dict[str, Any]]]]:
+    """Split a query result into its rows and raw OData envelope
+
+    Returns:
+        (rows, envelope) where envelope is None for compact results, or None
+        if the result has no row list
+    """
+    if not isinstance(data, dict):
+        return None
+    if isinstance(data.get("results"), list):
+        return data["results"], None
+    body = data.get("d")
+    if isinstance(body, dict) and isinstance(body.get("results"), list):
+        return body["results"], {k: v for k, v in body.items() if k != "results"}
+    return None
+
+
+def _build_page(envelope: Optional[Dict[str, Any]], rows: List[Any]) -> Dict[str, Any]:
+    """Build a response of the original shape around a page of rows"""
+    if envelope is None:
+        return {"results": rows, "count": len(rows)}
+    return {"d": {**envelope, "results": rows}}
+
+
+def _rows_limit(config: OutputConfig, max_rows: Optional[int]) -> int:
+    """Per-call row limit, capped at the configured maximum"""
+    return min(max_rows or config.max_rows, config.max_rows)
+
+
+class ResultPager:
+    """Splits query results that exceed the output budget into pages
+
+    The rows of an oversized result are kept in a TTL + LRU store and the
+    first page is returned with an opaque ``next_cursor``. Following pages
+    are served from the store, without querying SAP again, until the cursor
+    expires or the result is evicted.
+    """
+
+    def __init__(
+        self,
+        max_results: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the pager
+
+        Args:
+            max_results: Maximum stored results before LRU eviction
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.store = ResponseCache(max_entries=max_results, clock=clock)
+
+    @staticmethod
+    def _page_end(rows: List[Any], start: int, max_rows: int, max_bytes: int) -> int:
+        """Find the end of the page starting at ``start`` (at least one row)"""
+        end = min(len(rows), start + max_rows)
+        if max_bytes <= 0:
+            return end
+
+        size = 0
+        for index in range(start, end):
+            size += len(dumps(rows[index], default=str).encode("utf-8"))
+            if size > max_bytes and index > start:
+                return index
+        return end
+
+    @staticmethod
+    def _page(
+        result_id: str, stored: StoredResult, start: int, end: int
+    ) -> Dict[str, Any]:
+        response = _build_page(stored.envelope, stored.rows[start:end])
+        response["total"] = len(stored.rows)
+        if end < len(stored.rows):
+            response["next_cursor"] = f"{result_id}.{end}"
+        return response
+
+    def paginate(
+        self,
+        data: Dict[str, Any],
+        config: OutputConfig,
+        service: str,
+        entity_set: str,
+        max_rows: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Apply the output budget to a query result
+
+        Args:
+            data: Query result (compact or raw OData)
+            config: Output budget configuration
+            service: Service ID the result was read from
+            entity_set: Entity set the result was read from
+            max_rows: Per-call row limit (capped at ``config.max_rows``)
+
+        Returns:
+            The result unchanged if it fits the budget, otherwise its first
+            page with ``total`` and ``next_cursor``
+        """
+        split = _split_result(data) if config.enabled else None
+        if split is None:
+            return data
+
+        rows, envelope = split
+        end = self._page_end(rows, 0, _rows_limit(config, max_rows), config.max_bytes)
+        if end == len(rows):
+            return data
+
+        result_id = secrets.token_urlsafe(12)
+        stored = StoredResult(rows, envelope, service, entity_set)
+        self.store.max_entries = config.max_stored_results
+        self.store.put(result_id, stored, ttl=config.cursor_ttl)
+        logger.debug(
+            f"Paginating {len(rows)} rows of {entity_set} under cursor {result_id}"
+        )
+        return self._page(result_id, stored, 0, end)
+
+    def next_page(
+        self,
+        cursor: str,
+        config: OutputConfig,
+        service: str,
+        entity_set: str,
+        max_rows: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get the page a continuation cursor points to
+
+        Raises:
+            ValueError: If the cursor is malformed, expired, or belongs to
+                another service or entity set
+        """
+        result_id, _, offset = cursor.rpartition(".")
+        if not result_id or not offset.isdigit():
+            raise ValueError(f"Invalid cursor '{cursor}'")
+
+        stored = self.store.get(result_id)
+        if stored is None:
+            raise ValueError(f"Cursor '{cursor}' has expired; run the query again")
+        if (stored.service, stored.entity_set) != (service, entity_set):
+            raise ValueError(
+                f"Cursor '{cursor}' belongs to {stored.service}/{stored.entity_set}"
+            )
+
+        start = int(offset)
+        if start >= len(stored.rows):
+            raise ValueError(f"Invalid cursor '{cursor}'")
+        end = self._page_end(
+            stored.rows, start, _rows_limit(config, max_rows), config.max_bytes
+        )
+        return self._page(result_id, stored, start, end)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get stored result counters"""
+        return self.store.get_statistics()
+
+
+# Global result pager instance
+result_pager = ResultPager()
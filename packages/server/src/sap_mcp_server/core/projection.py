@@ -0,0 +1,106 @@
+"""Default $select projection for entity reads"""
+
+import logging
+from typing import List, Optional
+
+from sap_mcp_server.config.schemas import (
+    EntityConfig,
+    ProjectionConfig,
+    ServiceConfig,
+)
+from sap_mcp_server.core.edmx import EntityType
+from sap_mcp_server.core.exceptions import SAPError
+from sap_mcp_server.core.sap_client import SAPClient
+
+logger = logging.getLogger(__name__)
+
+# Explicit select value requesting every property
+SELECT_ALL = "*"
+
+
+def parse_select(select: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated select parameter (None or "*" select all)"""
+    if select is None or select.strip() == SELECT_ALL:
+        return None
+    fields = [field.strip() for field in select.split(",") if field.strip()]
+    return fields or None
+
+
+def prune_properties(
+    entity_type: EntityType, config: ProjectionConfig
+) -> Optional[List[str]]:
+    """Select the properties of an entity type that are not heavyweight
+
+    Binary and stream properties, and strings longer than
+    ``config.max_text_length``, are dropped. Key properties are always kept.
+
+    Returns:
+        Properties to select, or None if nothing would be pruned
+    """
+    selected = []
+    for prop in entity_type.properties:
+        heavy = prop.type in config.excluded_types or (
+            prop.type == "Edm.String"
+            and prop.max_length is not None
+            and prop.max_length > config.max_text_length
+        )
+        if not heavy or prop.name in entity_type.keys:
+            selected.append(prop.name)
+
+    if len(selected) == len(entity_type.properties):
+        return None
+    return selected
+
+
+async def resolve_select(
+    client: SAPClient,
+    service_config: ServiceConfig,
+    entity_config: Optional[EntityConfig],
+    select: Optional[str],
+    config: ProjectionConfig,
+) -> Optional[List[str]]:
+    """Decide which properties to request from SAP
+
+    In order of precedence: the caller's select ("*" for every property),
+    the entity's ``default_select`` from services.yaml, and the entity's
+    properties from the service metadata without heavyweight ones.
+
+    Args:
+        client: Client used to fetch the service schema
+        service_config: Service being read
+        entity_config: Entity set being read, if configured
+        select: Comma-separated select parameter from the caller
+        config: Projection configuration
+
+    Returns:
+        Properties for $select, or None to request every property
+    """
+    if select is not None:
+        return parse_select(select)
+
+    if entity_config is not None and entity_config.default_select:
+        return list(entity_config.default_select)
+
+    if not config.prune_from_metadata or entity_config is None:
+        return None
+
+    try:
+        schema = await client.get_service_schema(service_config.path)
+    except SAPError as e:
+        logger.warning(
+            f"Selecting all properties of {entity_config.name}: "
+            f"service metadata unavailable ({e})"
+        )
+        return None
+
+    entity_type = schema.entity_type_for(entity_config.name)
+    if entity_type is None:
+        return None
+
+    selected = prune_properties(entity_type, config)
+    if selected is not None:
+        logger.debug(
+            f"Pruned {len(entity_type.properties) - len(selected)} heavyweight "
+            f"propert(ies) from {entity_config.name}"
+        )
+    return selected
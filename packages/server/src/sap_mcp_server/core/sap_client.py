@@ -1,27 +1,163 @@
 """SAP Gateway client implementation"""
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional, Union, cast
+import re
+from collections import deque
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import urljoin
 
 import aiohttp
 import xmltodict
+from multidict import CIMultiDict
 
-from sap_mcp_server.config.schemas import GatewayConfig
+from sap_mcp_server.config.schemas import CacheConfig, GatewayConfig, ServicesYAMLConfig
 from sap_mcp_server.config.loader import get_services_config
 from sap_mcp_server.config.settings import SAPConnectionConfig, get_services_config_path
-from sap_mcp_server.core.auth import SAPAuthenticator
+from sap_mcp_server.core.auth import AuthToken, SAPAuthenticator, TokenRefresher
+from sap_mcp_server.core.batch import (
+    BatchOperation,
+    BatchRequest,
+    BatchResponse,
+    batch_error,
+)
+from sap_mcp_server.core.cache import ResponseCache, make_cache_key
+from sap_mcp_server.core.connection import (
+    ConnectionPoolMetrics,
+    build_connector,
+    build_timeout,
+)
+from sap_mcp_server.core.edmx import ServiceSchema, parse_edmx
 from sap_mcp_server.core.exceptions import (
     SAPAuthenticationError,
     SAPConnectionError,
+    SAPError,
     SAPRequestError,
     SAPTimeoutError,
     SAPValidationError,
 )
+from sap_mcp_server.core.metadata_cache import DEFAULT_CACHE_DIR, MetadataCache
+from sap_mcp_server.core.odata_filter import canonical_filter, split_key_list
+from sap_mcp_server.core.offload import response_decoder
+from sap_mcp_server.utils.serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
+# Methods that never need a CSRF token
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_ETAG_PATTERN = re.compile(
+    r'"__metadata"\s*:\s*\{[^{}]*?"etag"\s*:\s*"((?:[^"\\]|\\.)*)"'
+)
+
+
+def extract_results(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract the entity rows from an OData v2 or v4 collection response"""
+    if "d" in data:
+        payload = data["d"]
+        if isinstance(payload, dict):
+            return cast(List[Dict[str, Any]], payload.get("results", []))
+        if isinstance(payload, list):
+            return payload
+    return cast(List[Dict[str, Any]], data.get("value", []))
+
+
+def extract_next_link(data: Dict[str, Any]) -> Optional[str]:
+    """Extract the server-driven paging link from an OData response"""
+    payload = data.get("d")
+    if isinstance(payload, dict) and payload.get("__next"):
+        return cast(str, payload["__next"])
+    return data.get("@odata.nextLink") or data.get("odata.nextLink")
+
+
+def _compact_entity(entity: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop __metadata and deferred navigation links from an entity"""
+    return {
+        key: value
+        for key, value in entity.items()
+        if key != "__metadata"
+        and not (isinstance(value, dict) and "__deferred" in value)
+    }
+
+
+def compact_response(data: Dict[str, Any], output_format: str) -> Dict[str, Any]:
+    """Transform an OData response based on the requested output format
+
+    Pure and module-level, so it can run in a worker pool right after the
+    response is decoded.
+
+    Args:
+        data: Raw OData response
+        output_format: 'json' for raw response, 'json_compact' for cleaned response
+
+    Returns:
+        Transformed response with reduced token usage for json_compact format
+    """
+    if output_format == "json":
+        return data
+
+    # json_compact: Remove __metadata and __deferred navigation links
+    results = data.get("d", {}).get("results", [])
+
+    if not results:
+        # Handle single entity response (no results array)
+        if "d" in data and isinstance(data["d"], dict):
+            return {"result": _compact_entity(data["d"])}
+        return data
+
+    # Expanded navigation properties are kept (they have actual data)
+    clean_results = [_compact_entity(item) for item in results]
+    return {"results": clean_results, "count": len(clean_results)}
+
+
+def extract_etag(text: str) -> Optional[str]:
+    """Extract ``__metadata.etag`` from an OData v2 entity response body
+
+    Scans the raw text rather than decoding it; the entity's own metadata
+    precedes that of any expanded navigation properties.
+    """
+    match = _ETAG_PATTERN.search(text)
+    if match is None:
+        return None
+    try:
+        return cast(str, loads(f'"{match.group(1)}"'))
+    except ValueError:
+        return None
+
+
+class SAPResponse(NamedTuple):
+    """Status, headers and body text of a completed SAP response"""
+
+    status: int
+    headers: CIMultiDict[str]
+    text: str
+
+
+def format_literal(value: Any) -> str:
+    """Format a JSON value as an OData URI literal"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if value is None:
+        return "null"
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
 
 class SAPClient:
     """SAP Gateway OData client with authentication and session management"""
@@ -34,24 +170,42 @@ class SAPClient:
         self.config = config
         self._session: Optional[aiohttp.ClientSession] = None
         self._session_lock = asyncio.Lock()
+        # Token whose cookies were last seeded into the session cookie jar
+        self._cookie_token: Optional[AuthToken] = None
+        self._pool_metrics = ConnectionPoolMetrics()
 
         # Load gateway configuration
-        if gateway_config is None:
-            from sap_mcp_server.config.loader import get_services_config
-
-            self.services_config = get_services_config(get_services_config_path())
-            self.gateway_config = self.services_config.gateway
+        # Without an explicit gateway the client follows services.yaml reloads
+        self._follows_services_config = gateway_config is None
+        services_config = self.services_config
+        if services_config is not None:
+            self.gateway_config = services_config.gateway
         else:
-            self.services_config = None
-            self.gateway_config = gateway_config
+            self.gateway_config = gateway_config or GatewayConfig()
+
+        # Cache for GET responses; per client, so per SAP user
+        cache_config = services_config.cache if services_config else CacheConfig()
+        self.cache_config = cache_config
+        self.response_cache = ResponseCache(max_entries=cache_config.max_entries)
+        self.metadata_cache = MetadataCache(
+            ttl=config.metadata_cache_ttl,
+            cache_dir=(
+                Path(config.metadata_cache_dir or DEFAULT_CACHE_DIR)
+                if config.metadata_cache_persist
+                else None
+            ),
+        )
 
         # Initialize authenticator with auth endpoint configuration
         self.authenticator = SAPAuthenticator(
             config=config,
             auth_endpoint=self.gateway_config.auth_endpoint,
-            services_config=self.services_config,
+            services_config=services_config,
+            session_provider=self._ensure_session,
         )
 
+        self._token_refresher: Optional[TokenRefresher] = None
+
         # Build base URLs using gateway configuration
         self.base_url = f"https://{config.host}:{config.port}"
         self.odata_base = self.gateway_config.base_url_pattern.format(
@@ -76,32 +230,158 @@ class SAPClient:
         """Ensure HTTP session is created"""
         async with self._session_lock:
             if self._session is None or self._session.closed:
-                timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-
-                # Create SSL context when verification is disabled (for self-signed certs)
-                ssl_context = None
-                if not self.config.verify_ssl:
-                    import ssl
-
-                    ssl_context = ssl.create_default_context()
-                    ssl_context.check_hostname = False
-                    ssl_context.verify_mode = ssl.CERT_NONE
-                    logger.warning("SSL certificate verification is disabled")
-
-                connector = aiohttp.TCPConnector(
-                    ssl=ssl_context if ssl_context else True,
-                    limit=100,  # Connection pool limit
-                    limit_per_host=10,
-                )
+                self._pool_metrics = ConnectionPoolMetrics()
 
+                # Unsafe jar so SAP session cookies are kept for IP-address hosts
                 self._session = aiohttp.ClientSession(
-                    timeout=timeout, connector=connector
+                    timeout=build_timeout(self.config),
+                    connector=build_connector(self.config),
+                    cookie_jar=aiohttp.CookieJar(unsafe=True),
+                    trace_configs=[self._pool_metrics.trace_config],
                 )
+                self._cookie_token = None
 
         return self._session
 
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get HTTP connection pool gauges for this client"""
+        connector = self._session.connector if self._session else None
+        return self._pool_metrics.snapshot(connector)
+
+    @property
+    def services_config(self) -> Optional[ServicesYAMLConfig]:
+        """Current services configuration snapshot, if the client uses one
+
+        Service, entity and cache TTL settings follow hot reloads of
+        services.yaml; gateway settings are fixed when the client is created.
+        """
+        if not self._follows_services_config:
+            return None
+        return get_services_config(get_services_config_path())
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache size and hit/miss counters"""
+        return self.response_cache.get_statistics()
+
+    def _cache_ttl(self, service_path: str, entity_set: str) -> float:
+        """Get the response cache TTL for reads from an entity set"""
+        services_config = self.services_config
+        if services_config is not None:
+            return services_config.get_cache_ttl(service_path, entity_set)
+        return self.cache_config.default_ttl if self.cache_config.enabled else 0.0
+
+    async def _cached_get(
+        self,
+        url: str,
+        params: Dict[str, str],
+        headers: Dict[str, str],
+        service_path: str,
+        entity_set: str,
+        etag_in_body: bool = False,
+    ) -> str:
+        """GET a response body, serving it from the response cache while fresh
+
+        Once a cached response with an ETag expires, it is revalidated with
+        If-None-Match and a 304 Not Modified is served from the local copy.
+        A response is not stored if a write to the entity set invalidated the
+        cache while it was being read.
+
+        Args:
+            etag_in_body: Also take the ETag from ``__metadata.etag`` in the
+                body (single entity reads) when there is no ETag header
+        """
+        ttl = self._cache_ttl(service_path, entity_set)
+        if ttl <= 0:
+            return cast(
+                str,
+                await self._make_request("GET", url, headers=headers, params=params),
+            )
+
+        # Equivalent filters share an entry; SAP still gets the filter as given
+        key_params = dict(params)
+        if "$filter" in key_params:
+            key_params["$filter"] = canonical_filter(key_params["$filter"])
+        key = make_cache_key(url, key_params, self.config.client)
+        tag = (service_path, entity_set)
+        generation = self.response_cache.generation(tag)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Response cache hit for {url}")
+            return cast(str, cached)
+
+        request_headers = dict(headers)
+        stale = self.response_cache.get_stale(key)
+        if stale is not None:
+            request_headers["If-None-Match"] = cast(str, stale.etag)
+
+        response = cast(
+            SAPResponse,
+            await self._make_request(
+                "GET",
+                url,
+                headers=request_headers,
+                params=dict(params),
+                full_response=True,
+            ),
+        )
+
+        if response.status == 304:
+            value = (
+                self.response_cache.revalidated(key, ttl, stale.etag)
+                if stale is not None
+                else None
+            )
+            if value is not None:
+                logger.debug(f"Revalidated cached response for {url}")
+                return cast(str, value)
+
+            # The local copy was evicted or replaced meanwhile; the empty 304
+            # body is no response, so read the resource again unconditionally
+            logger.debug(f"Cached response for {url} gone on revalidation")
+            response = cast(
+                SAPResponse,
+                await self._make_request(
+                    "GET", url, headers=headers, params=dict(params), full_response=True
+                ),
+            )
+
+        etag = response.headers.get("ETag")
+        if etag is None and etag_in_body:
+            etag = extract_etag(response.text)
+        self.response_cache.put(
+            key, response.text, ttl, tag=tag, etag=etag, generation=generation
+        )
+        return response.text
+
+    def invalidate_cache(self, service_path: str, entity_set: str) -> int:
+        """Drop cached reads of an entity set after a write
+
+        Returns:
+            Number of cached responses removed
+        """
+        return self.response_cache.invalidate((service_path, entity_set))
+
+    def start_token_refresh(self) -> None:
+        """Start renewing the authentication token in the background"""
+        if self._token_refresher is None:
+            self._token_refresher = TokenRefresher(
+                self.authenticator,
+                lead_time=self.config.token_refresh_lead_time,
+                jitter=self.config.token_refresh_jitter,
+            )
+        self._token_refresher.start()
+
+    def get_token_refresh_status(self) -> Optional[Dict[str, Any]]:
+        """Get background token refresh status, if enabled"""
+        if self._token_refresher is None:
+            return None
+        return self._token_refresher.get_status()
+
     async def close(self) -> None:
         """Close the HTTP session"""
+        if self._token_refresher is not None:
+            await self._token_refresher.stop()
+
         async with self._session_lock:
             if self._session and not self._session.closed:
                 await self._session.close()
@@ -126,12 +406,15 @@ class SAPClient:
         params: Optional[Dict[str, str]] = None,
         retry_count: int = 0,
         read_response: bool = True,
-    ) -> Union[aiohttp.ClientResponse, str]:
+        full_response: bool = False,
+    ) -> Union[aiohttp.ClientResponse, str, "SAPResponse"]:
         """Make authenticated HTTP request to SAP
 
         Args:
             read_response: If True, reads response body as text and returns it.
                          If False, returns the response object (caller must read).
+            full_response: If True (with read_response), returns an SAPResponse
+                         with the status and headers alongside the body text.
         """
 
         if retry_count >= self.config.retry_attempts:
@@ -139,35 +422,50 @@ class SAPClient:
                 f"Max retry attempts ({self.config.retry_attempts}) exceeded"
             )
 
-        # Get valid authentication token
-        try:
-            token = await self.authenticator.get_valid_token()
-        except Exception as e:
-            raise SAPAuthenticationError(
-                f"Failed to get authentication token: {str(e)}"
-            )
+        # Lazy mode sends Basic credentials on reads and lets the session
+        # cookies from the first response carry the rest of the session
+        lazy_read = self.config.auth_mode == "lazy" and method.upper() in SAFE_METHODS
+
+        token: Optional[AuthToken]
+        if lazy_read:
+            token = self.authenticator.peek_token()
+            request_headers = self.authenticator.get_basic_auth_headers()
+            if token is None:
+                # Piggyback the CSRF token fetch on this read
+                request_headers["X-CSRF-Token"] = "Fetch"
+        else:
+            # Get valid authentication token
+            try:
+                token = await self.authenticator.get_valid_token()
+            except Exception as e:
+                raise SAPAuthenticationError(
+                    f"Failed to get authentication token: {str(e)}"
+                )
+            request_headers = self.authenticator.get_auth_headers(token)
 
         # Prepare headers
-        request_headers = self.authenticator.get_auth_headers(token)
         if headers:
             request_headers.update(headers)
 
         # Prepare session
         session = await self._ensure_session()
 
-        # Set cookies from token
-        for name, value in token.cookies.items():
-            session.cookie_jar.update_cookies({name: value})
+        # Seed the cookie jar once per token. Logins on this session already
+        # left their cookies in the jar; this only matters for tokens another
+        # client obtained through the shared token store.
+        if token is not None and token is not self._cookie_token:
+            session.cookie_jar.update_cookies(token.cookies)
+            self._cookie_token = token
 
         # Prepare data
         if isinstance(data, dict):
-            data = json.dumps(data)
+            data = dumps(data)
             request_headers["Content-Type"] = "application/json"
 
         # Ensure sap-client parameter is always included
         if params is None:
             params = {}
-        if "sap-client" not in params:
+        if "sap-client" not in params and "sap-client=" not in url:
             params["sap-client"] = self.config.client
 
         try:
@@ -180,9 +478,17 @@ class SAPClient:
             ) as response:
 
                 # Handle authentication errors
-                if response.status == 401:
+                if response.status == 401 and lazy_read:
+                    error_text = await response.text()
+                    raise SAPAuthenticationError(
+                        f"Invalid credentials for user {self.config.username}: "
+                        f"{error_text}",
+                        status_code=401,
+                    )
+
+                if response.status == 401 or self._is_csrf_rejection(response):
                     logger.warning("Authentication token expired, refreshing...")
-                    await self.authenticator.invalidate_token()
+                    await self.authenticator.invalidate_token(token)
                     # Retry with new token
                     return await self._make_request(
                         method,
@@ -192,6 +498,7 @@ class SAPClient:
                         params,
                         retry_count + 1,
                         read_response,
+                        full_response,
                     )
 
                 # Handle other errors
@@ -203,9 +510,18 @@ class SAPClient:
                         response_data={"url": url, "method": method},
                     )
 
+                if lazy_read and token is None:
+                    self.authenticator.store_fetched_token(response)
+
                 # Read response body if requested (to avoid connection closing issues)
                 if read_response:
                     response_text = await response.text()
+                    if full_response:
+                        return SAPResponse(
+                            status=response.status,
+                            headers=CIMultiDict(response.headers),
+                            text=response_text,
+                        )
                     return response_text
                 else:
                     return response
@@ -220,28 +536,132 @@ class SAPClient:
                 )
                 await asyncio.sleep(2**retry_count)  # Exponential backoff
                 return await self._make_request(
-                    method, url, headers, data, params, retry_count + 1, read_response
+                    method,
+                    url,
+                    headers,
+                    data,
+                    params,
+                    retry_count + 1,
+                    read_response,
+                    full_response,
                 )
             else:
                 raise SAPConnectionError(f"Connection error: {str(e)}")
 
-    async def get_service_metadata(self, service_path: str) -> Dict[str, Any]:
-        """Get OData service metadata"""
-        url = f"{self.odata_base}{service_path}/$metadata"
+    @staticmethod
+    def _is_csrf_rejection(response: aiohttp.ClientResponse) -> bool:
+        """Check if SAP rejected a modifying request for a missing CSRF token"""
+        return (
+            response.status == 403
+            and response.headers.get("X-CSRF-Token", "").lower() == "required"
+        )
 
-        headers = {"Accept": "application/xml"}
-        xml_content = await self._make_request(
-            "GET", url, headers=headers, read_response=True
+    async def get_service_metadata(
+        self, service_path: str, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Get OData service metadata as a dict (parsed with xmltodict)
+
+        Parsed metadata is cached; see _get_cached_metadata.
+
+        Args:
+            service_path: OData service path
+            refresh: Revalidate even if the cached entry is still fresh
+        """
+        return cast(
+            Dict[str, Any],
+            await self._get_cached_metadata(
+                service_path, "", self._parse_metadata_xml, refresh=refresh
+            ),
+        )
+
+    async def get_service_schema(
+        self, service_path: str, refresh: bool = False
+    ) -> ServiceSchema:
+        """Get the compact schema model of an OData service
+
+        Args:
+            service_path: OData service path
+            refresh: Revalidate even if the cached entry is still fresh
+
+        Returns:
+            Entity types, keys, properties and entity sets with indexed lookups
+        """
+        return cast(
+            ServiceSchema,
+            await self._get_cached_metadata(
+                service_path,
+                # Versioned, so schemas persisted before base type
+                # inheritance are parsed again
+                "#schema-2",
+                parse_edmx,
+                encode=ServiceSchema.to_dict,
+                decode=ServiceSchema.from_dict,
+                refresh=refresh,
+            ),
         )
 
-        # Parse XML metadata
+    @staticmethod
+    def _parse_metadata_xml(xml_content: str) -> Dict[str, Any]:
         try:
-            metadata = xmltodict.parse(xml_content)
-            logger.info(f"Retrieved metadata for service: {service_path}")
-            return cast(Dict[str, Any], metadata)
+            return cast(Dict[str, Any], xmltodict.parse(xml_content))
         except Exception as e:
             raise SAPValidationError(f"Failed to parse metadata XML: {str(e)}")
 
+    async def _get_cached_metadata(
+        self,
+        service_path: str,
+        kind: str,
+        parse: Callable[[str], Any],
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+        refresh: bool = False,
+    ) -> Any:
+        """Get a parsed form of a service's $metadata through the metadata cache
+
+        Parsed metadata is cached in memory and, unless disabled, on disk.
+        Entries older than the metadata cache TTL (or all entries, with
+        ``refresh``) are revalidated with If-None-Match when SAP sent an ETag.
+
+        Args:
+            service_path: OData service path
+            kind: Cache key suffix distinguishing parsed forms
+            parse: Parses the EDMX document
+            encode: Converts the parsed form to JSON for the disk cache
+            decode: Rebuilds the parsed form from the disk cache
+            refresh: Revalidate even if the cached entry is still fresh
+        """
+        url = f"{self.odata_base}{service_path}/$metadata"
+        config = self.config
+        key = f"{config.host}:{config.port}/{config.client}{service_path}{kind}"
+
+        async with self.metadata_cache.lock(key):
+            entry = await self.metadata_cache.get(key, decode)
+            fresh = entry is not None and self.metadata_cache.is_fresh(entry)
+            if entry is not None and fresh and not refresh:
+                return entry.metadata
+
+            headers = {"Accept": "application/xml"}
+            if entry is not None and entry.etag:
+                headers["If-None-Match"] = entry.etag
+
+            response = cast(
+                SAPResponse,
+                await self._make_request(
+                    "GET", url, headers=headers, full_response=True
+                ),
+            )
+            if response.status == 304 and entry is not None:
+                logger.debug(f"Cached metadata for {service_path} is still valid")
+                entry = await self.metadata_cache.touch(key, entry, encode)
+                return entry.metadata
+
+            metadata = parse(response.text)
+            await self.metadata_cache.put(
+                key, metadata, response.headers.get("ETag"), encode
+            )
+            logger.info(f"Retrieved metadata for service: {service_path}")
+            return metadata
+
     async def list_services(self) -> List[Dict[str, Any]]:
         """List available OData services"""
         # Use catalog path from gateway configuration
@@ -258,7 +678,7 @@ class SAPClient:
         response_text = await self._make_request(
             "GET", url, headers=headers, read_response=True
         )
-        data = json.loads(response_text)
+        data = loads(response_text)
 
         # Extract service information
         services = []
@@ -276,24 +696,14 @@ class SAPClient:
         logger.info(f"Retrieved {len(services)} available services")
         return services
 
-    async def query_entity_set(
+    def _build_query_params(
         self,
-        service_path: str,
-        entity_set: str,
         filters: Optional[Dict[str, Any]] = None,
         select_fields: Optional[List[str]] = None,
         top: Optional[int] = None,
         skip: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Query an OData entity set"""
-
-        # Build URL
-        url = f"{self.odata_base}{service_path}/{entity_set}"
-
-        # Add Accept header for JSON format
-        headers = {"Accept": "application/json"}
-
-        # Build query parameters
+    ) -> Dict[str, str]:
+        """Build OData system query options for an entity set request"""
         params = {}
 
         if filters:
@@ -320,15 +730,556 @@ class SAPClient:
 
         # Add format parameter for JSON response
         params["$format"] = "json"
+        return params
 
-        response_text = await self._make_request(
-            "GET", url, headers=headers, params=params, read_response=True
+    async def query_entity_set(
+        self,
+        service_path: str,
+        entity_set: str,
+        filters: Optional[Dict[str, Any]] = None,
+        select_fields: Optional[List[str]] = None,
+        top: Optional[int] = None,
+        skip: Optional[int] = None,
+        transform: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Any:
+        """Query an OData entity set
+
+        A filter on a list of key values (``Vbeln eq '1' or Vbeln eq '2' ...``)
+        that is longer than ``max_filter_length`` is split into shorter
+        filters, queried concurrently and merged.
+
+        Args:
+            transform: Applied to the decoded response as part of decoding
+                (off the event loop for large responses); must be picklable
+                when decoding uses a process pool
+        """
+
+        # Build URL
+        url = f"{self.odata_base}{service_path}/{entity_set}"
+
+        # Add Accept header for JSON format
+        headers = {"Accept": "application/json"}
+
+        # Build query parameters
+        params = self._build_query_params(filters, select_fields, top, skip)
+
+        # $skip over the merged rows cannot be split across requests
+        if "$filter" in params and skip is None and self.config.max_filter_length:
+            chunks = split_key_list(params["$filter"], self.config.max_filter_length)
+            if chunks:
+                return await self._query_key_chunks(
+                    url, params, chunks, service_path, entity_set, transform
+                )
+
+        response_text = await self._cached_get(
+            url, params, headers, service_path, entity_set
         )
-        data = json.loads(response_text)
+        data = await response_decoder.decode(response_text, transform)
 
         logger.info(f"Queried entity set {entity_set} from service {service_path}")
         return cast(Dict[str, Any], data)
 
+    async def _query_key_chunks(
+        self,
+        url: str,
+        params: Dict[str, str],
+        chunks: List[str],
+        service_path: str,
+        entity_set: str,
+        transform: Optional[Callable[[Dict[str, Any]], Any]],
+    ) -> Any:
+        """Query each chunk of a split key-list filter and merge the rows
+
+        The chunks match disjoint sets of key values, so the rows are merged
+        as they are.
+        """
+        headers = {"Accept": "application/json"}
+        semaphore = asyncio.Semaphore(max(1, self.config.filter_chunk_parallel))
+        size = 0
+
+        async def fetch(chunk: str) -> Dict[str, Any]:
+            nonlocal size
+            async with semaphore:
+                response_text = await self._cached_get(
+                    url, {**params, "$filter": chunk}, headers, service_path, entity_set
+                )
+            size += len(response_text)
+            return cast(Dict[str, Any], await response_decoder.decode(response_text))
+
+        logger.info(
+            f"Splitting key-list filter on {entity_set} into {len(chunks)} "
+            f"request(s), {self.config.filter_chunk_parallel} in parallel"
+        )
+        responses = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+
+        rows = [row for response in responses for row in extract_results(response)]
+        if "$top" in params:
+            rows = rows[: int(params["$top"])]
+
+        data: Dict[str, Any] = (
+            {"d": {"results": rows}} if "d" in responses[0] else {"value": rows}
+        )
+        logger.info(f"Queried entity set {entity_set} from service {service_path}")
+        if transform is None:
+            return data
+        return await response_decoder.apply(transform, data, size)
+
+    async def iter_entity_set(
+        self,
+        service_path: str,
+        entity_set: str,
+        filters: Optional[Dict[str, Any]] = None,
+        select_fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        prefetch: int = 1,
+        rows: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Iterate over an OData entity set page by page
+
+        Follows server-driven paging (``d.__next`` / ``@odata.nextLink`` links
+        carrying a ``$skiptoken``). With ``page_size``, pages are also requested
+        client-side with ``$top``/``$skip`` until a short page is returned.
+
+        Args:
+            service_path: OData service path
+            entity_set: Entity set name
+            filters: Filters as for query_entity_set
+            select_fields: Fields to select
+            page_size: Rows per client-requested page (optional)
+            max_rows: Stop after this many rows (optional)
+            prefetch: Number of pages fetched ahead while the caller processes
+                      the current one (0 disables prefetching)
+            rows: If True, yield individual rows instead of pages
+
+        Yields:
+            Lists of entity dicts (pages), or entity dicts if ``rows`` is True
+        """
+        url = f"{self.odata_base}{service_path}/{entity_set}"
+        first_top = page_size
+        if max_rows is not None and (first_top is None or max_rows < first_top):
+            first_top = max_rows
+        params = self._build_query_params(filters, select_fields, top=first_top)
+
+        pages = self._produce_pages(url, params, page_size, max_rows)
+        if prefetch > 0:
+            pages = self._prefetch_pages(pages, prefetch)
+
+        remaining = max_rows
+        try:
+            async for page in pages:
+                if remaining is not None:
+                    page = page[:remaining]
+                    remaining -= len(page)
+
+                if rows:
+                    for row in page:
+                        yield row
+                elif page:
+                    yield page
+
+                if remaining is not None and remaining <= 0:
+                    break
+        finally:
+            await pages.aclose()
+
+    async def _produce_pages(
+        self,
+        url: str,
+        params: Dict[str, str],
+        page_size: Optional[int],
+        max_rows: Optional[int],
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Fetch consecutive pages of an entity set"""
+        headers = {"Accept": "application/json"}
+        next_url: Optional[str] = url
+        next_params: Optional[Dict[str, str]] = params
+        skip = 0
+        fetched = 0
+
+        while next_url is not None:
+            response_text = await self._make_request(
+                "GET", next_url, headers=headers, params=next_params
+            )
+            data = loads(response_text)
+            page = extract_results(data)
+            fetched += len(page)
+            yield page
+
+            if max_rows is not None and fetched >= max_rows:
+                return
+
+            next_link = extract_next_link(data)
+            if next_link:
+                # Server-driven paging: the link carries all query options
+                next_url = urljoin(next_url, next_link)
+                next_params = None
+            elif page_size and len(page) >= page_size:
+                skip += len(page)
+                top = page_size
+                if max_rows is not None:
+                    top = min(top, max_rows - fetched)
+                next_url = url
+                next_params = {**params, "$top": str(top), "$skip": str(skip)}
+            else:
+                next_url = None
+
+    @staticmethod
+    async def _prefetch_pages(
+        pages: AsyncGenerator[List[Dict[str, Any]], None], prefetch: int
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Fetch up to ``prefetch`` pages ahead of the consumer"""
+        queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=prefetch)
+        done = object()
+
+        async def produce() -> None:
+            try:
+                async for page in pages:
+                    await queue.put(page)
+                await queue.put(done)
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                await queue.put(e)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+            await pages.aclose()
+
+    async def count_entity_set(
+        self,
+        service_path: str,
+        entity_set: str,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Count the entities in an entity set matching the filters
+
+        Uses the ``$count`` path segment, falling back to
+        ``$inlinecount=allpages`` for services that do not support it.
+        """
+        url = f"{self.odata_base}{service_path}/{entity_set}"
+        params = self._build_query_params(filters)
+        count_params = {k: v for k, v in params.items() if k == "$filter"}
+
+        try:
+            response_text = await self._make_request(
+                "GET",
+                f"{url}/$count",
+                headers={"Accept": "text/plain"},
+                params=count_params,
+            )
+            return int(str(response_text).strip())
+        except (SAPRequestError, ValueError) as e:
+            logger.info(
+                f"$count not available for {entity_set}, using $inlinecount: {e}"
+            )
+
+        params.update({"$inlinecount": "allpages", "$top": "0"})
+        response_text = await self._make_request(
+            "GET", url, headers={"Accept": "application/json"}, params=params
+        )
+        data = loads(response_text)
+        count = data.get("d", {}).get("__count", data.get("@odata.count"))
+        if count is None:
+            raise SAPValidationError(f"SAP returned no count for {entity_set}")
+        return int(count)
+
+    async def scan_entity_set(
+        self,
+        service_path: str,
+        entity_set: str,
+        filters: Optional[Dict[str, Any]] = None,
+        select_fields: Optional[List[str]] = None,
+        partition_size: int = 5000,
+        max_parallel: int = 4,
+        key_field: Optional[str] = None,
+        partition_by: str = "skip",
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Read a whole entity set as concurrently fetched partitions
+
+        Counts the matching entities first, then fetches disjoint partitions
+        with at most ``max_parallel`` requests in flight. Partitions are
+        yielded in order, so results come back in a stable order while only
+        a bounded number of partitions is held in memory.
+
+        Args:
+            service_path: OData service path
+            entity_set: Entity set name
+            filters: Filters as for query_entity_set
+            select_fields: Fields to select
+            partition_size: Rows per partition
+            max_parallel: Maximum partitions fetched concurrently
+            key_field: Key property (e.g. EntityConfig.key_field). Orders the
+                       partitions so ``$skip`` windows are stable and disjoint.
+            partition_by: ``"skip"`` for ``$skip``/``$top`` windows, or
+                          ``"key"`` for ``key_field`` ranges whose boundaries
+                          are probed up front (avoids deep ``$skip`` scans)
+
+        Yields:
+            Lists of entity dicts, one per partition
+        """
+        if partition_by not in ("skip", "key"):
+            raise SAPValidationError("partition_by must be 'skip' or 'key'")
+        if partition_by == "key" and not key_field:
+            raise SAPValidationError("Key range partitioning requires key_field")
+        if partition_size <= 0 or max_parallel <= 0:
+            raise SAPValidationError("partition_size and max_parallel must be positive")
+
+        total = await self.count_entity_set(service_path, entity_set, filters)
+        partition_count = -(-total // partition_size)
+        logger.info(
+            f"Scanning {total} entities of {entity_set} in {partition_count} "
+            f"partition(s), {max_parallel} in parallel"
+        )
+        if partition_count == 0:
+            return
+
+        url = f"{self.odata_base}{service_path}/{entity_set}"
+        params = self._build_query_params(filters, select_fields)
+        if key_field:
+            params["$orderby"] = key_field
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        if partition_by == "key":
+            partitions = await self._key_range_partitions(
+                url, params, cast(str, key_field), partition_size, total, semaphore
+            )
+        else:
+            partitions = [
+                (
+                    {
+                        **params,
+                        "$skip": str(i * partition_size),
+                        "$top": str(partition_size),
+                    },
+                    partition_size,
+                )
+                for i in range(partition_count)
+            ]
+
+        async def fetch(
+            partition_params: Dict[str, str], limit: Optional[int]
+        ) -> List[Dict[str, Any]]:
+            async with semaphore:
+                rows: List[Dict[str, Any]] = []
+                async for page in self._produce_pages(
+                    url, dict(partition_params), None, limit
+                ):
+                    rows.extend(page)
+                return rows[:limit] if limit is not None else rows
+
+        # Keep a bounded window of partitions in flight and yield in order
+        pending: Deque["asyncio.Task[List[Dict[str, Any]]]"] = deque()
+        queue = iter(partitions)
+        try:
+            for partition_params, limit in queue:
+                pending.append(asyncio.create_task(fetch(partition_params, limit)))
+                if len(pending) >= max_parallel:
+                    break
+            while pending:
+                rows = await pending.popleft()
+                next_partition = next(queue, None)
+                if next_partition is not None:
+                    pending.append(asyncio.create_task(fetch(*next_partition)))
+                yield rows
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _key_range_partitions(
+        self,
+        url: str,
+        params: Dict[str, str],
+        key_field: str,
+        partition_size: int,
+        total: int,
+        semaphore: asyncio.Semaphore,
+    ) -> List[Tuple[Dict[str, str], Optional[int]]]:
+        """Split an entity set into key ranges of about partition_size rows"""
+        headers = {"Accept": "application/json"}
+
+        async def probe(offset: int) -> Any:
+            probe_params = {
+                **params,
+                "$select": key_field,
+                "$skip": str(offset),
+                "$top": "1",
+            }
+            async with semaphore:
+                response_text = await self._make_request(
+                    "GET", url, headers=headers, params=probe_params
+                )
+            rows = extract_results(loads(response_text))
+            return rows[0][key_field] if rows else None
+
+        offsets = range(partition_size, total, partition_size)
+        probed = await asyncio.gather(*(probe(offset) for offset in offsets))
+        boundaries = [boundary for boundary in probed if boundary is not None]
+
+        base_filter = params.get("$filter")
+        ranges: List[Optional[str]] = []
+        lower = None
+        for boundary in boundaries + [None]:
+            conditions = []
+            if lower is not None:
+                conditions.append(f"{key_field} ge {format_literal(lower)}")
+            if boundary is not None:
+                conditions.append(f"{key_field} lt {format_literal(boundary)}")
+            ranges.append(" and ".join(conditions) or None)
+            lower = boundary
+
+        partitions: List[Tuple[Dict[str, str], Optional[int]]] = []
+        for key_range in ranges:
+            partition_params = dict(params)
+            if key_range and base_filter:
+                partition_params["$filter"] = f"({base_filter}) and {key_range}"
+            elif key_range:
+                partition_params["$filter"] = key_range
+            partitions.append((partition_params, None))
+        return partitions
+
+    async def execute_batch(
+        self, service_path: str, batch: BatchRequest
+    ) -> List[BatchOperation]:
+        """Send a $batch request and attach each part's response to its operation
+
+        Args:
+            service_path: OData service path
+            batch: Batch built with BatchRequest
+
+        Returns:
+            All operations of the batch in request order, with ``response`` set
+        """
+        url = f"{self.odata_base}{service_path}/$batch"
+        content_type, body = batch.build()
+        headers = {"Content-Type": content_type, "Accept": "multipart/mixed"}
+
+        response = cast(
+            SAPResponse,
+            await self._make_request(
+                "POST", url, headers=headers, data=body, full_response=True
+            ),
+        )
+        operations = batch.resolve(response.headers.get("Content-Type"), response.text)
+
+        # Changesets may have modified entity sets with cached reads
+        for operation in operations:
+            if operation.method not in SAFE_METHODS:
+                entity_set = re.split(r"[(/?]", operation.path, maxsplit=1)[0]
+                self.invalidate_cache(service_path, entity_set)
+
+        failed = sum(1 for op in operations if op.response and not op.response.ok)
+        logger.info(
+            f"Executed $batch with {len(operations)} operation(s) on {service_path}"
+            + (f", {failed} failed" if failed else "")
+        )
+        return operations
+
+    async def get_entities(
+        self,
+        service_path: str,
+        entity_set: str,
+        entity_keys: List[str],
+        select_fields: Optional[List[str]] = None,
+        max_parallel: int = 8,
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get several entities by key in one call
+
+        Keys are fetched concurrently with at most ``max_parallel`` requests
+        in flight or, when ``batch_size`` is given, as $batch requests of up
+        to ``batch_size`` retrievals each. A failing key does not fail the
+        others.
+
+        Args:
+            service_path: OData service path
+            entity_set: Entity set name
+            entity_keys: Entity key values (duplicates are fetched once)
+            select_fields: Fields to select
+            max_parallel: Maximum requests (or $batch requests) in flight
+            batch_size: Retrievals per $batch request; None for plain GETs
+
+        Returns:
+            One result per unique key, in request order, holding either
+            ``data`` or ``error``
+        """
+        if max_parallel <= 0:
+            raise SAPValidationError("max_parallel must be positive")
+        if batch_size is not None and batch_size <= 0:
+            raise SAPValidationError("batch_size must be positive")
+
+        keys = list(dict.fromkeys(entity_keys))
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def fetch(key: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    data = await self.get_entity(
+                        service_path, entity_set, key, select_fields
+                    )
+                except (SAPError, ValueError) as e:
+                    return {"key": key, "success": False, "error": str(e)}
+                return {"key": key, "success": True, "data": data}
+
+        async def fetch_batch(chunk: List[str]) -> List[Dict[str, Any]]:
+            batch = BatchRequest()
+            params = {"$select": ",".join(select_fields)} if select_fields else None
+            operations = [
+                batch.get(f"{entity_set}('{key}')", params=params) for key in chunk
+            ]
+            async with semaphore:
+                try:
+                    await self.execute_batch(service_path, batch)
+                except SAPError as e:
+                    return [
+                        {"key": key, "success": False, "error": str(e)} for key in chunk
+                    ]
+
+            results = []
+            for key, operation in zip(chunk, operations):
+                response = cast(BatchResponse, operation.response)
+                if not response.ok:
+                    error = batch_error(response)
+                    results.append({"key": key, "success": False, "error": error})
+                    continue
+                try:
+                    data = response.json()
+                except ValueError as e:
+                    results.append({"key": key, "success": False, "error": str(e)})
+                    continue
+                results.append({"key": key, "success": True, "data": data})
+            return results
+
+        if batch_size is None:
+            results = await asyncio.gather(*(fetch(key) for key in keys))
+        else:
+            chunks = [keys[i : i + batch_size] for i in range(0, len(keys), batch_size)]
+            batches = await asyncio.gather(*(fetch_batch(chunk) for chunk in chunks))
+            results = [result for chunk_results in batches for result in chunk_results]
+
+        failed = sum(1 for result in results if not result["success"])
+        logger.info(
+            f"Retrieved {len(results) - failed}/{len(results)} entities "
+            f"from {entity_set}"
+        )
+        return list(results)
+
     async def create_entity(
         self, service_path: str, entity_set: str, entity_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -342,8 +1293,10 @@ class SAPClient:
             "POST", url, headers=headers, data=entity_data, read_response=True
         )
 
+        self.invalidate_cache(service_path, entity_set)
+
         # For successful POST, parse the response
-        data = json.loads(response_text)
+        data = loads(response_text)
         logger.info(f"Created entity in {entity_set}")
         return cast(Dict[str, Any], data)
 
@@ -363,10 +1316,11 @@ class SAPClient:
         response_text = await self._make_request(
             "PUT", url, headers=headers, data=entity_data, read_response=True
         )
+        self.invalidate_cache(service_path, entity_set)
 
         # Parse response if not empty (204 No Content returns empty string)
         if response_text:
-            data = json.loads(response_text)
+            data = loads(response_text)
             return cast(Dict[str, Any], data)
         else:
             return {"status": "updated"}
@@ -379,7 +1333,8 @@ class SAPClient:
         url = f"{self.odata_base}{service_path}/{entity_set}('{entity_key}')"
 
         # DELETE typically returns 204 No Content (empty response)
-        response_text = await self._make_request("DELETE", url, read_response=True)
+        await self._make_request("DELETE", url, read_response=True)
+        self.invalidate_cache(service_path, entity_set)
 
         logger.info(f"Deleted entity {entity_key} from {entity_set}")
         return True
@@ -403,13 +1358,13 @@ class SAPClient:
             params["$select"] = ",".join(select_fields)
 
         try:
-            response_text = await self._make_request(
-                "GET", url, headers=headers, params=params, read_response=True
+            response_text = await self._cached_get(
+                url, params, headers, service_path, entity_set, etag_in_body=True
             )
             logger.debug(f"Response text: {response_text[:500]}")
 
-            # Parse JSON from the text
-            data = json.loads(response_text)
+            # Parse JSON from the text, off the event loop if it is large
+            data = await response_decoder.decode(response_text)
 
             logger.info(f"Retrieved entity {entity_key} from {entity_set}")
             return cast(Dict[str, Any], data)
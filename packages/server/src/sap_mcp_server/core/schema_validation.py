@@ -0,0 +1,228 @@
+"""Validation of tool requests against the service metadata"""
+
+import difflib
+import logging
+import re
+from typing import Iterable, List, Optional
+
+from sap_mcp_server.config.schemas import ServiceConfig, ValidationConfig
+from sap_mcp_server.core.edmx import EntityType
+from sap_mcp_server.core.exceptions import SAPError, SAPValidationError
+from sap_mcp_server.core.odata_filter import (
+    COMPARISON_OPERATORS,
+    BinaryOp,
+    Literal,
+    PropertyRef,
+    parse_filter,
+    walk,
+)
+from sap_mcp_server.core.sap_client import SAPClient
+
+logger = logging.getLogger(__name__)
+
+INTEGER_TYPES = ("Edm.Byte", "Edm.SByte", "Edm.Int16", "Edm.Int32", "Edm.Int64")
+NUMERIC_TYPES = INTEGER_TYPES + ("Edm.Decimal", "Edm.Double", "Edm.Single")
+NUMERIC_LITERALS = ("Edm.Int32", "Edm.Int64", "Edm.Decimal", "Edm.Double", "Edm.Single")
+
+# Literal types accepted in comparisons with a property of each Edm type;
+# properties of other types are not checked
+COMPATIBLE_LITERALS = {
+    "Edm.String": ("Edm.String",),
+    "Edm.Boolean": ("Edm.Boolean",),
+    "Edm.Guid": ("Edm.Guid",),
+    "Edm.Time": ("Edm.Time",),
+    "Edm.DateTime": ("Edm.DateTime", "Edm.DateTimeOffset"),
+    "Edm.DateTimeOffset": ("Edm.DateTime", "Edm.DateTimeOffset"),
+    **{edm_type: ("Edm.Int32", "Edm.Int64") for edm_type in INTEGER_TYPES},
+    **{
+        edm_type: NUMERIC_LITERALS
+        for edm_type in ("Edm.Decimal", "Edm.Double", "Edm.Single")
+    },
+}
+
+# How to write a literal of each type, for error messages
+LITERAL_HINTS = {
+    "Edm.String": "'text'",
+    "Edm.Boolean": "true or false",
+    "Edm.Guid": "guid'...'",
+    "Edm.Time": "time'PT12H00M'",
+    "Edm.DateTime": "datetime'2024-01-01T00:00:00'",
+    "Edm.DateTimeOffset": "datetimeoffset'2024-01-01T00:00:00Z'",
+}
+
+_GUID_PATTERN = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+
+def suggest(name: str, candidates: Iterable[str]) -> str:
+    """Format the closest candidates to a misspelled name
+
+    Returns:
+        " Did you mean: A, B?" or an empty string without close matches
+    """
+    candidates = list(candidates)
+    matches = [c for c in candidates if c.lower() == name.lower()]
+    matches += difflib.get_close_matches(name, candidates, n=3, cutoff=0.6)
+    matches = list(dict.fromkeys(matches))[:3]
+    return f" Did you mean: {', '.join(matches)}?" if matches else ""
+
+
+def _check_path(path: str, entity_type: EntityType, entity_set: str) -> Optional[str]:
+    """Check the first segment of a property path (navigations are not followed)"""
+    name = path.split("/", 1)[0]
+    if name in entity_type:
+        return None
+    members = [p.name for p in entity_type.properties]
+    members += [n.name for n in entity_type.navigations]
+    return f"Unknown property '{name}' of {entity_set}.{suggest(name, members)}"
+
+
+def _literal_hint(edm_type: str) -> str:
+    if edm_type in NUMERIC_TYPES:
+        return "a number"
+    return LITERAL_HINTS.get(edm_type, edm_type)
+
+
+def check_select(
+    fields: Optional[List[str]], entity_type: EntityType, entity_set: str
+) -> List[str]:
+    """Check $select fields against an entity type
+
+    Returns:
+        Error messages, empty if every field exists
+    """
+    errors = []
+    for field in fields or []:
+        error = _check_path(field, entity_type, entity_set)
+        if error:
+            errors.append(error)
+    return errors
+
+
+def check_filter(
+    filter_expr: str, entity_type: EntityType, entity_set: str
+) -> List[str]:
+    """Check the properties and compared literal types of a $filter
+
+    Expressions outside the parser's grammar are not checked.
+
+    Returns:
+        Error messages, empty if the filter matches the entity type
+    """
+    try:
+        root = parse_filter(filter_expr)
+    except SAPValidationError:
+        return []
+
+    errors = []
+    for node in walk(root):
+        if isinstance(node, PropertyRef):
+            error = _check_path(node.path, entity_type, entity_set)
+            if error and error not in errors:
+                errors.append(error)
+        elif isinstance(node, BinaryOp) and node.op in COMPARISON_OPERATORS:
+            ref, literal = node.left, node.right
+            if isinstance(ref, Literal):
+                ref, literal = literal, ref
+            if not isinstance(ref, PropertyRef) or not isinstance(literal, Literal):
+                continue
+            prop = entity_type.get_property(ref.path)
+            if prop is None or literal.type is None:
+                continue
+            accepted = COMPATIBLE_LITERALS.get(prop.type)
+            if accepted is not None and literal.type not in accepted:
+                errors.append(
+                    f"Property '{prop.name}' is {prop.type} and cannot be compared "
+                    f"with {literal.text}; write the value as "
+                    f"{_literal_hint(prop.type)}"
+                )
+    return errors
+
+
+def check_key(entity_key: str, entity_type: EntityType, entity_set: str) -> List[str]:
+    """Check a single key value against the key property of an entity type
+
+    Composite keys are not checked.
+
+    Returns:
+        Error messages, empty if the key value fits the key type
+    """
+    if len(entity_type.keys) != 1:
+        return []
+    prop = entity_type.get_property(entity_type.keys[0])
+    if prop is None:
+        return []
+
+    if prop.type in INTEGER_TYPES and not entity_key.lstrip("-").isdigit():
+        problem = "an integer"
+    elif prop.type == "Edm.Guid" and not _GUID_PATTERN.match(entity_key):
+        problem = "a GUID"
+    elif (
+        prop.type == "Edm.String"
+        and prop.max_length is not None
+        and len(entity_key) > prop.max_length
+    ):
+        problem = f"at most {prop.max_length} characters"
+    else:
+        return []
+    return [
+        f"Key '{entity_key}' does not fit {entity_set} key {prop.name} "
+        f"({prop.type}): expected {problem}"
+    ]
+
+
+async def validate_request(
+    client: SAPClient,
+    service_config: ServiceConfig,
+    entity_set: str,
+    config: ValidationConfig,
+    select: Optional[List[str]] = None,
+    filter_expr: Optional[str] = None,
+    entity_key: Optional[str] = None,
+) -> None:
+    """Check a read against the cached service schema before sending it
+
+    Unknown entity sets and properties, key values that do not fit the key
+    type, and filter literals of the wrong type fail here instead of with a
+    400 from the gateway. Without metadata the request is not checked.
+
+    Args:
+        client: Client used to fetch the service schema
+        service_config: Service being read
+        entity_set: Entity set being read
+        config: Validation configuration
+        select: Properties for $select
+        filter_expr: $filter expression
+        entity_key: Key value of a single-entity read
+
+    Raises:
+        SAPValidationError: With all problems found and the closest valid names
+    """
+    if not config.enabled:
+        return
+
+    try:
+        schema = await client.get_service_schema(service_config.path)
+    except SAPError as e:
+        logger.warning(
+            f"Not validating {entity_set}: service metadata unavailable ({e})"
+        )
+        return
+
+    entity_type = schema.entity_type_for(entity_set)
+    if entity_type is None:
+        if not schema.entity_sets or schema.get_entity_set(entity_set):
+            return
+        raise SAPValidationError(
+            f"Unknown entity set '{entity_set}' in service {service_config.id}."
+            f"{suggest(entity_set, schema.entity_sets)}"
+        )
+
+    errors = check_select(select, entity_type, entity_set)
+    if filter_expr is not None:
+        errors += check_filter(filter_expr, entity_type, entity_set)
+    if entity_key is not None:
+        errors += check_key(entity_key, entity_type, entity_set)
+    if errors:
+        raise SAPValidationError("; ".join(errors))
@@ -70,6 +70,9 @@ class ToolCallResponse(BaseModel):
     """Tool call response schema"""
 
     content: List[Dict[str, Any]] = Field(..., description="Tool response content")
+    structuredContent: Optional[Dict[str, Any]] = Field(
+        default=None, description="Tool result as a JSON object"
+    )
     isError: bool = Field(
         default=False, description="Whether the call resulted in an error"
     )
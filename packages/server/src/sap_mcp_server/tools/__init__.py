@@ -5,7 +5,7 @@ import logging
 from .base import MCPTool, ToolRegistry, tool_registry
 from .auth_tool import SAPAuthenticateTool
 from .query_tool import SAPQueryTool
-from .entity_tool import SAPGetEntityTool
+from .entity_tool import SAPGetEntitiesTool, SAPGetEntityTool
 from .service_tool import SAPListServicesTool
 
 logger = logging.getLogger(__name__)
@@ -17,6 +17,7 @@ __all__ = [
     "SAPAuthenticateTool",
     "SAPQueryTool",
     "SAPGetEntityTool",
+    "SAPGetEntitiesTool",
     "SAPListServicesTool",
     "register_sap_tools",
 ]
@@ -27,8 +28,9 @@ def register_sap_tools() -> None:
     tool_registry.register(SAPAuthenticateTool())
     tool_registry.register(SAPQueryTool())
     tool_registry.register(SAPGetEntityTool())
+    tool_registry.register(SAPGetEntitiesTool())
     tool_registry.register(SAPListServicesTool())
-    logger.info("Registered 4 SAP tools")
+    logger.info("Registered 5 SAP tools")
 
 
 # Auto-register on import
@@ -4,7 +4,6 @@ import logging
 from typing import Any, Dict
 
 from sap_mcp_server.tools.base import MCPTool
-from sap_mcp_server.core.sap_client import SAPClient
 
 logger = logging.getLogger(__name__)
 
@@ -31,11 +30,12 @@ class SAPAuthenticateTool(MCPTool):
         """Execute authentication"""
         try:
             from sap_mcp_server.config.settings import get_config
+            from sap_mcp_server.core.client_pool import get_sap_client
 
             config = get_config(require_sap=True)
 
-            async with SAPClient(config.sap) as client:
-                success = await client.authenticate()
+            client = await get_sap_client(config.sap)
+            success = await client.authenticate()
 
             if success:
                 return {
@@ -4,13 +4,30 @@ import logging
 import time
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sap_mcp_server.protocol.schemas import ToolCallRequest, ToolCallResponse, ToolInfo
+from sap_mcp_server.utils.serialization import dumps
+from sap_mcp_server.utils.validators import ArgumentValidator, compile_tool_validator
 
 logger = logging.getLogger(__name__)
 
 
+def summarize_result(result: Dict[str, Any]) -> str:
+    """Summarize a structured tool result for its text content
+
+    Keeps the top-level scalar fields (success flag, counts, cursors, error
+    messages) as compact JSON; rows and other nested data are sent only as
+    structured content.
+    """
+    scalars = {
+        key: value
+        for key, value in result.items()
+        if value is None or isinstance(value, (str, int, float, bool))
+    }
+    return dumps(scalars, default=str)
+
+
 class MCPTool(ABC):
     """Base class for all MCP tools"""
 
@@ -45,10 +62,18 @@ class MCPTool(ABC):
 
 
 class ToolRegistry:
-    """Registry for managing MCP tools"""
+    """Registry for managing MCP tools
+
+    Tool info and an argument validator are built once per tool when it is
+    registered, so listing tools and rejecting bad arguments cost no schema
+    work per request.
+    """
 
     def __init__(self):
         self._tools: Dict[str, MCPTool] = {}
+        self._tool_infos: Dict[str, ToolInfo] = {}
+        self._validators: Dict[str, ArgumentValidator] = {}
+        self._catalog: Optional[Tuple[ToolInfo, ...]] = None
         self._execution_stats: Dict[str, Dict[str, Any]] = {}
 
     def register(self, tool: MCPTool) -> None:
@@ -57,6 +82,9 @@ class ToolRegistry:
             logger.warning(f"Tool '{tool.name}' already registered, overwriting")
 
         self._tools[tool.name] = tool
+        self._tool_infos[tool.name] = tool.to_tool_info()
+        self._validators[tool.name] = compile_tool_validator(tool.input_schema)
+        self._catalog = None
         self._execution_stats[tool.name] = {
             "call_count": 0,
             "total_duration": 0.0,
@@ -69,7 +97,10 @@ class ToolRegistry:
         """Unregister a tool"""
         if tool_name in self._tools:
             del self._tools[tool_name]
+            del self._tool_infos[tool_name]
+            del self._validators[tool_name]
             del self._execution_stats[tool_name]
+            self._catalog = None
             logger.info(f"Unregistered tool: {tool_name}")
             return True
         return False
@@ -78,16 +109,32 @@ class ToolRegistry:
         """Get a tool by name"""
         return self._tools.get(name)
 
+    @property
+    def catalog(self) -> Tuple[ToolInfo, ...]:
+        """Info of all registered tools; the same tuple until tools change"""
+        if self._catalog is None:
+            self._catalog = tuple(self._tool_infos.values())
+        return self._catalog
+
     def list_tools(self) -> List[ToolInfo]:
         """List all registered tools"""
-        return [tool.to_tool_info() for tool in self._tools.values()]
+        return list(self.catalog)
 
     def get_tool_names(self) -> List[str]:
         """Get list of registered tool names"""
         return list(self._tools.keys())
 
-    async def call_tool(self, request: ToolCallRequest) -> ToolCallResponse:
-        """Execute a tool call"""
+    async def call_tool(
+        self, request: ToolCallRequest, structured: bool = False
+    ) -> ToolCallResponse:
+        """Execute a tool call
+
+        Args:
+            request: Tool name and arguments
+            structured: Return dict results as structured content with a
+                short text summary, for clients that read structured content;
+                otherwise they are returned as compact JSON text
+        """
         tool_name = request.name
         correlation_id = str(uuid.uuid4())
 
@@ -102,10 +149,27 @@ class ToolRegistry:
                 content=[{"type": "text", "text": error_msg}], isError=True
             )
 
+        # Reject bad arguments before the tool loads config or calls SAP
+        try:
+            arguments = self._validators[tool_name](request.arguments)
+        except ValueError as e:
+            stats = self._execution_stats[tool_name]
+            stats["call_count"] += 1
+            stats["error_count"] += 1
+            stats["last_called"] = time.time()
+            logger.warning(
+                f"Invalid arguments for tool '{tool_name}': {e} "
+                f"[correlation_id: {correlation_id}]"
+            )
+            return ToolCallResponse(
+                content=[{"type": "text", "text": f"Invalid arguments: {e}"}],
+                isError=True,
+            )
+
         # Execute tool with performance tracking
         start_time = time.time()
         try:
-            result = await tool.execute(request.arguments)
+            result = await tool.execute(arguments)
             duration = time.time() - start_time
 
             # Update statistics
@@ -119,10 +183,16 @@ class ToolRegistry:
                 f"[correlation_id: {correlation_id}]"
             )
 
-            result_text = result if isinstance(result, str) else str(result)
+            # Send the data once: as structured content, or as compact JSON
+            if structured and isinstance(result, dict):
+                return ToolCallResponse(
+                    content=[{"type": "text", "text": summarize_result(result)}],
+                    structuredContent=result,
+                    isError=False,
+                )
+            text = result if isinstance(result, str) else dumps(result, default=str)
             return ToolCallResponse(
-                content=[{"type": "text", "text": result_text}],
-                isError=False,
+                content=[{"type": "text", "text": text}], isError=False
             )
 
         except Exception as e:
@@ -130,6 +200,8 @@ class ToolRegistry:
 
             # Update error statistics
             stats = self._execution_stats[tool_name]
+            stats["call_count"] += 1
+            stats["total_duration"] += duration
             stats["error_count"] += 1
             stats["last_called"] = time.time()
 
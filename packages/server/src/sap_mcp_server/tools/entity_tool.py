@@ -4,9 +4,6 @@ import logging
 from typing import Any, Dict
 
 from sap_mcp_server.tools.base import MCPTool
-from sap_mcp_server.core.sap_client import SAPClient
-from sap_mcp_server.config.loader import get_services_config
-from sap_mcp_server.config.settings import get_services_config_path
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +35,9 @@ class SAPGetEntityTool(MCPTool):
                 },
                 "select": {
                     "type": "string",
-                    "description": "Comma-separated list of fields to select (optional)",
+                    "description": "Comma-separated list of fields to select "
+                    "(optional). Defaults to the entity's default fields, without "
+                    "heavyweight binary and long text fields; use '*' for all fields",
                 },
             },
             "required": ["service", "entity_set", "entity_key"],
@@ -47,7 +46,14 @@ class SAPGetEntityTool(MCPTool):
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Retrieve entity by key"""
         try:
-            from sap_mcp_server.config.settings import get_config
+            from sap_mcp_server.config.loader import get_services_config
+            from sap_mcp_server.config.settings import (
+                get_config,
+                get_services_config_path,
+            )
+            from sap_mcp_server.core.client_pool import get_sap_client
+            from sap_mcp_server.core.projection import parse_select, resolve_select
+            from sap_mcp_server.core.schema_validation import validate_request
 
             config = get_config(require_sap=True)
 
@@ -77,34 +83,177 @@ class SAPGetEntityTool(MCPTool):
             # Use service path from configuration
             service_path = service_config.path
 
-            # Parse select fields if provided
-            select_fields = None
-            if "select" in params:
-                select_fields = [f.strip() for f in params["select"].split(",")]
-
-            async with SAPClient(config.sap) as client:
-                # Authenticate first
-                auth_success = await client.authenticate()
-                if not auth_success:
-                    return {"success": False, "error": "Authentication failed"}
-
-                # Get entity by key
-                result = await client.get_entity(
-                    service_path=service_path,
-                    entity_set=params["entity_set"],
-                    entity_key=params["entity_key"],
-                    select_fields=select_fields,
-                )
+            client = await get_sap_client(config.sap)
 
+            # Check the key and fields against the service metadata
+            await validate_request(
+                client,
+                service_config,
+                params["entity_set"],
+                services_config.validation,
+                select=parse_select(params.get("select")),
+                entity_key=params["entity_key"],
+            )
+
+            # Requested fields, or the default projection
+            select_fields = await resolve_select(
+                client,
+                service_config,
+                entity_config,
+                params.get("select"),
+                services_config.projection,
+            )
+
+            # Get entity by key (the client authenticates as needed)
+            result = await client.get_entity(
+                service_path=service_path,
+                entity_set=params["entity_set"],
+                entity_key=params["entity_key"],
+                select_fields=select_fields,
+            )
+
+            return {
+                "success": True,
+                "service": params["service"],
+                "entity_set": params["entity_set"],
+                "entity_key": params["entity_key"],
+                "key_field": entity_config.key_field,
+                "data": result,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get entity: {e}")
+            return {"success": False, "error": str(e)}
+
+
+class SAPGetEntitiesTool(MCPTool):
+    """Tool for retrieving several SAP entities by key in one call"""
+
+    # Keys per call, concurrent SAP requests, and retrievals per $batch
+    MAX_KEYS = 100
+    MAX_PARALLEL = 8
+    BATCH_SIZE = 25
+
+    @property
+    def name(self) -> str:
+        return "sap_get_entities"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Retrieve several entities from SAP OData service by key in one call "
+            "(e.g., a list of OrderIDs). Keys are fetched concurrently and "
+            "per-key errors are reported without failing the other keys"
+        )
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "service": {"type": "string", "description": "OData service name"},
+                "entity_set": {
+                    "type": "string",
+                    "description": "Entity set name (e.g., zsd004Set)",
+                },
+                "entity_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "maxItems": self.MAX_KEYS,
+                    "description": "Entity key values (e.g., ['91000092', '91000093'])",
+                },
+                "select": {
+                    "type": "string",
+                    "description": "Comma-separated list of fields to select "
+                    "(optional). Defaults to the entity's default fields, without "
+                    "heavyweight binary and long text fields; use '*' for all fields",
+                },
+                "use_batch": {
+                    "type": "boolean",
+                    "description": "Send the lookups as OData $batch requests "
+                    "instead of individual GETs (optional, default false)",
+                },
+            },
+            "required": ["service", "entity_set", "entity_keys"],
+        }
+
+    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Retrieve entities by key"""
+        try:
+            from sap_mcp_server.config.loader import get_services_config
+            from sap_mcp_server.config.settings import (
+                get_config,
+                get_services_config_path,
+            )
+            from sap_mcp_server.core.client_pool import get_sap_client
+            from sap_mcp_server.core.projection import resolve_select
+
+            config = get_config(require_sap=True)
+
+            # Load services configuration
+            services_config = get_services_config(get_services_config_path())
+
+            # Validate service exists
+            service_config = services_config.get_service(params["service"])
+            if not service_config:
+                available_services = services_config.list_service_ids()
+                return {
+                    "success": False,
+                    "error": f"Service '{params['service']}' not found in configuration. "
+                    f"Available services: {', '.join(available_services)}",
+                }
+
+            # Validate entity exists in service
+            entity_config = service_config.get_entity(params["entity_set"])
+            if not entity_config:
+                available_entities = [e.name for e in service_config.entities]
                 return {
-                    "success": True,
-                    "service": params["service"],
-                    "entity_set": params["entity_set"],
-                    "entity_key": params["entity_key"],
-                    "key_field": entity_config.key_field,
-                    "data": result,
+                    "success": False,
+                    "error": f"Entity set '{params['entity_set']}' not found in service '{params['service']}'. "
+                    f"Available entities: {', '.join(available_entities)}",
                 }
 
+            entity_keys = list(dict.fromkeys(params["entity_keys"]))
+            if len(entity_keys) > self.MAX_KEYS:
+                return {
+                    "success": False,
+                    "error": f"At most {self.MAX_KEYS} entity keys per call",
+                }
+
+            client = await get_sap_client(config.sap)
+
+            # Requested fields, or the default projection
+            select_fields = await resolve_select(
+                client,
+                service_config,
+                entity_config,
+                params.get("select"),
+                services_config.projection,
+            )
+
+            # Fetch all keys; failures are reported per key
+            entities = await client.get_entities(
+                service_path=service_config.path,
+                entity_set=params["entity_set"],
+                entity_keys=entity_keys,
+                select_fields=select_fields,
+                max_parallel=self.MAX_PARALLEL,
+                batch_size=self.BATCH_SIZE if params.get("use_batch") else None,
+            )
+            failed = sum(1 for entity in entities if not entity["success"])
+
+            return {
+                "success": failed < len(entities),
+                "service": params["service"],
+                "entity_set": params["entity_set"],
+                "key_field": entity_config.key_field,
+                "requested": len(entities),
+                "retrieved": len(entities) - failed,
+                "failed": failed,
+                "entities": entities,
+            }
+
         except Exception as e:
-            logger.error(f"Failed to get entity: {e}")
+            logger.error(f"Failed to get entities: {e}")
             return {"success": False, "error": str(e)}
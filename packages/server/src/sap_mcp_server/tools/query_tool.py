@@ -1,11 +1,9 @@
 """SAP OData Query Tool"""
 
 import logging
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict
 
-from sap_mcp_server.config.loader import get_services_config
-from sap_mcp_server.config.settings import get_config
-from sap_mcp_server.core.sap_client import SAPClient
 from sap_mcp_server.tools.base import MCPTool
 
 logger = logging.getLogger(__name__)
@@ -38,7 +36,9 @@ class SAPQueryTool(MCPTool):
                 },
                 "select": {
                     "type": "string",
-                    "description": "Comma-separated list of fields to select (optional)",
+                    "description": "Comma-separated list of fields to select "
+                    "(optional). Defaults to the entity's default fields, without "
+                    "heavyweight binary and long text fields; use '*' for all fields",
                 },
                 "top": {
                     "type": "integer",
@@ -54,64 +54,34 @@ class SAPQueryTool(MCPTool):
                     "description": "Output format: 'json' returns raw OData response, 'json_compact' removes __metadata and __deferred navigation links for token efficiency (default: json_compact)",
                     "default": "json_compact",
                 },
+                "max_rows": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Maximum rows to return in this response "
+                    "(optional). Larger results are returned in pages with a "
+                    "next_cursor",
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "next_cursor from a previous response, to get "
+                    "the next page of that result without querying SAP again "
+                    "(optional; pass the same service and entity_set)",
+                },
             },
             "required": ["service", "entity_set"],
         }
 
-    def _transform_response(
-        self, data: Dict[str, Any], output_format: str
-    ) -> Dict[str, Any]:
-        """Transform OData response based on requested format.
-
-        Args:
-            data: Raw OData response
-            output_format: 'json' for raw response, 'json_compact' for cleaned response
-
-        Returns:
-            Transformed response with reduced token usage for json_compact format
-        """
-        if output_format == "json":
-            return data
-
-        # json_compact: Remove __metadata and __deferred navigation links
-        results = data.get("d", {}).get("results", [])
-
-        if not results:
-            # Handle single entity response (no results array)
-            if "d" in data and isinstance(data["d"], dict):
-                entity = data["d"]
-                clean_entity = {}
-                for key, value in entity.items():
-                    # Skip metadata
-                    if key == "__metadata":
-                        continue
-                    # Skip deferred navigation links
-                    if isinstance(value, dict) and "__deferred" in value:
-                        continue
-                    clean_entity[key] = value
-                return {"result": clean_entity}
-            return data
-
-        # Process results array
-        clean_results: List[Dict[str, Any]] = []
-        for item in results:
-            clean_item: Dict[str, Any] = {}
-            for key, value in item.items():
-                # Skip metadata
-                if key == "__metadata":
-                    continue
-                # Skip deferred navigation links
-                if isinstance(value, dict) and "__deferred" in value:
-                    continue
-                # Keep expanded navigation properties (they have actual data)
-                clean_item[key] = value
-            clean_results.append(clean_item)
-
-        return {"results": clean_results, "count": len(clean_results)}
-
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute OData query"""
         try:
+            from sap_mcp_server.config.loader import get_services_config
+            from sap_mcp_server.config.settings import get_config
+            from sap_mcp_server.core.client_pool import get_sap_client
+            from sap_mcp_server.core.pagination import result_pager
+            from sap_mcp_server.core.projection import parse_select, resolve_select
+            from sap_mcp_server.core.sap_client import compact_response
+            from sap_mcp_server.core.schema_validation import validate_request
+
             # Get SAP connection configuration
             config = get_config(require_sap=True)
             sap_config = config.sap
@@ -123,26 +93,64 @@ class SAPQueryTool(MCPTool):
                 raise ValueError(f"Service '{params['service']}' not found in configuration")
             service_path = service_info.path
 
+            # Continue a paginated result from the result store
+            output_config = services_config.output
+            if "cursor" in params:
+                return result_pager.next_page(
+                    params["cursor"],
+                    output_config,
+                    params["service"],
+                    params["entity_set"],
+                    max_rows=params.get("max_rows"),
+                )
+
+            client = await get_sap_client(sap_config)
+
+            # Check names and literal types against the service metadata
+            await validate_request(
+                client,
+                service_info,
+                params["entity_set"],
+                services_config.validation,
+                select=parse_select(params.get("select")),
+                filter_expr=params.get("filter"),
+            )
+
             # Build query parameters
+            entity_config = service_info.get_entity(params["entity_set"])
             filters = {"$filter": params["filter"]} if "filter" in params else None
-            select_fields = params["select"].split(",") if "select" in params else None
+            select_fields = await resolve_select(
+                client,
+                service_info,
+                entity_config,
+                params.get("select"),
+                services_config.projection,
+            )
             top = params.get("top")
             skip = params.get("skip")
             output_format = params.get("format", "json_compact")
 
-            # Execute query using SAPClient
-            async with SAPClient(config=sap_config) as client:
-                result = await client.query_entity_set(
-                    service_path=service_path,
-                    entity_set=params["entity_set"],
-                    filters=filters,
-                    select_fields=select_fields,
-                    top=top,
-                    skip=skip,
-                )
-
-            # Transform response based on format
-            return self._transform_response(result, output_format)
+            # Execute query using the shared SAPClient
+            # The response is decoded and compacted in one step, off the
+            # event loop for large responses
+            result = await client.query_entity_set(
+                service_path=service_path,
+                entity_set=params["entity_set"],
+                filters=filters,
+                select_fields=select_fields,
+                top=top,
+                skip=skip,
+                transform=partial(compact_response, output_format=output_format),
+            )
+
+            # Return oversized results in pages
+            return result_pager.paginate(
+                result,
+                output_config,
+                params["service"],
+                params["entity_set"],
+                max_rows=params.get("max_rows"),
+            )
 
         except Exception as e:
             logger.error(f"Query failed: {e}")
@@ -4,8 +4,6 @@ import logging
 from typing import Any, Dict
 
 from sap_mcp_server.tools.base import MCPTool
-from sap_mcp_server.config.loader import get_services_config
-from sap_mcp_server.config.settings import get_services_config_path
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +26,9 @@ class SAPListServicesTool(MCPTool):
     async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """List available services from configuration"""
         try:
+            from sap_mcp_server.config.loader import get_services_config
+            from sap_mcp_server.config.settings import get_services_config_path
+
             # Load services configuration
             services_config = get_services_config(get_services_config_path())
 
@@ -1,19 +1,31 @@
 """Stdio-based MCP Server implementation"""
 
 import asyncio
+import importlib
 import logging
+import sys
 from pathlib import Path
+from types import ModuleType
 
 from dotenv import load_dotenv
 from mcp import types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+from sap_mcp_server.config.loader import set_reload_interval
+from sap_mcp_server.core.offload import response_decoder
+from sap_mcp_server.protocol.schemas import ToolCallRequest, ToolInfo
 from sap_mcp_server.tools import tool_registry
-from sap_mcp_server.protocol.schemas import ToolCallRequest
+from sap_mcp_server.utils.serialization import set_backend
 
 logger = logging.getLogger(__name__)
 
+# Loaded on first use: it pulls in aiohttp and the SAP client
+CLIENT_POOL_MODULE = "sap_mcp_server.core.client_pool"
+
+# First MCP protocol revision with structured tool results
+STRUCTURED_CONTENT_VERSION = "2025-06-18"
+
 
 def find_env_file() -> Path | None:
     """Find .env.server file in multiple possible locations
@@ -31,9 +43,9 @@ def find_env_file() -> Path | None:
     project_root = Path(__file__).parent.parent.parent.parent.parent.parent
 
     env_paths = [
-        Path.cwd() / ".env.server",              # Current working directory (set by MCP client)
-        project_root / ".env.server",            # Project root (calculated from file location)
-        Path.home() / ".env.server",             # User home directory (fallback)
+        Path.cwd() / ".env.server",  # Current working directory (set by MCP client)
+        project_root / ".env.server",  # Project root (calculated from file location)
+        Path.home() / ".env.server",  # User home directory (fallback)
     ]
 
     for path in env_paths:
@@ -58,8 +70,55 @@ def find_env_file() -> Path | None:
     return None
 
 
+async def import_client_stack() -> ModuleType:
+    """Import the SAP client stack in a worker thread
+
+    The MCP handshake is answered on the event loop while it loads. Tool
+    calls, which import the same modules, wait for this import to finish
+    (see ``main``): two threads importing one module graph at the same time
+    can deadlock in the import system's per-module locks.
+    """
+    return await asyncio.to_thread(importlib.import_module, CLIENT_POOL_MODULE)
+
+
+async def warm_up_sap_client(client_stack: "asyncio.Task[ModuleType]") -> None:
+    """Open the pooled SAP connection and log in before the first tool call"""
+    from sap_mcp_server.config.settings import get_config
+
+    try:
+        config = get_config(require_sap=True)
+    except Exception as e:
+        logger.info(f"Skipping SAP client warm-up, no SAP configuration: {e}")
+        return
+
+    try:
+        client_pool_module = await client_stack
+        await client_pool_module.client_pool.warm_up(config.sap)
+        logger.info("SAP client warm-up completed")
+    except Exception as e:
+        logger.warning(f"SAP client warm-up failed: {e}")
+
+
+def report_statistics() -> None:
+    """Log connection pool and response decoding statistics at debug level"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    client_pool_module = sys.modules.get(CLIENT_POOL_MODULE)
+    if client_pool_module is not None:
+        client_pool_module.client_pool.log_statistics()
+    logger.debug(f"Response decoding: {response_decoder.get_statistics()}")
+
+
+async def log_statistics(interval: float) -> None:
+    """Report statistics every ``interval`` seconds"""
+    while True:
+        await asyncio.sleep(interval)
+        report_statistics()
+
+
 async def main() -> None:
     """Main entry point for stdio MCP server"""
+    from sap_mcp_server.config.settings import MCPServerConfig
 
     # Load environment variables
     env_path = find_env_file()
@@ -69,44 +128,106 @@ async def main() -> None:
     else:
         logger.warning("Starting server without environment file")
 
+    # Size the worker pool that decodes large SAP responses
+    server_config = MCPServerConfig()
+    response_decoder.configure(
+        threshold=server_config.decode_offload_threshold,
+        max_workers=server_config.max_workers,
+        executor=server_config.decode_executor,
+    )
+    try:
+        logger.info(f"JSON backend: {set_backend(server_config.json_backend)}")
+    except ValueError as e:
+        logger.warning(f"{e}; keeping the default JSON backend")
+    set_reload_interval(server_config.services_reload_interval)
+
+    # Load the SAP client stack in the background while the handshake runs
+    client_stack = asyncio.create_task(import_client_stack())
+
     # Create MCP server
     server = Server("sap-mcp")
 
+    # MCP tool definitions, converted once per registry catalog
+    converted_catalog: tuple[ToolInfo, ...] | None = None
+    tools: list[types.Tool] = []
+
     @server.list_tools()
     async def list_tools() -> list[types.Tool]:
         """List all available tools"""
-        tool_list = tool_registry.list_tools()
-        return [
-            types.Tool(
-                name=tool.name,
-                description=tool.description,
-                inputSchema=tool.inputSchema,
-            )
-            for tool in tool_list
-        ]
-
-    @server.call_tool()
-    async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+        nonlocal converted_catalog, tools
+        catalog = tool_registry.catalog
+        if converted_catalog is not catalog:
+            tools = [
+                types.Tool(
+                    name=tool.name,
+                    description=tool.description,
+                    inputSchema=tool.inputSchema,
+                )
+                for tool in catalog
+            ]
+            converted_catalog = catalog
+        return tools
+
+    # Arguments are validated by the tool registry's precompiled validators
+    @server.call_tool(validate_input=False)
+    async def call_tool(name: str, arguments: dict) -> types.CallToolResult:
         """Call a tool with the given arguments"""
+        # Tools import the SAP client stack on the event loop; never while
+        # the background import is still running
+        await asyncio.wait([client_stack])
         try:
             # Create tool call request
             request = ToolCallRequest(name=name, arguments=arguments)
 
-            # Call the tool
-            result = await tool_registry.call_tool(request)
+            # Clients of older protocol revisions only read the text content
+            client_params = server.request_context.session.client_params
+            structured = client_params is not None and (
+                str(client_params.protocolVersion) >= STRUCTURED_CONTENT_VERSION
+            )
 
-            # Return result as text content
-            return [types.TextContent(type="text", text=str(result.content))]
+            # Call the tool
+            result = await tool_registry.call_tool(request, structured=structured)
+
+            # Pass the serialized result through as-is
+            return types.CallToolResult(
+                content=[
+                    types.TextContent(type="text", text=item["text"])
+                    for item in result.content
+                ],
+                structuredContent=result.structuredContent,
+                isError=result.isError,
+            )
         except Exception as e:
             logger.error(f"Tool call failed: {e}", exc_info=True)
-            return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+            return types.CallToolResult(
+                content=[types.TextContent(type="text", text=f"Error: {str(e)}")],
+                isError=True,
+            )
+
+    # Warm up the shared SAP client without delaying the MCP handshake
+    warm_up_task = asyncio.create_task(warm_up_sap_client(client_stack))
+    stats_task = (
+        asyncio.create_task(log_statistics(server_config.stats_log_interval))
+        if server_config.stats_log_interval > 0
+        else None
+    )
 
     # Run the server
     logger.info("Starting SAP MCP stdio server...")
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        warm_up_task.cancel()
+        client_stack.cancel()
+        if stats_task is not None:
+            stats_task.cancel()
+        report_statistics()
+        if CLIENT_POOL_MODULE in sys.modules:
+            await sys.modules[CLIENT_POOL_MODULE].client_pool.close()
+        response_decoder.shutdown()
 
 
 def cli_main() -> None:
@@ -114,7 +235,7 @@ def cli_main() -> None:
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
     # Run async main
@@ -1,14 +1,10 @@
 """Utility modules for SAP MCP Server"""
 
-from .logger import (
-    get_default_logger,
-    get_logger,
-    log_error_with_context,
-    log_function_call,
-    log_performance,
-    setup_logging,
-)
+from typing import Any
+
+from .serialization import dumps, loads, set_backend
 from .validators import (
+    compile_tool_validator,
     sanitize_input,
     validate_entity_key,
     validate_field_name,
@@ -29,7 +25,12 @@ __all__ = [
     "log_function_call",
     "log_performance",
     "setup_logging",
+    # Serialization
+    "dumps",
+    "loads",
+    "set_backend",
     # Validators
+    "compile_tool_validator",
     "sanitize_input",
     "validate_entity_key",
     "validate_field_name",
@@ -41,3 +42,22 @@ __all__ = [
     "validate_tool_arguments",
     "validate_url",
 ]
+
+# Logger helpers are imported on first use: structlog is slow to import and
+# not needed to start the server
+_LOGGER_EXPORTS = {
+    "get_default_logger",
+    "get_logger",
+    "log_error_with_context",
+    "log_function_call",
+    "log_performance",
+    "setup_logging",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LOGGER_EXPORTS:
+        from . import logger
+
+        return getattr(logger, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
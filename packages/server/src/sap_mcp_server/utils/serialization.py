@@ -0,0 +1,142 @@
+"""JSON serialization with the fastest available backend
+
+Uses orjson or msgspec when installed (``pip install sap-mcp-server[fast]``)
+and falls back to the standard library. All backends produce compact,
+UTF-8 (not ASCII-escaped) JSON and raise ValueError for invalid documents.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Decoder = Callable[[Union[str, bytes]], Any]
+Encoder = Callable[[Any, Optional[Callable[[Any], Any]]], str]
+
+# Preference order for MCP_JSON_BACKEND=auto
+BACKEND_ORDER = ("orjson", "msgspec", "json")
+
+
+def _stdlib_backend() -> Tuple[Decoder, Encoder]:
+    def encode(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, default=default
+        )
+
+    return json.loads, encode
+
+
+def _orjson_backend() -> Tuple[Decoder, Encoder]:
+    import orjson
+
+    def encode(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return orjson.dumps(obj, default=default).decode("utf-8")
+
+    return orjson.loads, encode
+
+
+def _msgspec_backend() -> Tuple[Decoder, Encoder]:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def decode(data: Union[str, bytes]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def encode(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        if default is not None:
+            return msgspec.json.encode(obj, enc_hook=default).decode("utf-8")
+        return encoder.encode(obj).decode("utf-8")
+
+    return decode, encode
+
+
+_BACKENDS: Dict[str, Callable[[], Tuple[Decoder, Encoder]]] = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "json": _stdlib_backend,
+}
+
+# Standard library until set_backend() selects the configured backend
+_loads: Decoder
+_dumps: Encoder
+_loads, _dumps = _stdlib_backend()
+backend_name = "json"
+
+
+def available_backends() -> Dict[str, Tuple[Decoder, Encoder]]:
+    """Get the importable backends in preference order"""
+    backends = {}
+    for name in BACKEND_ORDER:
+        try:
+            backends[name] = _BACKENDS[name]()
+        except ImportError:
+            continue
+    return backends
+
+
+def set_backend(name: str = "auto") -> str:
+    """Select the JSON backend
+
+    Args:
+        name: "orjson", "msgspec", "json", or "auto" for the fastest available
+
+    Returns:
+        Name of the selected backend
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global _loads, _dumps, backend_name
+
+    name = name.strip().lower()
+    if name == "auto":
+        name = next(iter(available_backends()))
+    elif name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend '{name}'. Use one of: auto, "
+            + ", ".join(BACKEND_ORDER)
+        )
+
+    try:
+        _loads, _dumps = _BACKENDS[name]()
+    except ImportError as e:
+        raise ValueError(f"JSON backend '{name}' is not installed: {e}")
+    backend_name = name
+    logger.debug(f"Using JSON backend: {name}")
+    return name
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    return _loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode an object as compact JSON
+
+    Args:
+        obj: Object to encode
+        default: Called for objects the backend cannot encode natively
+
+    Raises:
+        TypeError: If an object cannot be encoded
+    """
+    return _dumps(obj, default)
+
+
+try:
+    set_backend(os.getenv("MCP_JSON_BACKEND", "auto"))
+except ValueError as e:
+    logger.warning(f"{e}; falling back to the fastest available JSON backend")
+    set_backend("auto")
@@ -1,11 +1,14 @@
 """Input validation helpers for SAP MCP Server"""
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
 from pydantic import ValidationError
 
+from sap_mcp_server.core.exceptions import SAPValidationError
+from sap_mcp_server.core.odata_filter import parse_filter
+
 
 def validate_odata_filter(filter_expr: str) -> bool:
     """Validate OData filter expression syntax
@@ -14,7 +17,7 @@ def validate_odata_filter(filter_expr: str) -> bool:
         filter_expr: OData filter expression (e.g., "OrderID eq '12345'")
 
     Returns:
-        True if valid, False otherwise
+        True if the expression parses, False otherwise
 
     Example:
         >>> validate_odata_filter("OrderID eq '12345'")
@@ -22,21 +25,11 @@ def validate_odata_filter(filter_expr: str) -> bool:
         >>> validate_odata_filter("OrderID = 12345")  # Invalid syntax
         False
     """
-    # Basic validation - check for common OData operators
-    odata_operators = [
-        r"\beq\b",  # equals
-        r"\bne\b",  # not equals
-        r"\bgt\b",  # greater than
-        r"\bge\b",  # greater than or equal
-        r"\blt\b",  # less than
-        r"\ble\b",  # less than or equal
-        r"\band\b",  # logical and
-        r"\bor\b",  # logical or
-        r"\bnot\b",  # logical not
-    ]
-
-    pattern = "|".join(odata_operators)
-    return bool(re.search(pattern, filter_expr, re.IGNORECASE))
+    try:
+        parse_filter(filter_expr)
+    except SAPValidationError:
+        return False
+    return True
 
 
 def validate_entity_key(key: str) -> bool:
@@ -264,12 +257,151 @@ def sanitize_input(value: str, max_length: int = 1000) -> str:
     return value
 
 
+# Python types accepted for each JSON schema type
+_JSON_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+_TYPE_NAMES = {
+    "string": "a string",
+    "integer": "an integer",
+    "number": "a number",
+    "boolean": "a boolean",
+    "array": "an array",
+    "object": "an object",
+}
+
+ArgumentValidator = Callable[[Dict[str, Any]], Dict[str, Any]]
+_Check = Callable[[Any], None]
+
+
+def _type_check(label: str, expected: str) -> _Check:
+    types = _JSON_TYPES[expected]
+    # bool is an int subclass but not a JSON number
+    allow_bool = expected == "boolean"
+    message = f"{label} must be {_TYPE_NAMES[expected]}"
+
+    def check(value: Any) -> None:
+        if not isinstance(value, types) or (
+            isinstance(value, bool) and not allow_bool
+        ):
+            raise ValueError(message)
+
+    return check
+
+
+def _property_checks(name: str, spec: Dict[str, Any]) -> List[_Check]:
+    """Build the checks for one property of a tool input schema"""
+    label = f"Argument '{name}'"
+    checks: List[_Check] = []
+
+    expected = spec.get("type")
+    if expected in _JSON_TYPES:
+        checks.append(_type_check(label, expected))
+
+    if "enum" in spec:
+        allowed = list(spec["enum"])
+        message = f"{label} must be one of: {', '.join(map(str, allowed))}"
+
+        def check_enum(value: Any) -> None:
+            if value not in allowed:
+                raise ValueError(message)
+
+        checks.append(check_enum)
+
+    minimum, maximum = spec.get("minimum"), spec.get("maximum")
+    if minimum is not None or maximum is not None:
+
+        def check_range(value: Any) -> None:
+            if not isinstance(value, (int, float)):
+                return
+            if minimum is not None and value < minimum:
+                raise ValueError(f"{label} must be at least {minimum}")
+            if maximum is not None and value > maximum:
+                raise ValueError(f"{label} must be at most {maximum}")
+
+        checks.append(check_range)
+
+    for low_key, high_key, unit in (
+        ("minLength", "maxLength", "characters"),
+        ("minItems", "maxItems", "items"),
+    ):
+        low, high = spec.get(low_key), spec.get(high_key)
+        if low is None and high is None:
+            continue
+
+        def check_size(value: Any, low=low, high=high, unit=unit) -> None:
+            if not isinstance(value, (str, list)):
+                return
+            if low is not None and len(value) < low:
+                raise ValueError(f"{label} must have at least {low} {unit}")
+            if high is not None and len(value) > high:
+                raise ValueError(f"{label} must have at most {high} {unit}")
+
+        checks.append(check_size)
+
+    item_type = spec.get("items", {}).get("type")
+    if expected == "array" and item_type in _JSON_TYPES:
+        check_item = _type_check(f"Items of {label.lower()}", item_type)
+
+        def check_items(value: Any) -> None:
+            for item in value:
+                check_item(item)
+
+        checks.append(check_items)
+
+    return checks
+
+
+def compile_tool_validator(schema: Dict[str, Any]) -> ArgumentValidator:
+    """Compile a tool input schema into a validation function
+
+    The schema is walked once; the returned function only runs the checks
+    that apply to the arguments given. Supports the JSON schema keywords
+    used by tool schemas: type, required, enum, minimum/maximum,
+    minLength/maxLength, minItems/maxItems and the type of array items.
+
+    Args:
+        schema: JSON schema of the tool's arguments
+
+    Returns:
+        Function that returns the arguments or raises ValueError
+    """
+    required = tuple(schema.get("required", []))
+    checks: Dict[str, List[_Check]] = {}
+    for name, spec in schema.get("properties", {}).items():
+        property_checks = _property_checks(name, spec)
+        if property_checks:
+            checks[name] = property_checks
+
+    def validate(arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(arguments, dict):
+            raise ValueError("Arguments must be an object")
+        for field in required:
+            if field not in arguments:
+                raise ValueError(f"Missing required argument: {field}")
+        for key, value in arguments.items():
+            for check in checks.get(key, ()):
+                check(value)
+        return arguments
+
+    return validate
+
+
 def validate_tool_arguments(
     arguments: Dict[str, Any],
     schema: Dict[str, Any],
 ) -> Dict[str, Any]:
     """Validate tool arguments against JSON schema
 
+    Compiles the schema on every call; compile it once with
+    compile_tool_validator() to validate repeatedly.
+
     Args:
         arguments: Tool arguments to validate
         schema: JSON schema defining required structure
@@ -289,20 +421,4 @@ def validate_tool_arguments(
         >>> validate_tool_arguments({"service": "Z_ORDER_SRV"}, schema)
         {'service': 'Z_ORDER_SRV'}
     """
-    # Check required fields
-    required = schema.get("required", [])
-    for field in required:
-        if field not in arguments:
-            raise ValueError(f"Missing required argument: {field}")
-
-    # Basic type checking
-    properties = schema.get("properties", {})
-    for key, value in arguments.items():
-        if key in properties:
-            expected_type = properties[key].get("type")
-            if expected_type == "string" and not isinstance(value, str):
-                raise ValueError(f"Argument '{key}' must be a string")
-            elif expected_type == "integer" and not isinstance(value, int):
-                raise ValueError(f"Argument '{key}' must be an integer")
-
-    return arguments
+    return compile_tool_validator(schema)(arguments)
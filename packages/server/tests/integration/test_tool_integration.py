@@ -13,18 +13,19 @@ class TestToolRegistration:
         """Test that tools are automatically registered"""
         tool_names = tool_registry.get_tool_names()
 
-        # Should have all 4 SAP tools registered
+        # Should have all 5 SAP tools registered
         assert "sap_authenticate" in tool_names
         assert "sap_query" in tool_names
         assert "sap_get_entity" in tool_names
+        assert "sap_get_entities" in tool_names
         assert "sap_list_services" in tool_names
-        assert len(tool_names) == 4
+        assert len(tool_names) == 5
 
     def test_tool_info_available(self):
         """Test that tool info is available"""
         tools = tool_registry.list_tools()
 
-        assert len(tools) == 4
+        assert len(tools) == 5
 
         # Check that each tool has required fields
         for tool in tools:
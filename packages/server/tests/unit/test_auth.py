@@ -0,0 +1,228 @@
+"""Unit tests for SAP authentication handling"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from sap_mcp_server.core.auth import (
+    AuthToken,
+    SAPAuthenticator,
+    TokenRefresher,
+    TokenStore,
+)
+
+
+def make_token(csrf_token: str = "csrf", minutes: int = 30) -> AuthToken:
+    """Create a token expiring after the given number of minutes"""
+    return AuthToken(
+        csrf_token=csrf_token,
+        cookies={"SAP_SESSIONID": "session"},
+        expires_at=datetime.utcnow() + timedelta(minutes=minutes),
+    )
+
+
+class CountingAuthenticator(SAPAuthenticator):
+    """Authenticator that counts logins instead of calling SAP"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.login_count = 0
+
+    async def _authenticate(self) -> AuthToken:
+        self.login_count += 1
+        await asyncio.sleep(0.01)
+        return make_token(f"csrf-{self.login_count}")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestTokenStore:
+    """Tests for the shared token store"""
+
+    async def test_concurrent_callers_share_one_login(self, sap_config):
+        """Test that cold concurrent callers wait on a single login"""
+        store = TokenStore()
+        authenticator = CountingAuthenticator(sap_config, store=store)
+
+        tokens = await asyncio.gather(
+            *(authenticator.get_valid_token() for _ in range(10))
+        )
+
+        assert authenticator.login_count == 1
+        assert all(token is tokens[0] for token in tokens)
+
+    async def test_token_shared_across_authenticators(self, sap_config):
+        """Test that authenticators for the same connection share tokens"""
+        store = TokenStore()
+        first = CountingAuthenticator(sap_config, store=store)
+        second = CountingAuthenticator(sap_config, store=store)
+
+        token1 = await first.get_valid_token()
+        token2 = await second.get_valid_token()
+
+        assert token1 is token2
+        assert first.login_count == 1
+        assert second.login_count == 0
+
+    async def test_expired_token_triggers_login(self, sap_config):
+        """Test that tokens are only reused until they expire"""
+        store = TokenStore()
+        authenticator = CountingAuthenticator(sap_config, store=store)
+        store.put(authenticator._token_key, make_token("old", minutes=-1))
+
+        token = await authenticator.get_valid_token()
+
+        assert token.csrf_token == "csrf-1"
+        assert authenticator.login_count == 1
+
+    async def test_stale_invalidation_keeps_newer_token(self, sap_config):
+        """Test that rejecting an old token does not drop a newer one"""
+        store = TokenStore()
+        authenticator = CountingAuthenticator(sap_config, store=store)
+        old_token = make_token("old")
+        new_token = make_token("new")
+        store.put(authenticator._token_key, new_token)
+
+        await authenticator.invalidate_token(old_token)
+        assert store.get(authenticator._token_key) is new_token
+
+        await authenticator.invalidate_token(new_token)
+        assert store.get(authenticator._token_key) is None
+
+    async def test_failed_login_is_not_cached(self, sap_config):
+        """Test that a failed login lets the next caller retry"""
+        store = TokenStore()
+
+        async def failing_login() -> AuthToken:
+            raise RuntimeError("login failed")
+
+        key = ("host", 443, "100", "user")
+        with pytest.raises(RuntimeError):
+            await store.get_or_authenticate(key, failing_login)
+
+        token = make_token()
+
+        async def working_login() -> AuthToken:
+            return token
+
+        assert await store.get_or_authenticate(key, working_login) is token
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestTokenRefresher:
+    """Tests for background token refresh"""
+
+    async def test_refreshes_ahead_of_expiry(self, sap_config):
+        """Test that a token inside the lead time is renewed in the background"""
+        store = TokenStore()
+        authenticator = CountingAuthenticator(sap_config, store=store)
+        old_token = make_token("old", minutes=1)
+        store.put(authenticator._token_key, old_token)
+
+        refresher = TokenRefresher(authenticator, lead_time=120, jitter=0)
+        refresher.start()
+        try:
+            for _ in range(50):
+                if refresher.refresh_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await refresher.stop()
+
+        assert refresher.refresh_count >= 1
+        assert store.get(authenticator._token_key) is not old_token
+
+    async def test_waits_for_first_token(self, sap_config):
+        """Test that the refresher does not log in on its own"""
+        authenticator = CountingAuthenticator(sap_config, store=TokenStore())
+        refresher = TokenRefresher(authenticator, jitter=0)
+
+        assert refresher.next_refresh_delay() is None
+
+    async def test_short_lifetime_does_not_loop(self, sap_config):
+        """Test that tokens issued inside the lead time are not renewed in a loop"""
+        store = TokenStore()
+        authenticator = CountingAuthenticator(sap_config, store=store)
+        store.put(authenticator._token_key, make_token("old", minutes=1))
+
+        # Every new token expires within the lead time
+        refresher = TokenRefresher(
+            authenticator, lead_time=3600, jitter=0, retry_interval=60
+        )
+        refresher.start()
+        try:
+            for _ in range(20):
+                await asyncio.sleep(0.01)
+        finally:
+            await refresher.stop()
+
+        assert authenticator.login_count == 1
+        assert refresher.next_refresh_delay() == 60
+
+    async def test_lifetime_must_exceed_refresh_window(self, sap_config):
+        """Test that a lifetime within lead time plus jitter is rejected"""
+        with pytest.raises(ValueError, match="lead time plus jitter"):
+            sap_config.model_validate(
+                {
+                    **sap_config.model_dump(),
+                    "token_lifetime": 150,
+                    "token_refresh_lead_time": 120,
+                    "token_refresh_jitter": 30,
+                }
+            )
+
+    async def test_failure_does_not_drop_current_token(self, sap_config):
+        """Test that refresh failures are reported, not raised"""
+        store = TokenStore()
+
+        class FailingAuthenticator(SAPAuthenticator):
+            async def _authenticate(self) -> AuthToken:
+                raise RuntimeError("SAP unavailable")
+
+        authenticator = FailingAuthenticator(sap_config, store=store)
+        token = make_token(minutes=1)
+        store.put(authenticator._token_key, token)
+
+        refresher = TokenRefresher(authenticator, lead_time=120, jitter=0)
+        refresher.start()
+        try:
+            for _ in range(50):
+                if refresher.failure_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await refresher.stop()
+
+        assert refresher.failure_count >= 1
+        assert refresher.get_status()["last_error"] == "SAP unavailable"
+        assert store.get(authenticator._token_key) is token
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_login_runs_on_provided_session(sap_config):
+    """Test that login uses the pooled session instead of a throwaway one"""
+    pooled_session = object()
+    seen_sessions = []
+
+    async def provide_session():
+        return pooled_session
+
+    class RecordingAuthenticator(SAPAuthenticator):
+        async def _get_csrf_token(self, session):
+            seen_sessions.append(session)
+            return "csrf", {"SAP_SESSIONID": "session"}
+
+        async def _authenticate_session(self, session, csrf_token):
+            seen_sessions.append(session)
+
+    authenticator = RecordingAuthenticator(
+        sap_config, store=TokenStore(), session_provider=provide_session
+    )
+
+    token = await authenticator.get_valid_token()
+
+    assert token.csrf_token == "csrf"
+    assert seen_sessions == [pooled_session, pooled_session]
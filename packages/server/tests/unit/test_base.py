@@ -1,5 +1,6 @@
 """Unit tests for tool base classes and registry"""
 
+import json
 from typing import Any, Dict
 from unittest.mock import AsyncMock
 
@@ -159,6 +160,76 @@ class TestToolRegistry:
         assert len(response.content) == 1
         assert "success" in response.content[0]["text"]
 
+    @pytest.mark.asyncio
+    async def test_call_tool_returns_json(self, tool_registry):
+        """Test that dict results are serialized once as compact JSON"""
+        tool_registry.register(MockTool(name="test_tool"))
+
+        response = await tool_registry.call_tool(
+            ToolCallRequest(name="test_tool", arguments={"param1": "Ä"})
+        )
+
+        text = response.content[0]["text"]
+        assert text == '{"success":true,"params":{"param1":"Ä"}}'
+        assert response.structuredContent is None
+
+    @pytest.mark.asyncio
+    async def test_call_tool_structured_result_is_sent_once(self, tool_registry):
+        """Test that structured results carry only a summary as text"""
+        tool_registry.register(MockTool(name="test_tool"))
+
+        response = await tool_registry.call_tool(
+            ToolCallRequest(name="test_tool", arguments={"param1": "Ä"}),
+            structured=True,
+        )
+
+        assert response.structuredContent == {
+            "success": True,
+            "params": {"param1": "Ä"},
+        }
+        assert json.loads(response.content[0]["text"]) == {"success": True}
+
+    @pytest.mark.asyncio
+    async def test_call_tool_string_result(self, tool_registry):
+        """Test that string results are passed through unchanged"""
+        tool = MockTool(name="text_tool")
+        tool.execute = AsyncMock(return_value="plain text")
+        tool_registry.register(tool)
+
+        response = await tool_registry.call_tool(ToolCallRequest(name="text_tool"))
+
+        assert response.content[0]["text"] == "plain text"
+        assert response.structuredContent is None
+
+    def test_catalog_is_built_once(self, tool_registry):
+        """Test that listing tools reuses the catalog until tools change"""
+        tool_registry.register(MockTool(name="tool1"))
+
+        catalog = tool_registry.catalog
+        assert tool_registry.catalog is catalog
+        assert tool_registry.list_tools()[0] is catalog[0]
+
+        tool_registry.register(MockTool(name="tool2"))
+        assert [t.name for t in tool_registry.catalog] == ["tool1", "tool2"]
+        tool_registry.unregister("tool1")
+        assert [t.name for t in tool_registry.catalog] == ["tool2"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_rejected(self, tool_registry):
+        """Test that arguments are validated before the tool executes"""
+        tool = MockTool(name="test_tool")
+        tool.execute = AsyncMock()
+        tool_registry.register(tool)
+
+        response = await tool_registry.call_tool(
+            ToolCallRequest(name="test_tool", arguments={"param1": 42})
+        )
+
+        assert response.isError is True
+        assert "'param1' must be a string" in response.content[0]["text"]
+        tool.execute.assert_not_called()
+        assert tool_registry.get_statistics()["test_tool"]["error_count"] == 1
+
     @pytest.mark.asyncio
     async def test_call_nonexistent_tool(self, tool_registry):
         """Test calling nonexistent tool"""
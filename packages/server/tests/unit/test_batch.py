@@ -0,0 +1,121 @@
+"""Unit tests for OData $batch building and parsing"""
+
+import pytest
+
+from sap_mcp_server.core.batch import BatchRequest, parse_batch_response
+from sap_mcp_server.core.exceptions import SAPValidationError
+
+SAP_BATCH_RESPONSE = "\r\n".join(
+    [
+        "--batchresp_1",
+        "Content-Type: application/http",
+        "Content-Transfer-Encoding: binary",
+        "",
+        "HTTP/1.1 200 OK",
+        "Content-Type: application/json",
+        "Content-Length: 28",
+        "",
+        '{"d": {"Vbeln": "91000092"}}',
+        "--batchresp_1",
+        "Content-Type: multipart/mixed; boundary=changesetresp_1",
+        "",
+        "--changesetresp_1",
+        "Content-Type: application/http",
+        "Content-Transfer-Encoding: binary",
+        "",
+        "HTTP/1.1 204 No Content",
+        "",
+        "",
+        "--changesetresp_1",
+        "Content-Type: application/http",
+        "Content-Transfer-Encoding: binary",
+        "",
+        "HTTP/1.1 201 Created",
+        "Content-Type: application/json",
+        "",
+        '{"d": {"Vbeln": "91000093"}}',
+        "--changesetresp_1--",
+        "",
+        "--batchresp_1",
+        "Content-Type: application/http",
+        "Content-Transfer-Encoding: binary",
+        "",
+        "HTTP/1.1 400 Bad Request",
+        "Content-Type: application/json",
+        "",
+        '{"error": {"message": {"value": "Invalid key"}}}',
+        "--batchresp_1--",
+        "",
+    ]
+)
+
+
+def build_sample_batch() -> BatchRequest:
+    """Batch with a retrieval and two changesets"""
+    batch = BatchRequest(boundary="batch_1")
+    batch.get("zsd004Set('91000092')", params={"$format": "json"})
+    with batch.changeset() as changeset:
+        changeset.update("zsd004Set('91000092')", {"Netwr": "10.00"})
+        changeset.create("zsd004Set", {"Vbeln": "91000093"})
+    with batch.changeset() as changeset:
+        changeset.delete("zsd004Set('bad')")
+    return batch
+
+
+@pytest.mark.unit
+class TestBatchRequest:
+    """Tests for the $batch request builder"""
+
+    def test_build_multipart_body(self):
+        """Test the multipart/mixed layout of a built batch"""
+        content_type, body = build_sample_batch().build()
+
+        assert content_type == "multipart/mixed; boundary=batch_1"
+        assert body.startswith("--batch_1\r\n")
+        assert body.rstrip().endswith("--batch_1--")
+        assert "GET zsd004Set('91000092')?$format=json HTTP/1.1" in body
+        assert "PUT zsd004Set('91000092') HTTP/1.1" in body
+        assert "POST zsd004Set HTTP/1.1" in body
+        assert body.count("Content-Type: multipart/mixed; boundary=changeset_") == 2
+        assert "Content-Length: 17\r\n" in body
+
+    def test_empty_batch_rejected(self):
+        """Test that an empty batch cannot be built"""
+        with pytest.raises(SAPValidationError):
+            BatchRequest().build()
+
+    def test_resolve_maps_responses_to_operations(self):
+        """Test that each operation receives its own response"""
+        batch = build_sample_batch()
+        get_op, update_op, create_op, delete_op = batch.operations
+
+        batch.resolve("multipart/mixed; boundary=batchresp_1", SAP_BATCH_RESPONSE)
+
+        assert get_op.response.status == 200
+        assert get_op.response.json() == {"d": {"Vbeln": "91000092"}}
+        assert update_op.response.status == 204
+        assert update_op.response.json() is None
+        assert create_op.response.status == 201
+        assert create_op.response.json()["d"]["Vbeln"] == "91000093"
+        # A failed changeset answers every operation in it with the error
+        assert delete_op.response.status == 400
+        assert not delete_op.response.ok
+
+    def test_resolve_rejects_mismatched_response(self):
+        """Test that a response with the wrong number of parts is rejected"""
+        batch = BatchRequest()
+        batch.get("zsd004Set('1')")
+
+        with pytest.raises(SAPValidationError):
+            batch.resolve("multipart/mixed; boundary=batchresp_1", SAP_BATCH_RESPONSE)
+
+
+@pytest.mark.unit
+def test_parse_without_content_type_uses_body_boundary():
+    """Test boundary detection from the first delimiter line"""
+    parts = parse_batch_response(None, SAP_BATCH_RESPONSE)
+
+    assert len(parts) == 3
+    assert isinstance(parts[1], list)
+    assert [r.status for r in parts[1]] == [204, 201]
+    assert parts[2].reason == "Bad Request"
@@ -0,0 +1,144 @@
+"""Unit tests for the TTL + LRU response cache"""
+
+import pytest
+
+from sap_mcp_server.config.schemas import ServicesYAMLConfig
+from sap_mcp_server.core.cache import ResponseCache, make_cache_key
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Tests for ResponseCache"""
+
+    def test_entries_expire_after_ttl(self):
+        """Test that an entry is served until its TTL elapses"""
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        cache.put("k", "v", ttl=10)
+
+        clock.now = 9.9
+        assert cache.get("k") == "v"
+        clock.now = 10.0
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction once max_entries is exceeded"""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 1, ttl=60)
+        cache.put("b", 2, ttl=60)
+        cache.get("a")
+        cache.put("c", 3, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_zero_ttl_is_not_cached(self):
+        """Test that a TTL of 0 disables caching"""
+        cache = ResponseCache()
+        cache.put("k", "v", ttl=0)
+        assert len(cache) == 0
+
+    def test_invalidate_by_tag(self):
+        """Test that invalidating a tag drops only its entries"""
+        cache = ResponseCache()
+        cache.put("a", 1, ttl=60, tag=("/SRV", "OrderSet"))
+        cache.put("b", 2, ttl=60, tag=("/SRV", "OrderSet"))
+        cache.put("c", 3, ttl=60, tag=("/SRV", "CustomerSet"))
+
+        assert cache.invalidate(("/SRV", "OrderSet")) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+
+    def test_read_from_before_an_invalidation_is_not_stored(self):
+        """Test that a value requested before its tag was invalidated is dropped"""
+        cache = ResponseCache()
+        tag = ("/SRV", "OrderSet")
+        generation = cache.generation(tag)
+        cache.invalidate(tag)
+
+        cache.put("a", "stale", ttl=60, tag=tag, generation=generation)
+        assert cache.get("a") is None
+        cache.put("a", "fresh", ttl=60, tag=tag, generation=cache.generation(tag))
+        assert cache.get("a") == "fresh"
+
+    def test_expired_entries_with_etag_can_be_revalidated(self):
+        """Test that an expired entry with an ETag is kept for revalidation"""
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        cache.put("k", "v", ttl=10, etag='W/"1"')
+
+        clock.now = 10.0
+        assert cache.get("k") is None
+        assert cache.get_stale("k").etag == 'W/"1"'
+        assert cache.revalidated("k", ttl=10) == "v"
+        assert cache.get("k") == "v"
+
+    def test_statistics(self):
+        """Test hit and miss counters"""
+        cache = ResponseCache()
+        cache.put("k", "v", ttl=60)
+        cache.get("k")
+        cache.get("missing")
+
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.unit
+def test_cache_key_ignores_parameter_order():
+    """Test that equivalent requests share a cache key"""
+    first = make_cache_key(
+        "HTTPS://SAP.example.com/Orders", {"$top": "5", "$format": "json"}, "100"
+    )
+    second = make_cache_key(
+        "https://sap.example.com/Orders/",
+        {"$format": "json", "$top": "5", "sap-client": "100"},
+        "100",
+    )
+
+    assert first == second
+    assert first != make_cache_key("https://sap.example.com/Orders", {}, "200")
+
+
+@pytest.mark.unit
+def test_cache_ttl_resolution():
+    """Test that entity TTLs override service TTLs, which override the default"""
+    config = ServicesYAMLConfig(
+        cache={"default_ttl": 30},
+        services=[
+            {
+                "id": "SRV",
+                "name": "Service",
+                "path": "/SRV",
+                "cache_ttl": 300,
+                "entities": [
+                    {"name": "OrderSet", "key_field": "Vbeln", "cache_ttl": 0},
+                    {"name": "CustomerSet", "key_field": "Kunnr"},
+                ],
+            }
+        ],
+    )
+
+    assert config.get_cache_ttl("/SRV", "OrderSet") == 0
+    assert config.get_cache_ttl("/SRV", "CustomerSet") == 300
+    assert config.get_cache_ttl("/OTHER", "AnySet") == 30
+
+    assert ServicesYAMLConfig().get_cache_ttl("/SRV", "OrderSet") == 0
+
+    config.cache.enabled = False
+    assert config.get_cache_ttl("/SRV", "CustomerSet") == 0
@@ -0,0 +1,75 @@
+"""Unit tests for the shared SAP client pool"""
+
+import logging
+
+import pytest
+
+from sap_mcp_server.config.settings import SAPConnectionConfig
+from sap_mcp_server.core.client_pool import SAPClientPool, connection_key
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSAPClientPool:
+    """Tests for SAPClientPool"""
+
+    async def test_same_connection_reuses_client(self, sap_config):
+        """Test that one connection maps to one long-lived client"""
+        pool = SAPClientPool()
+        try:
+            client1 = await pool.get_client(sap_config)
+            client2 = await pool.get_client(sap_config)
+
+            assert client1 is client2
+            assert len(pool) == 1
+            assert client1._session is not None
+        finally:
+            await pool.close()
+
+    async def test_different_users_get_different_clients(self, sap_config):
+        """Test that clients are keyed by SAP connection"""
+        other_config = sap_config.model_copy(update={"username": "other-user"})
+        pool = SAPClientPool()
+        try:
+            client1 = await pool.get_client(sap_config)
+            client2 = await pool.get_client(other_config)
+
+            assert client1 is not client2
+            assert len(pool) == 2
+        finally:
+            await pool.close()
+
+    async def test_close_closes_sessions(self, sap_config):
+        """Test that closing the pool closes every pooled session"""
+        pool = SAPClientPool()
+        client = await pool.get_client(sap_config)
+        session = client._session
+
+        await pool.close()
+
+        assert len(pool) == 0
+        assert session.closed
+
+    async def test_statistics_are_logged_per_connection(self, sap_config, caplog):
+        """Test that pool statistics reach the debug log"""
+        pool = SAPClientPool()
+        try:
+            await pool.get_client(sap_config)
+            with caplog.at_level(logging.DEBUG, logger="sap_mcp_server"):
+                pool.log_statistics()
+        finally:
+            await pool.close()
+
+        assert f"{sap_config.username}@{sap_config.host}" in caplog.text
+        assert "requests_in_flight" in caplog.text
+
+
+@pytest.mark.unit
+def test_connection_key(sap_config: SAPConnectionConfig):
+    """Test registry key composition"""
+    assert connection_key(sap_config) == (
+        sap_config.host,
+        sap_config.port,
+        sap_config.client,
+        sap_config.username,
+    )
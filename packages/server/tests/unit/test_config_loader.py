@@ -0,0 +1,136 @@
+"""Unit tests for the services configuration loader"""
+
+import os
+
+import pytest
+
+from sap_mcp_server.config.loader import ServicesConfigLoader
+from sap_mcp_server.config.schemas import ServicesYAMLConfig
+
+SERVICES_YAML = """
+services:
+  - id: {service_id}
+    name: Sales Orders
+    path: /SAP/{service_id}
+    entities:
+      - name: zsd004Set
+        key_field: Vbeln
+"""
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def write_services(path, service_id: str, mtime: int) -> None:
+    """Write a services file with a distinct modification time"""
+    path.write_text(SERVICES_YAML.format(service_id=service_id), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.unit
+class TestServicesConfigIndexes:
+    """Tests for indexed service and entity lookups"""
+
+    def test_lookups(self):
+        """Test lookups by service ID, path and entity name"""
+        config = ServicesYAMLConfig(
+            services=[
+                {"id": f"SRV{i}", "name": "S", "path": f"/SRV{i}"} for i in range(100)
+            ]
+            + [
+                {
+                    "id": "ORDERS",
+                    "name": "Orders",
+                    "path": "/ORDERS",
+                    "entities": [{"name": "OrderSet", "key_field": "Vbeln"}],
+                }
+            ]
+        )
+
+        assert config.get_service("SRV42").path == "/SRV42"
+        assert config.get_service_by_path("/ORDERS").id == "ORDERS"
+        assert config.get_entity("ORDERS", "OrderSet").key_field == "Vbeln"
+        assert config.get_service("MISSING") is None
+        assert config.get_entity("ORDERS", "ItemSet") is None
+
+    def test_first_duplicate_wins(self):
+        """Test that duplicate IDs resolve to the first entry, as before"""
+        config = ServicesYAMLConfig(
+            services=[
+                {"id": "SRV", "name": "First", "path": "/A"},
+                {"id": "SRV", "name": "Second", "path": "/B"},
+            ]
+        )
+        assert config.get_service("SRV").name == "First"
+
+
+@pytest.mark.unit
+class TestHotReload:
+    """Tests for reloading a changed services file"""
+
+    def test_changed_file_is_swapped_in(self, tmp_path):
+        """Test that a changed file replaces the snapshot after the interval"""
+        path = tmp_path / "services.yaml"
+        write_services(path, "Z_OLD_SRV", mtime=1000)
+        clock = FakeClock()
+        loader = ServicesConfigLoader(path, reload_interval=2.0, clock=clock)
+
+        old = loader.load()
+        write_services(path, "Z_NEW_SRV", mtime=2000)
+
+        clock.now = 1.0
+        assert loader.load() is old
+        clock.now = 2.0
+        new = loader.load()
+
+        assert new.get_service("Z_NEW_SRV") is not None
+        assert old.get_service("Z_OLD_SRV") is not None
+        assert loader.reload_count == 1
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        """Test that the same snapshot is returned while the file is unchanged"""
+        path = tmp_path / "services.yaml"
+        write_services(path, "Z_SRV", mtime=1000)
+        clock = FakeClock()
+        loader = ServicesConfigLoader(path, clock=clock)
+
+        first = loader.load()
+        clock.now = 100.0
+        assert loader.load() is first
+        assert loader.reload_count == 0
+
+    def test_invalid_file_keeps_current_config(self, tmp_path):
+        """Test that a broken edit is logged and the last good config kept"""
+        path = tmp_path / "services.yaml"
+        write_services(path, "Z_SRV", mtime=1000)
+        clock = FakeClock()
+        loader = ServicesConfigLoader(path, clock=clock)
+        good = loader.load()
+
+        path.write_text("services: [{id: X, path: no-slash}]", encoding="utf-8")
+        os.utime(path, (2000, 2000))
+        clock.now = 10.0
+
+        assert loader.load() is good
+        assert loader.reload_count == 0
+
+    def test_zero_interval_disables_reload(self, tmp_path):
+        """Test that hot reload can be turned off"""
+        path = tmp_path / "services.yaml"
+        write_services(path, "Z_OLD_SRV", mtime=1000)
+        clock = FakeClock()
+        loader = ServicesConfigLoader(path, reload_interval=0, clock=clock)
+        old = loader.load()
+
+        write_services(path, "Z_NEW_SRV", mtime=2000)
+        clock.now = 100.0
+
+        assert loader.load() is old
+        assert loader.reload().get_service("Z_NEW_SRV") is not None
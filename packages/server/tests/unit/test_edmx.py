@@ -0,0 +1,147 @@
+"""Unit tests for the streaming EDMX parser"""
+
+import pytest
+
+from sap_mcp_server.core.edmx import ServiceSchema, parse_edmx
+from sap_mcp_server.core.exceptions import SAPValidationError
+
+EDMX_V2 = """<?xml version="1.0" encoding="utf-8"?>
+<edmx:Edmx Version="1.0" xmlns:edmx="http://schemas.microsoft.com/ado/2007/06/edmx"
+    xmlns:sap="http://www.sap.com/Protocols/SAPData">
+  <edmx:DataServices>
+    <Schema Namespace="ZSALES_SRV" xmlns="http://schemas.microsoft.com/ado/2008/09/edm">
+      <EntityType Name="Order" sap:content-version="1">
+        <Key><PropertyRef Name="Vbeln"/></Key>
+        <Property Name="Vbeln" Type="Edm.String" Nullable="false" MaxLength="10"/>
+        <Property Name="Netwr" Type="Edm.Decimal" Precision="15" Scale="2"/>
+        <Property Name="Attachment" Type="Edm.Binary"/>
+        <NavigationProperty Name="Items" Relationship="ZSALES_SRV.OrderItems"
+            FromRole="FromRole_OrderItems" ToRole="ToRole_OrderItems"/>
+      </EntityType>
+      <EntityType Name="Item">
+        <Key><PropertyRef Name="Vbeln"/><PropertyRef Name="Posnr"/></Key>
+        <Property Name="Vbeln" Type="Edm.String" Nullable="false"/>
+        <Property Name="Posnr" Type="Edm.String" Nullable="false"/>
+      </EntityType>
+      <ComplexType Name="Address">
+        <Property Name="City" Type="Edm.String"/>
+      </ComplexType>
+      <Association Name="OrderItems">
+        <End Type="ZSALES_SRV.Order" Multiplicity="1" Role="FromRole_OrderItems"/>
+        <End Type="ZSALES_SRV.Item" Multiplicity="*" Role="ToRole_OrderItems"/>
+      </Association>
+      <EntityContainer Name="ZSALES_SRV_Entities" m:IsDefaultEntityContainer="true"
+          xmlns:m="http://schemas.microsoft.com/ado/2007/08/dataservices/metadata">
+        <EntitySet Name="OrderSet" EntityType="ZSALES_SRV.Order"/>
+        <EntitySet Name="ItemSet" EntityType="ZSALES_SRV.Item"/>
+        <AssociationSet Name="OrderItemsSet" Association="ZSALES_SRV.OrderItems"/>
+      </EntityContainer>
+    </Schema>
+  </edmx:DataServices>
+</edmx:Edmx>"""
+
+EDMX_V4 = """<?xml version="1.0" encoding="utf-8"?>
+<edmx:Edmx Version="4.0" xmlns:edmx="http://docs.oasis-open.org/odata/ns/edmx">
+  <edmx:DataServices>
+    <Schema Namespace="Sales" xmlns="http://docs.oasis-open.org/odata/ns/edm">
+      <EntityType Name="Order">
+        <Key><PropertyRef Name="ID"/></Key>
+        <Property Name="ID" Type="Edm.Int32" Nullable="false"/>
+        <NavigationProperty Name="Items" Type="Collection(Sales.Item)"/>
+        <NavigationProperty Name="Customer" Type="Sales.Customer"/>
+      </EntityType>
+      <EntityContainer Name="Container">
+        <EntitySet Name="Orders" EntityType="Sales.Order"/>
+      </EntityContainer>
+    </Schema>
+  </edmx:DataServices>
+</edmx:Edmx>"""
+
+EDMX_V4_DERIVED = """<?xml version="1.0" encoding="utf-8"?>
+<edmx:Edmx Version="4.0" xmlns:edmx="http://docs.oasis-open.org/odata/ns/edmx">
+  <edmx:DataServices>
+    <Schema Namespace="Sales" Alias="S" xmlns="http://docs.oasis-open.org/odata/ns/edm">
+      <EntityType Name="SpecialOrder" BaseType="S.Order">
+        <Property Name="Priority" Type="Edm.Int16"/>
+      </EntityType>
+      <EntityType Name="Order" BaseType="Sales.Document">
+        <Property Name="Netwr" Type="Edm.Decimal"/>
+        <NavigationProperty Name="Items" Type="Collection(Sales.Item)"/>
+      </EntityType>
+      <EntityType Name="Document" Abstract="true">
+        <Key><PropertyRef Name="ID"/></Key>
+        <Property Name="ID" Type="Edm.Guid" Nullable="false"/>
+      </EntityType>
+      <EntityContainer Name="Container">
+        <EntitySet Name="SpecialOrders" EntityType="Sales.SpecialOrder"/>
+      </EntityContainer>
+    </Schema>
+  </edmx:DataServices>
+</edmx:Edmx>"""
+
+
+@pytest.mark.unit
+class TestParseEdmx:
+    """Tests for parse_edmx"""
+
+    def test_entity_types_and_sets(self):
+        """Test that entity types, keys and properties are extracted"""
+        schema = parse_edmx(EDMX_V2)
+
+        order = schema.entity_type_for("OrderSet")
+        assert order is not None
+        assert order.qualified_name == "ZSALES_SRV.Order"
+        assert order.keys == ("Vbeln",)
+        assert [p.name for p in order.properties] == ["Vbeln", "Netwr", "Attachment"]
+        assert order.get_property("Vbeln").max_length == 10
+        assert order.get_property("Vbeln").nullable is False
+        assert order.get_property("Attachment").type == "Edm.Binary"
+        assert schema.entity_type_for("ItemSet").keys == ("Vbeln", "Posnr")
+        assert schema.get_entity_type("Item") is schema.get_entity_type(
+            "ZSALES_SRV.Item"
+        )
+
+    def test_complex_type_properties_are_not_attributed(self):
+        """Test that complex type properties do not leak into entity types"""
+        schema = parse_edmx(EDMX_V2)
+        assert "City" not in schema.entity_type_for("OrderSet")
+        assert schema.get_entity_type("Address") is None
+
+    def test_v2_navigation_resolved_through_association(self):
+        """Test that v2 navigation targets come from the association ends"""
+        order = parse_edmx(EDMX_V2).entity_type_for("OrderSet")
+        items = order.get_navigation("Items")
+        assert items.target_type == "ZSALES_SRV.Item"
+        assert items.many is True
+        assert order.get_property("Items") is None
+
+    def test_v4_navigation_types(self):
+        """Test v4 typed navigation properties"""
+        order = parse_edmx(EDMX_V4.encode("utf-8")).entity_type_for("Orders")
+        assert order.get_navigation("Items").many is True
+        assert order.get_navigation("Items").target_type == "Sales.Item"
+        assert order.get_navigation("Customer").many is False
+
+    def test_derived_types_inherit_from_base_types(self):
+        """Test that keys, properties and navigations are inherited"""
+        special = parse_edmx(EDMX_V4_DERIVED).entity_type_for("SpecialOrders")
+
+        assert special.keys == ("ID",)
+        assert [p.name for p in special.properties] == ["ID", "Netwr", "Priority"]
+        assert special.get_property("ID").type == "Edm.Guid"
+        assert special.get_navigation("Items").many is True
+
+    def test_round_trip_through_dict(self):
+        """Test that the JSON form rebuilds an equivalent schema"""
+        schema = parse_edmx(EDMX_V2)
+        rebuilt = ServiceSchema.from_dict(schema.to_dict())
+
+        order = rebuilt.entity_type_for("OrderSet")
+        assert order.properties == schema.entity_type_for("OrderSet").properties
+        assert order.get_navigation("Items").target_type == "ZSALES_SRV.Item"
+        assert rebuilt.to_dict() == schema.to_dict()
+
+    def test_malformed_document_rejected(self):
+        """Test that malformed XML raises a validation error"""
+        with pytest.raises(SAPValidationError):
+            parse_edmx("<edmx:Edmx><unclosed>")
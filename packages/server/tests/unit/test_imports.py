@@ -0,0 +1,32 @@
+"""Unit tests for the modules loaded at server start"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Loaded on first tool call or SAP warm-up, not before the MCP handshake
+DEFERRED_MODULES = [
+    "aiohttp",
+    "xmltodict",
+    "yaml",
+    "structlog",
+    "sap_mcp_server.config.settings",
+    "sap_mcp_server.core.sap_client",
+]
+
+
+@pytest.mark.unit
+def test_stdio_startup_defers_heavy_imports():
+    """Test that importing the stdio server and tools skips the SAP stack"""
+    code = (
+        "import sys\n"
+        "import sap_mcp_server.transports.stdio\n"
+        "from sap_mcp_server.tools import tool_registry\n"
+        "assert len(tool_registry.list_tools()) == 5\n"
+        f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
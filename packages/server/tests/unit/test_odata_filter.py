@@ -0,0 +1,204 @@
+"""Unit tests for the OData $filter parser"""
+
+from urllib.parse import quote
+
+import pytest
+
+from sap_mcp_server.core.exceptions import SAPValidationError
+from sap_mcp_server.core.odata_filter import (
+    BinaryOp,
+    Call,
+    Literal,
+    PropertyRef,
+    UnaryOp,
+    canonical_filter,
+    parse_filter,
+    split_key_list,
+    to_filter_string,
+    walk,
+)
+
+
+@pytest.mark.unit
+class TestParseFilter:
+    """Tests for parsing filter expressions into an AST"""
+
+    def test_comparison(self):
+        """Test that a comparison parses into property and literal nodes"""
+        assert parse_filter("Vbeln eq '0000012345'") == BinaryOp(
+            "eq",
+            PropertyRef("Vbeln"),
+            Literal("Edm.String", "0000012345", "'0000012345'"),
+        )
+
+    def test_precedence(self):
+        """Test that and binds tighter than or, and parentheses override it"""
+        plain = parse_filter("A eq 1 or B eq 2 and C eq 3")
+        grouped = parse_filter("(A eq 1 or B eq 2) and C eq 3")
+
+        assert plain.op == "or" and plain.right.op == "and"
+        assert grouped.op == "and" and grouped.left.op == "or"
+
+    def test_functions_and_not(self):
+        """Test function calls, navigation paths and negation"""
+        node = parse_filter("not substringof('x', Customer/Name)")
+
+        assert node == UnaryOp(
+            "not",
+            Call(
+                "substringof",
+                (Literal("Edm.String", "x", "'x'"), PropertyRef("Customer/Name")),
+            ),
+        )
+
+    @pytest.mark.parametrize(
+        "literal, edm_type, value",
+        [
+            ("42", "Edm.Int32", 42),
+            ("42L", "Edm.Int64", 42),
+            ("1.5M", "Edm.Decimal", 1.5),
+            ("2.5", "Edm.Double", 2.5),
+            ("true", "Edm.Boolean", True),
+            ("'it''s'", "Edm.String", "it's"),
+            ("datetime'2024-01-01T00:00:00'", "Edm.DateTime", "2024-01-01T00:00:00"),
+            ("guid'0050568d-393c-1ed4'", "Edm.Guid", "0050568d-393c-1ed4"),
+        ],
+    )
+    def test_typed_literals(self, literal, edm_type, value):
+        """Test that literals carry their Edm type and decoded value"""
+        node = parse_filter(f"Field eq {literal}")
+        assert (node.right.type, node.right.value) == (edm_type, value)
+
+    @pytest.mark.parametrize(
+        "text, position",
+        [
+            ("OrderID = 12345", 8),
+            ("just some text", 5),
+            ("Vbeln eq", 8),
+            ("(Vbeln eq '1'", 13),
+            ("frobnicate(Vbeln)", 0),
+            ("", 0),
+        ],
+    )
+    def test_errors_report_position(self, text, position):
+        """Test that malformed expressions raise with the offending position"""
+        with pytest.raises(SAPValidationError, match=f"position {position}:"):
+            parse_filter(text)
+
+    def test_parses_are_memoized(self):
+        """Test that parsing the same text twice reuses the AST"""
+        text = "Erdat ge datetime'2024-01-01T00:00:00' and Auart eq 'ZOR'"
+        first = parse_filter(text)
+        hits = parse_filter.cache_info().hits
+
+        assert parse_filter(text) is first
+        assert parse_filter.cache_info().hits == hits + 1
+
+    def test_walk(self):
+        """Test that walk visits every node"""
+        node = parse_filter("A eq 1 and startswith(B,'x')")
+        paths = [n.path for n in walk(node) if isinstance(n, PropertyRef)]
+        assert paths == ["A", "B"]
+
+
+@pytest.mark.unit
+class TestCanonicalFilter:
+    """Tests for the canonical form of equivalent filters"""
+
+    @pytest.mark.parametrize(
+        "variant",
+        [
+            "Kunnr eq 'A' and Netwr gt 5",
+            "Netwr gt 5 and Kunnr eq 'A'",
+            "(Kunnr eq 'A') and ((Netwr gt 5))",
+            "5 lt Netwr and  'A' eq Kunnr",
+            "Kunnr eq 'A' and Netwr gt 5 and Kunnr eq 'A'",
+        ],
+    )
+    def test_equivalent_forms(self, variant):
+        """Test that equivalent filters map to the same string"""
+        assert canonical_filter(variant) == "Kunnr eq 'A' and Netwr gt 5"
+
+    def test_keeps_required_parentheses(self):
+        """Test that grouping that changes the meaning is preserved"""
+        text = "(A eq 1 or B eq 2) and C eq 3"
+        assert canonical_filter(text) == text
+        assert canonical_filter("A sub (B sub C) eq 0") == "A sub (B sub C) eq 0"
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "OrderDate ge 2024-01-01",
+            "Created lt 2024-01-01T00:00:00Z",
+            "Items/any(i:i/Qty gt 1)",
+            "Status in ('A','B')",
+            "Flags has Sales.Color'Red'",
+            "Id eq 0050568d-393c-1ed4-9d97-e29c4c1f3a7b",
+            "cast(A, Edm.Int32) gt 5",
+        ],
+    )
+    def test_v4_expressions_are_kept(self, expression):
+        """Test that expressions outside the v2 grammar are passed on as given"""
+        with pytest.raises(SAPValidationError):
+            parse_filter(expression)
+        assert canonical_filter(expression) == expression
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Vbeln eq 007", "Vbeln eq 007"),
+            ("Netwr gt 1.50M", "Netwr gt 1.50M"),
+            ("A eq - - 1", "A eq - - 1"),
+            ("A eq - -1", "A eq - -1"),
+            ("A eq - -X", "A eq - -X"),
+        ],
+    )
+    def test_serialization_stays_valid_odata(self, text, expected):
+        """Test that number literals keep their text and negations stay apart"""
+        assert canonical_filter(text) == expected
+        assert parse_filter(expected) == parse_filter(text)
+
+    def test_canonical_form_is_stable(self):
+        """Test that canonicalizing a canonical filter changes nothing"""
+        text = "not (B eq 2 or A eq 1) and -X lt 3L"
+        canonical = canonical_filter(text)
+        assert canonical_filter(canonical) == canonical
+        assert to_filter_string(parse_filter(canonical)) == canonical
+
+
+@pytest.mark.unit
+class TestSplitKeyList:
+    """Tests for splitting long key-list filters"""
+
+    def test_chunks_cover_the_key_list(self):
+        """Test that every key lands in exactly one chunk within the limit"""
+        keys = [f"{i:010d}" for i in range(200)]
+        key_list = " or ".join(f"Vbeln eq '{key}'" for key in keys)
+        chunks = split_key_list(f"Auart eq 'ZOR' and ({key_list})", 500)
+
+        assert len(chunks) > 1
+        found = []
+        for chunk in chunks:
+            assert len(quote(chunk, safe="")) <= 500
+            assert canonical_filter(chunk) == chunk
+            node = parse_filter(chunk)
+            assert node.op == "and"
+            found += [n.value for n in walk(node.right) if isinstance(n, Literal)]
+        assert found == keys
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Vbeln eq '1' or Vbeln eq '2'",
+            " or ".join(f"Vbeln eq '{i}' or Kunnr eq '{i}'" for i in range(100)),
+            " or ".join(f"Vbeln gt '{i}'" for i in range(100)),
+        ],
+    )
+    def test_no_split(self, text):
+        """Test that short filters and mixed disjunctions are left alone"""
+        assert split_key_list(text, 200) is None
+
+    def test_unparsed_filter_is_not_split(self):
+        """Test that a long filter outside the v2 grammar is left alone"""
+        keys = ",".join(f"'{i:010d}'" for i in range(100))
+        assert split_key_list(f"Vbeln in ({keys})", 200) is None
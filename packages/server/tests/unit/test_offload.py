@@ -0,0 +1,84 @@
+"""Unit tests for off-event-loop response decoding"""
+
+import json
+import logging
+from functools import partial
+
+import pytest
+
+from sap_mcp_server.core.offload import ResponseDecoder
+from sap_mcp_server.core.sap_client import compact_response
+from sap_mcp_server.transports.stdio import report_statistics
+
+RESPONSE = json.dumps(
+    {
+        "d": {
+            "results": [
+                {
+                    "__metadata": {"uri": f"OrderSet('{i}')"},
+                    "Vbeln": str(i),
+                    "Items": {"__deferred": {"uri": f"OrderSet('{i}')/Items"}},
+                }
+                for i in range(50)
+            ]
+        }
+    }
+)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestResponseDecoder:
+    """Tests for ResponseDecoder"""
+
+    async def test_small_responses_decode_inline(self):
+        """Test that responses below the threshold are decoded on the loop"""
+        decoder = ResponseDecoder(threshold=len(RESPONSE) + 1)
+
+        data = await decoder.decode(RESPONSE)
+
+        assert len(data["d"]["results"]) == 50
+        stats = decoder.get_statistics()
+        assert stats["inline"]["count"] == 1
+        assert stats["offloaded"]["count"] == 0
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    async def test_large_responses_decode_in_pool(self, executor):
+        """Test that large responses are decoded and transformed in the pool"""
+        decoder = ResponseDecoder(threshold=100, executor=executor)
+        try:
+            data = await decoder.decode(
+                RESPONSE, partial(compact_response, output_format="json_compact")
+            )
+        finally:
+            decoder.shutdown()
+
+        assert data["count"] == 50
+        assert data["results"][0] == {"Vbeln": "0"}
+        stats = decoder.get_statistics()
+        assert stats["offloaded"]["count"] == 1
+        assert stats["offloaded"]["max_seconds"] > 0
+
+    async def test_zero_threshold_never_offloads(self):
+        """Test that a threshold of 0 disables offloading"""
+        decoder = ResponseDecoder(threshold=0)
+        await decoder.decode(RESPONSE)
+        assert decoder.get_statistics()["offloaded"]["count"] == 0
+
+
+@pytest.mark.unit
+def test_compact_response_single_entity():
+    """Test compaction of a single entity response"""
+    data = {"d": {"__metadata": {"uri": "x"}, "Vbeln": "1"}}
+    assert compact_response(data, "json_compact") == {"result": {"Vbeln": "1"}}
+    assert compact_response(data, "json") is data
+
+
+@pytest.mark.unit
+def test_decode_statistics_are_reported(caplog):
+    """Test that the server's statistics report includes decoding"""
+    with caplog.at_level(logging.DEBUG, logger="sap_mcp_server"):
+        report_statistics()
+
+    assert "Response decoding:" in caplog.text
+    assert "offloaded" in caplog.text
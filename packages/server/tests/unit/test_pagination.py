@@ -0,0 +1,126 @@
+"""Unit tests for the query output budget and continuation cursors"""
+
+import pytest
+
+from sap_mcp_server.config.schemas import OutputConfig
+from sap_mcp_server.core.pagination import ResultPager
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def compact_result(rows: int):
+    return {
+        "results": [{"Vbeln": str(i), "Netwr": "10.00"} for i in range(rows)],
+        "count": rows,
+    }
+
+
+@pytest.mark.unit
+class TestResultPager:
+    """Tests for ResultPager"""
+
+    def test_result_within_budget_is_unchanged(self):
+        """Test that small results are returned as-is without a cursor"""
+        pager = ResultPager()
+        data = compact_result(5)
+
+        assert pager.paginate(data, OutputConfig(max_rows=5), "SRV", "OrderSet") is data
+        assert len(pager.store) == 0
+
+    def test_pages_follow_cursors(self):
+        """Test that every row is reachable through the cursors exactly once"""
+        pager = ResultPager()
+        config = OutputConfig(max_rows=4)
+
+        page = pager.paginate(compact_result(10), config, "SRV", "OrderSet")
+        seen = [row["Vbeln"] for row in page["results"]]
+        assert page["count"] == 4
+        assert page["total"] == 10
+
+        while "next_cursor" in page:
+            page = pager.next_page(page["next_cursor"], config, "SRV", "OrderSet")
+            seen.extend(row["Vbeln"] for row in page["results"])
+
+        assert seen == [str(i) for i in range(10)]
+        assert page["count"] == 2
+
+    def test_byte_budget(self):
+        """Test that pages stop before exceeding max_bytes (at least one row)"""
+        pager = ResultPager()
+        row_size = len('{"Vbeln":"0","Netwr":"10.00"}')
+
+        page = pager.paginate(
+            compact_result(10),
+            OutputConfig(max_bytes=row_size * 3),
+            "SRV",
+            "OrderSet",
+        )
+        assert page["count"] == 3
+
+        page = pager.paginate(
+            compact_result(10), OutputConfig(max_bytes=1), "SRV", "OrderSet"
+        )
+        assert page["count"] == 1
+
+    def test_per_call_max_rows_is_capped(self):
+        """Test that max_rows can lower but not raise the configured limit"""
+        pager = ResultPager()
+        config = OutputConfig(max_rows=4)
+
+        lowered = pager.paginate(compact_result(10), config, "SRV", "OrderSet", 2)
+        raised = pager.paginate(compact_result(10), config, "SRV", "OrderSet", 50)
+
+        assert lowered["count"] == 2
+        assert raised["count"] == 4
+
+    def test_raw_odata_shape_is_kept(self):
+        """Test that pages of raw responses keep the OData envelope"""
+        pager = ResultPager()
+        data = {"d": {"results": compact_result(3)["results"], "__count": "3"}}
+
+        page = pager.paginate(data, OutputConfig(max_rows=2), "SRV", "OrderSet")
+
+        assert page["d"]["__count"] == "3"
+        assert len(page["d"]["results"]) == 2
+        assert page["total"] == 3
+
+    def test_expired_cursor(self):
+        """Test that cursors stop working after cursor_ttl"""
+        clock = FakeClock()
+        pager = ResultPager(clock=clock)
+        config = OutputConfig(max_rows=4, cursor_ttl=60)
+        page = pager.paginate(compact_result(10), config, "SRV", "OrderSet")
+
+        clock.now = 60.0
+        with pytest.raises(ValueError, match="expired"):
+            pager.next_page(page["next_cursor"], config, "SRV", "OrderSet")
+
+    def test_cursor_bound_to_entity_set(self):
+        """Test that a cursor cannot be used for another entity set"""
+        pager = ResultPager()
+        config = OutputConfig(max_rows=4)
+        page = pager.paginate(compact_result(10), config, "SRV", "OrderSet")
+
+        with pytest.raises(ValueError, match="belongs to SRV/OrderSet"):
+            pager.next_page(page["next_cursor"], config, "SRV", "ItemSet")
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            pager.next_page("garbage", config, "SRV", "OrderSet")
+
+    def test_stored_results_are_bounded(self):
+        """Test that the oldest stored result is evicted"""
+        pager = ResultPager()
+        config = OutputConfig(max_rows=4, max_stored_results=1)
+        first = pager.paginate(compact_result(10), config, "SRV", "OrderSet")
+        pager.paginate(compact_result(10), config, "SRV", "OrderSet")
+
+        assert len(pager.store) == 1
+        with pytest.raises(ValueError, match="expired"):
+            pager.next_page(first["next_cursor"], config, "SRV", "OrderSet")
@@ -0,0 +1,119 @@
+"""Unit tests for the default $select projection"""
+
+from typing import Any
+
+import pytest
+
+from sap_mcp_server.config.schemas import (
+    EntityConfig,
+    ProjectionConfig,
+    ServiceConfig,
+)
+from sap_mcp_server.core.edmx import EntitySet, EntityType, Property, ServiceSchema
+from sap_mcp_server.core.exceptions import SAPRequestError
+from sap_mcp_server.core.projection import (
+    parse_select,
+    prune_properties,
+    resolve_select,
+)
+
+ORDER = EntityType(
+    name="Order",
+    namespace="ZSRV",
+    keys=("Vbeln",),
+    properties=(
+        Property("Vbeln", "Edm.String", False, 10),
+        Property("Netwr", "Edm.Decimal"),
+        Property("Note", "Edm.String", True, 5000),
+        Property("Pdf", "Edm.Binary"),
+    ),
+)
+SCHEMA = ServiceSchema([ORDER], [EntitySet("OrderSet", "ZSRV.Order")])
+SERVICE = ServiceConfig(id="SRV", name="Service", path="/SRV")
+
+
+class SchemaClient:
+    """Client stand-in serving a fixed schema, or failing"""
+
+    def __init__(self, error: Exception = None) -> None:
+        self.error = error
+        self.calls = 0
+
+    async def get_service_schema(self, service_path: str) -> Any:
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return SCHEMA
+
+
+@pytest.mark.unit
+class TestProjectionHelpers:
+    """Tests for select parsing and metadata pruning"""
+
+    def test_parse_select(self):
+        """Test that select strings are split and '*' selects everything"""
+        assert parse_select("Vbeln, Netwr") == ["Vbeln", "Netwr"]
+        assert parse_select("*") is None
+        assert parse_select(None) is None
+
+    def test_heavyweight_properties_are_pruned(self):
+        """Test that binary and long text properties are left out"""
+        assert prune_properties(ORDER, ProjectionConfig()) == ["Vbeln", "Netwr"]
+
+    def test_nothing_to_prune(self):
+        """Test that no $select is produced when every property is kept"""
+        config = ProjectionConfig(excluded_types=[], max_text_length=10000)
+        assert prune_properties(ORDER, config) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestResolveSelect:
+    """Tests for projection precedence"""
+
+    async def test_explicit_select_wins(self):
+        """Test that the caller's select is used as given"""
+        client = SchemaClient()
+        entity = EntityConfig(
+            name="OrderSet", key_field="Vbeln", default_select=["Vbeln"]
+        )
+
+        assert await resolve_select(
+            client, SERVICE, entity, "Note", ProjectionConfig()
+        ) == ["Note"]
+        assert (
+            await resolve_select(client, SERVICE, entity, "*", ProjectionConfig())
+            is None
+        )
+        assert client.calls == 0
+
+    async def test_default_select_before_metadata(self):
+        """Test that default_select from services.yaml is applied"""
+        client = SchemaClient()
+        entity = EntityConfig(
+            name="OrderSet", key_field="Vbeln", default_select=["Vbeln"]
+        )
+
+        assert await resolve_select(
+            client, SERVICE, entity, None, ProjectionConfig()
+        ) == ["Vbeln"]
+        assert client.calls == 0
+
+    async def test_metadata_pruning(self):
+        """Test the metadata-driven projection without a default select"""
+        entity = EntityConfig(name="OrderSet", key_field="Vbeln")
+
+        selected = await resolve_select(
+            SchemaClient(), SERVICE, entity, None, ProjectionConfig()
+        )
+        assert selected == ["Vbeln", "Netwr"]
+
+    async def test_unavailable_metadata_selects_everything(self):
+        """Test that a metadata failure falls back to all properties"""
+        entity = EntityConfig(name="OrderSet", key_field="Vbeln")
+        client = SchemaClient(error=SAPRequestError("forbidden"))
+
+        assert (
+            await resolve_select(client, SERVICE, entity, None, ProjectionConfig())
+            is None
+        )
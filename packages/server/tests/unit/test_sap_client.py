@@ -0,0 +1,773 @@
+"""Unit tests for SAPClient request handling against a local test server"""
+
+import asyncio
+import json
+import re
+from typing import Any, AsyncIterator, Dict, List
+from urllib.parse import quote
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sap_mcp_server.config.schemas import CacheConfig, GatewayConfig
+from sap_mcp_server.core.auth import TokenStore
+from sap_mcp_server.core.batch import BatchRequest
+from sap_mcp_server.core.cache import ResponseCache
+from sap_mcp_server.core.connection import get_ssl_context
+from sap_mcp_server.core.exceptions import SAPValidationError
+from sap_mcp_server.core.sap_client import SAPClient
+
+
+@pytest.fixture
+def requests_seen() -> List[Dict[str, Any]]:
+    """Requests received by the test server"""
+    return []
+
+
+@pytest.fixture
+async def odata_server(requests_seen) -> AsyncIterator[TestServer]:
+    """Minimal OData endpoint recording the requests it receives"""
+
+    async def handle(request: web.Request) -> web.Response:
+        requests_seen.append(
+            {
+                "method": request.method,
+                "path": request.path,
+                "query": dict(request.query),
+                "headers": dict(request.headers),
+            }
+        )
+        headers = {}
+        if request.headers.get("X-CSRF-Token") == "Fetch":
+            headers["X-CSRF-Token"] = "server-csrf"
+        if request.method != "GET" and request.headers.get("X-CSRF-Token") in (
+            None,
+            "Fetch",
+        ):
+            return web.Response(status=403, headers={"X-CSRF-Token": "Required"})
+        return web.json_response({"d": {"results": []}}, headers=headers)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def paging_server(requests_seen) -> AsyncIterator[TestServer]:
+    """Entity set of 7 orders served 3 rows per page via d.__next links"""
+    rows = [{"Vbeln": str(i)} for i in range(1, 8)]
+
+    async def handle(request: web.Request) -> web.Response:
+        requests_seen.append({"path": request.path, "query": dict(request.query)})
+        matching = rows
+        for op, value in re.findall(
+            r"Vbeln (ge|lt) '(\d+)'", request.query.get("$filter", "")
+        ):
+            matching = [
+                row
+                for row in matching
+                if (row["Vbeln"] >= value if op == "ge" else row["Vbeln"] < value)
+            ]
+        if request.path.endswith("/$count"):
+            return web.Response(text=str(len(matching)))
+
+        skip = int(request.query.get("$skip", 0))
+        top = int(request.query.get("$top", len(matching)))
+        matching = matching[skip : skip + top]
+        start = int(request.query.get("$skiptoken", 0))
+        payload: Dict[str, Any] = {"results": matching[start : start + 3]}
+        if start + 3 < len(matching):
+            payload["__next"] = (
+                f"{request.path}?$top={top}&$skip={skip}"
+                f"&$skiptoken={start + 3}&sap-client=100"
+            )
+        return web.json_response({"d": payload})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def entity_server(requests_seen) -> AsyncIterator[TestServer]:
+    """Orders 1-5 served by key, individually or through $batch
+
+    Changesets in a $batch are answered with a single 204 response. Order 5
+    carries an ETag in its metadata and honours If-None-Match.
+    """
+    orders: Dict[str, Dict[str, Any]] = {str(i): {"Vbeln": str(i)} for i in range(1, 6)}
+    orders["5"]["__metadata"] = {"uri": "OrderSet('5')", "etag": 'W/"v1"'}
+
+    def lookup(key: str) -> "tuple[int, str]":
+        if key in orders:
+            return 200, json.dumps({"d": orders[key]})
+        return 404, json.dumps({"error": {"message": {"value": "Not found"}}})
+
+    async def get_entity(request: web.Request) -> web.Response:
+        requests_seen.append(
+            {"method": "GET", "path": request.path, "headers": dict(request.headers)}
+        )
+        status, body = lookup(request.match_info["key"])
+        etag = orders.get(request.match_info["key"], {}).get("__metadata", {})
+        if etag and request.headers.get("If-None-Match") == etag.get("etag"):
+            return web.Response(status=304)
+        return web.Response(
+            status=status,
+            text=body,
+            content_type="application/json",
+            headers={"X-CSRF-Token": "server-csrf"},
+        )
+
+    async def batch(request: web.Request) -> web.Response:
+        body = await request.text()
+        requests_seen.append({"method": "POST", "path": request.path})
+        parts = []
+        for key in re.findall(r"GET OrderSet\('(\w+)'\)", body):
+            status, content = lookup(key)
+            parts += [
+                "--resp",
+                "Content-Type: application/http",
+                "",
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}",
+                "Content-Type: application/json",
+                "",
+                content,
+            ]
+        if "boundary=changeset_" in body:
+            parts += [
+                "--resp",
+                "Content-Type: multipart/mixed; boundary=cs",
+                "",
+                "--cs",
+                "Content-Type: application/http",
+                "",
+                "HTTP/1.1 204 No Content",
+                "",
+                "--cs--",
+            ]
+        return web.Response(
+            text="\r\n".join(parts + ["--resp--", ""]),
+            headers={"Content-Type": "multipart/mixed; boundary=resp"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/SRV/OrderSet('{key}')", get_entity)
+    app.router.add_post("/SRV/$batch", batch)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+EDMX = """<?xml version="1.0" encoding="utf-8"?>
+<edmx:Edmx Version="1.0" xmlns:edmx="http://schemas.microsoft.com/ado/2007/06/edmx">
+  <edmx:DataServices>
+    <Schema Namespace="ZSRV" xmlns="http://schemas.microsoft.com/ado/2008/09/edm">
+      <EntityType Name="Order">
+        <Key><PropertyRef Name="Vbeln"/></Key>
+        <Property Name="Vbeln" Type="Edm.String" Nullable="false" MaxLength="10"/>
+      </EntityType>
+    </Schema>
+  </edmx:DataServices>
+</edmx:Edmx>"""
+
+
+@pytest.fixture
+async def metadata_server(requests_seen) -> AsyncIterator[TestServer]:
+    """Service $metadata document with an ETag, honouring If-None-Match"""
+
+    async def handle(request: web.Request) -> web.Response:
+        requests_seen.append({"path": request.path, "headers": dict(request.headers)})
+        if request.headers.get("If-None-Match") == '"md-1"':
+            return web.Response(status=304)
+        return web.Response(
+            text=EDMX, content_type="application/xml", headers={"ETag": '"md-1"'}
+        )
+
+    app = web.Application()
+    app.router.add_get("/SRV/$metadata", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def make_client(sap_config, cache_ttl: float = 0.0, **overrides) -> SAPClient:
+    """Create a client with an isolated token store and a default cache TTL"""
+    config = sap_config.model_copy(update=overrides)
+    client = SAPClient(config, gateway_config=GatewayConfig())
+    client.cache_config = CacheConfig(default_ttl=cache_ttl)
+    client.authenticator.token_store = TokenStore()
+    return client
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLazyAuthentication:
+    """Tests for the lazy authentication mode"""
+
+    async def test_first_read_is_single_round_trip(
+        self, sap_config, odata_server, requests_seen
+    ):
+        """Test that a cold read sends credentials and fetches CSRF in one call"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            await client._make_request("GET", str(odata_server.make_url("/Orders")))
+
+            assert len(requests_seen) == 1
+            headers = requests_seen[0]["headers"]
+            assert headers["Authorization"].startswith("Basic ")
+            assert headers["X-CSRF-Token"] == "Fetch"
+            assert client.authenticator.peek_token().csrf_token == "server-csrf"
+
+    async def test_write_reuses_piggybacked_token(
+        self, sap_config, odata_server, requests_seen
+    ):
+        """Test that a write after a read needs no separate token fetch"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            url = str(odata_server.make_url("/Orders"))
+            await client._make_request("GET", url)
+            await client._make_request("POST", url, data={"Vbeln": "1"})
+
+            assert [r["method"] for r in requests_seen] == ["GET", "POST"]
+            assert requests_seen[1]["headers"]["X-CSRF-Token"] == "server-csrf"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConnectionPool:
+    """Tests for the configurable, instrumented connection pool"""
+
+    async def test_pool_gauges_record_queueing(self, sap_config, odata_server):
+        """Test that requests waiting for a pooled connection are measured"""
+        async with make_client(
+            sap_config, auth_mode="lazy", pool_size_per_host=1
+        ) as client:
+            url = str(odata_server.make_url("/Orders"))
+            await asyncio.gather(*(client._make_request("GET", url) for _ in range(5)))
+
+            stats = client.get_pool_stats()
+            assert stats["limit_per_host"] == 1
+            assert stats["connections_created"] == 1
+            assert stats["connections_reused"] == 4
+            assert stats["acquire_wait_count"] >= 1
+            assert stats["requests_in_flight"] == 0
+
+
+@pytest.mark.unit
+def test_ssl_context_is_cached():
+    """Test that SSL contexts are built once per verification mode"""
+    assert get_ssl_context(False) is get_ssl_context(False)
+    assert get_ssl_context(False) is not get_ssl_context(True)
+
+
+def point_client_at(client: SAPClient, server: TestServer) -> None:
+    """Send the client's OData requests to a local test server"""
+    client.odata_base = str(server.make_url("")).rstrip("/")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEntitySetIteration:
+    """Tests for auto-paginating entity set iteration"""
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 2])
+    async def test_follows_next_links(
+        self, sap_config, paging_server, requests_seen, prefetch
+    ):
+        """Test that server-driven paging is followed to the end"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, paging_server)
+            pages = [
+                page
+                async for page in client.iter_entity_set(
+                    "/SRV", "OrderSet", prefetch=prefetch
+                )
+            ]
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert requests_seen[1]["query"]["$skiptoken"] == "3"
+        assert requests_seen[1]["query"]["sap-client"] == "100"
+
+    async def test_stops_at_row_limit(self, sap_config, paging_server, requests_seen):
+        """Test that iteration stops early once max_rows is reached"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, paging_server)
+            rows = [
+                row
+                async for row in client.iter_entity_set(
+                    "/SRV", "OrderSet", max_rows=4, rows=True, prefetch=0
+                )
+            ]
+
+        assert [row["Vbeln"] for row in rows] == ["1", "2", "3", "4"]
+        assert len(requests_seen) == 2
+
+    async def test_client_side_paging(self, sap_config, paging_server, requests_seen):
+        """Test $top/$skip paging when a page size is requested"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, paging_server)
+            pages = [
+                page
+                async for page in client.iter_entity_set(
+                    "/SRV", "OrderSet", page_size=3
+                )
+            ]
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [r["query"].get("$skip") for r in requests_seen] == [None, "3", "6"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPartitionedScan:
+    """Tests for parallel partitioned entity set scans"""
+
+    async def test_count_entity_set(self, sap_config, paging_server):
+        """Test counting via the $count segment"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, paging_server)
+            assert await client.count_entity_set("/SRV", "OrderSet") == 7
+
+    @pytest.mark.parametrize("partition_by", ["skip", "key"])
+    async def test_scan_returns_all_rows_in_order(
+        self, sap_config, paging_server, partition_by
+    ):
+        """Test that disjoint partitions come back complete and ordered"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, paging_server)
+            partitions = [
+                partition
+                async for partition in client.scan_entity_set(
+                    "/SRV",
+                    "OrderSet",
+                    partition_size=2,
+                    max_parallel=3,
+                    key_field="Vbeln",
+                    partition_by=partition_by,
+                )
+            ]
+
+        assert [len(p) for p in partitions] == [2, 2, 2, 1]
+        rows = [row["Vbeln"] for partition in partitions for row in partition]
+        assert rows == [str(i) for i in range(1, 8)]
+
+    async def test_key_partitioning_requires_key_field(self, sap_config):
+        """Test that key range partitioning is rejected without a key field"""
+        client = make_client(sap_config)
+        with pytest.raises(SAPValidationError):
+            async for _ in client.scan_entity_set(
+                "/SRV", "OrderSet", partition_by="key"
+            ):
+                pass
+
+
+@pytest.fixture
+async def key_list_server(requests_seen) -> AsyncIterator[TestServer]:
+    """Two item rows for each Vbeln value in a filter"""
+    in_flight = [0]
+
+    async def handle(request: web.Request) -> web.Response:
+        in_flight[0] += 1
+        requests_seen.append({"query": dict(request.query), "in_flight": in_flight[0]})
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        keys = re.findall(r"Vbeln eq '(\d+)'", request.query["$filter"])
+        rows = [
+            {"Vbeln": key, "Posnr": posnr} for key in keys for posnr in ("10", "20")
+        ]
+        return web.json_response({"d": {"results": rows}})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+def count_results(data: Dict[str, Any]) -> int:
+    """Transformation counting the rows of a collection response"""
+    return len(data["d"]["results"])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestKeyListSplitting:
+    """Tests for splitting long key-list filters into concurrent requests"""
+
+    async def test_long_key_list_is_split_and_merged(
+        self, sap_config, key_list_server, requests_seen
+    ):
+        """Test that chunks stay short, run bounded and merge in order"""
+        keys = [f"{i:010d}" for i in range(1, 201)]
+        key_list = " or ".join(f"Vbeln eq '{key}'" for key in keys)
+        async with make_client(
+            sap_config, auth_mode="lazy", max_filter_length=600, filter_chunk_parallel=2
+        ) as client:
+            point_client_at(client, key_list_server)
+            data = await client.query_entity_set(
+                "/SRV",
+                "OrderSet",
+                filters={"$filter": f"Auart eq 'ZOR' and ({key_list})"},
+            )
+
+        rows = [row["Vbeln"] for row in data["d"]["results"]]
+        assert rows == [key for key in keys for _ in ("10", "20")]
+        assert len(requests_seen) > 2
+        assert max(r["in_flight"] for r in requests_seen) == 2
+        for request in requests_seen:
+            assert len(quote(request["query"]["$filter"], safe="")) <= 600
+            assert request["query"]["$filter"].startswith("Auart eq 'ZOR' and (")
+
+    async def test_top_applies_to_merged_rows(self, sap_config, key_list_server):
+        """Test that $top limits the merged result"""
+        key_list = " or ".join(f"Vbeln eq '{i:010d}'" for i in range(1, 101))
+        async with make_client(
+            sap_config, auth_mode="lazy", max_filter_length=600
+        ) as client:
+            point_client_at(client, key_list_server)
+            data = await client.query_entity_set(
+                "/SRV",
+                "OrderSet",
+                filters={"$filter": key_list},
+                top=5,
+            )
+
+        assert len(data["d"]["results"]) == 5
+
+    async def test_rows_sharing_a_key_value_are_kept(self, sap_config, key_list_server):
+        """Test that every item row of a split key list is returned"""
+        keys = [f"{i:010d}" for i in range(1, 101)]
+        key_list = " or ".join(f"Vbeln eq '{key}'" for key in keys)
+        async with make_client(
+            sap_config, auth_mode="lazy", max_filter_length=600
+        ) as client:
+            point_client_at(client, key_list_server)
+            data = await client.query_entity_set(
+                "/SRV", "OrderItemSet", filters={"$filter": key_list}
+            )
+
+        items = {(row["Vbeln"], row["Posnr"]) for row in data["d"]["results"]}
+        assert len(data["d"]["results"]) == 200
+        assert items == {(key, posnr) for key in keys for posnr in ("10", "20")}
+
+    async def test_transform_applies_to_merged_rows(self, sap_config, key_list_server):
+        """Test that the transformation runs once, on the merged response"""
+        key_list = " or ".join(f"Vbeln eq '{i:010d}'" for i in range(1, 101))
+        async with make_client(
+            sap_config, auth_mode="lazy", max_filter_length=600
+        ) as client:
+            point_client_at(client, key_list_server)
+            count = await client.query_entity_set(
+                "/SRV",
+                "OrderItemSet",
+                filters={"$filter": key_list},
+                transform=count_results,
+            )
+
+        assert count == 200
+
+    async def test_short_filter_is_sent_whole(
+        self, sap_config, key_list_server, requests_seen
+    ):
+        """Test that a filter within the limit is a single request"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, key_list_server)
+            await client.query_entity_set(
+                "/SRV", "OrderSet", filters={"$filter": "Vbeln eq '1' or Vbeln eq '2'"}
+            )
+
+        assert len(requests_seen) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkRetrieval:
+    """Tests for retrieving several entities by key"""
+
+    async def test_concurrent_lookup_reports_per_key_errors(
+        self, sap_config, entity_server, requests_seen
+    ):
+        """Test that a missing key fails alone and duplicates are fetched once"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            results = await client.get_entities(
+                "/SRV", "OrderSet", ["3", "9", "1", "3"], max_parallel=2
+            )
+
+        assert [r["key"] for r in results] == ["3", "9", "1"]
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[0]["data"] == {"d": {"Vbeln": "3"}}
+        assert "404" in results[1]["error"]
+        assert len(requests_seen) == 3
+
+    async def test_batch_lookup(self, sap_config, entity_server, requests_seen):
+        """Test that keys are sent as $batch chunks of the requested size"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            # A read first, so the $batch POST reuses its CSRF token
+            await client.get_entity("/SRV", "OrderSet", "1")
+            requests_seen.clear()
+
+            results = await client.get_entities(
+                "/SRV", "OrderSet", ["1", "2", "3", "7", "5"], batch_size=2
+            )
+
+        assert [r["success"] for r in results] == [True, True, True, False, True]
+        assert results[2]["data"] == {"d": {"Vbeln": "3"}}
+        assert results[3]["error"] == "SAP request failed: 404 Not Found - Not found"
+        assert [r["method"] for r in requests_seen] == ["POST"] * 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestResponseCaching:
+    """Tests for caching of read-only requests"""
+
+    async def test_repeated_reads_are_served_from_cache(
+        self, sap_config, entity_server, requests_seen
+    ):
+        """Test that the same read reaches SAP only once while fresh"""
+        async with make_client(sap_config, cache_ttl=60, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            first = await client.get_entity("/SRV", "OrderSet", "1")
+            second = await client.get_entity("/SRV", "OrderSet", "1")
+
+            assert first == second
+            assert len(requests_seen) == 1
+            stats = client.get_cache_stats()
+            assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    async def test_write_invalidates_entity_set(
+        self, sap_config, entity_server, requests_seen
+    ):
+        """Test that a write drops cached reads of the entity set"""
+        async with make_client(sap_config, cache_ttl=60, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            await client.get_entity("/SRV", "OrderSet", "1")
+            await client.execute_batch("/SRV", batch_with_update("OrderSet('1')"))
+            await client.get_entity("/SRV", "OrderSet", "1")
+
+        assert [r["method"] for r in requests_seen] == ["GET", "POST", "GET"]
+
+    async def test_read_overlapping_a_write_is_not_cached(
+        self, sap_config, entity_server, requests_seen
+    ):
+        """Test that a response read while a write invalidates is not stored"""
+        async with make_client(sap_config, cache_ttl=60, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            make_request = client._make_request
+
+            async def write_during_request(*args, **kwargs):
+                # A write to the entity set completes while the GET runs
+                client.invalidate_cache("/SRV", "OrderSet")
+                return await make_request(*args, **kwargs)
+
+            client._make_request = write_during_request
+            await client.get_entity("/SRV", "OrderSet", "1")
+            client._make_request = make_request
+            await client.get_entity("/SRV", "OrderSet", "1")
+
+        assert len(requests_seen) == 2
+
+    async def test_reads_are_not_cached_by_default(
+        self, sap_config, entity_server, requests_seen
+    ):
+        """Test that reads are not cached without a configured TTL"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            await client.get_entity("/SRV", "OrderSet", "1")
+            await client.get_entity("/SRV", "OrderSet", "1")
+
+        assert len(requests_seen) == 2
+        assert client.get_cache_stats()["misses"] == 0
+
+    async def test_equivalent_filters_share_an_entry(
+        self, sap_config, odata_server, requests_seen
+    ):
+        """Test that filters differing only in form reach SAP once, as written"""
+        async with make_client(sap_config, cache_ttl=60, auth_mode="lazy") as client:
+            point_client_at(client, odata_server)
+            await client.query_entity_set(
+                "/SRV",
+                "OrderSet",
+                filters={"$filter": "(5 lt Netwr)  and Kunnr eq 'A'"},
+            )
+            await client.query_entity_set(
+                "/SRV", "OrderSet", filters={"$filter": "Kunnr eq 'A' and Netwr gt 5"}
+            )
+
+        assert len(requests_seen) == 1
+        assert requests_seen[0]["query"]["$filter"] == "(5 lt Netwr)  and Kunnr eq 'A'"
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "OrderDate ge 2024-01-01",
+            "Items/any(i:i/Qty gt 1)",
+            "Status in ('A','B')",
+        ],
+    )
+    async def test_unparsed_filter_is_sent_unchanged(
+        self, sap_config, odata_server, requests_seen, expression
+    ):
+        """Test that filters beyond the parser's grammar still reach SAP"""
+        async with make_client(sap_config, auth_mode="lazy") as client:
+            point_client_at(client, odata_server)
+            await client.query_entity_set(
+                "/SRV", "OrderSet", filters={"$filter": expression}
+            )
+
+        assert requests_seen[0]["query"]["$filter"] == expression
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConditionalRevalidation:
+    """Tests for ETag revalidation of expired cached entities"""
+
+    async def test_not_modified_is_served_from_cache(
+        self, sap_config, entity_server, requests_seen
+    ):
+        """Test that an expired entity is revalidated and a 304 reuses it"""
+        now = [0.0]
+        async with make_client(sap_config, cache_ttl=60, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            client.response_cache = ResponseCache(clock=lambda: now[0])
+
+            first = await client.get_entity("/SRV", "OrderSet", "5")
+            now[0] = 61.0
+            second = await client.get_entity("/SRV", "OrderSet", "5")
+
+            assert first == second
+            assert "If-None-Match" not in requests_seen[0]["headers"]
+            assert requests_seen[1]["headers"]["If-None-Match"] == 'W/"v1"'
+            assert client.get_cache_stats()["revalidations"] == 1
+
+    async def test_entities_without_etag_are_re_read(
+        self, sap_config, entity_server, requests_seen
+    ):
+        """Test that expired entries without an ETag are dropped"""
+        now = [0.0]
+        async with make_client(sap_config, cache_ttl=60, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            client.response_cache = ResponseCache(clock=lambda: now[0])
+
+            await client.get_entity("/SRV", "OrderSet", "1")
+            now[0] = 61.0
+            await client.get_entity("/SRV", "OrderSet", "1")
+
+            assert "If-None-Match" not in requests_seen[1]["headers"]
+            assert len(client.response_cache) == 1
+
+    async def test_entry_evicted_during_revalidation_is_re_read(
+        self, sap_config, entity_server, requests_seen
+    ):
+        """Test that a 304 for an entry evicted meanwhile is not served as data"""
+        now = [0.0]
+        async with make_client(sap_config, cache_ttl=60, auth_mode="lazy") as client:
+            point_client_at(client, entity_server)
+            client.response_cache = ResponseCache(clock=lambda: now[0])
+            make_request = client._make_request
+
+            async def evict_then_request(*args, **kwargs):
+                # Another call drops the entry while the conditional GET runs
+                if "If-None-Match" in kwargs.get("headers", {}):
+                    client.invalidate_cache("/SRV", "OrderSet")
+                return await make_request(*args, **kwargs)
+
+            client._make_request = evict_then_request
+
+            first = await client.get_entity("/SRV", "OrderSet", "5")
+            now[0] = 61.0
+            second = await client.get_entity("/SRV", "OrderSet", "5")
+
+            assert second == first
+            assert [r["headers"].get("If-None-Match") for r in requests_seen] == [
+                None,
+                'W/"v1"',
+                None,
+            ]
+            assert client.get_cache_stats()["revalidations"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMetadataCache:
+    """Tests for the persistent parsed-metadata cache"""
+
+    async def test_metadata_is_parsed_once(
+        self, sap_config, metadata_server, requests_seen, tmp_path
+    ):
+        """Test that fresh metadata is served from memory"""
+        async with make_client(
+            sap_config, auth_mode="lazy", metadata_cache_dir=str(tmp_path)
+        ) as client:
+            point_client_at(client, metadata_server)
+            first = await client.get_service_metadata("/SRV")
+            second = await client.get_service_metadata("/SRV")
+
+        assert first is second
+        assert "edmx:Edmx" in first
+        assert len(requests_seen) == 1
+
+    async def test_restart_loads_metadata_from_disk(
+        self, sap_config, metadata_server, requests_seen, tmp_path
+    ):
+        """Test that a new client reuses metadata persisted by an earlier one"""
+        for _ in range(2):
+            async with make_client(
+                sap_config, auth_mode="lazy", metadata_cache_dir=str(tmp_path)
+            ) as client:
+                point_client_at(client, metadata_server)
+                metadata = await client.get_service_metadata("/SRV")
+
+        assert "edmx:Edmx" in metadata
+        assert len(requests_seen) == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    async def test_stale_metadata_is_revalidated(
+        self, sap_config, metadata_server, requests_seen
+    ):
+        """Test that expired metadata is revalidated with its ETag"""
+        async with make_client(
+            sap_config,
+            auth_mode="lazy",
+            metadata_cache_persist=False,
+            metadata_cache_ttl=0,
+        ) as client:
+            point_client_at(client, metadata_server)
+            first = await client.get_service_metadata("/SRV")
+            second = await client.get_service_metadata("/SRV")
+
+        assert first is second
+        assert requests_seen[1]["headers"]["If-None-Match"] == '"md-1"'
+
+    async def test_schema_model_is_persisted(
+        self, sap_config, metadata_server, requests_seen, tmp_path
+    ):
+        """Test that the compact schema model survives a restart"""
+        for _ in range(2):
+            async with make_client(
+                sap_config, auth_mode="lazy", metadata_cache_dir=str(tmp_path)
+            ) as client:
+                point_client_at(client, metadata_server)
+                schema = await client.get_service_schema("/SRV")
+
+        assert schema.get_entity_type("ZSRV.Order").keys == ("Vbeln",)
+        assert len(requests_seen) == 1
+
+
+def batch_with_update(path: str) -> BatchRequest:
+    """$batch with a single changeset updating one entity"""
+    batch = BatchRequest()
+    with batch.changeset() as changeset:
+        changeset.update(path, {"Netwr": "10.00"})
+    return batch
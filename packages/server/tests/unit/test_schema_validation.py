@@ -0,0 +1,188 @@
+"""Unit tests for validating requests against the service metadata"""
+
+from typing import Any
+
+import pytest
+
+from sap_mcp_server.config.schemas import ServiceConfig, ValidationConfig
+from sap_mcp_server.core.edmx import (
+    EntitySet,
+    EntityType,
+    NavigationProperty,
+    Property,
+    ServiceSchema,
+)
+from sap_mcp_server.core.exceptions import SAPRequestError, SAPValidationError
+from sap_mcp_server.core.schema_validation import (
+    check_filter,
+    check_key,
+    check_select,
+    suggest,
+    validate_request,
+)
+
+ORDER = EntityType(
+    name="Order",
+    namespace="ZSRV",
+    keys=("Vbeln",),
+    properties=(
+        Property("Vbeln", "Edm.String", False, 10),
+        Property("Netwr", "Edm.Decimal"),
+        Property("Posnr", "Edm.Int32"),
+        Property("Erdat", "Edm.DateTime"),
+        Property("Kunnr", "Edm.String", True, 10),
+    ),
+    navigations=(NavigationProperty("ToItems", "ZSRV.Item", True),),
+)
+ITEM = EntityType(
+    name="Item",
+    namespace="ZSRV",
+    keys=("ItemId",),
+    properties=(Property("ItemId", "Edm.Guid", False),),
+)
+SCHEMA = ServiceSchema(
+    [ORDER, ITEM],
+    [EntitySet("OrderSet", "ZSRV.Order"), EntitySet("ItemSet", "ZSRV.Item")],
+)
+SERVICE = ServiceConfig(id="SRV", name="Service", path="/SRV")
+
+
+class SchemaClient:
+    """Client stand-in serving a fixed schema, or failing"""
+
+    def __init__(self, error: Exception = None) -> None:
+        self.error = error
+
+    async def get_service_schema(self, service_path: str) -> Any:
+        if self.error:
+            raise self.error
+        return SCHEMA
+
+
+@pytest.mark.unit
+class TestChecks:
+    """Tests for select, filter and key checks"""
+
+    def test_suggestions(self):
+        """Test that case mismatches and near misses are suggested"""
+        names = ["Vbeln", "Netwr", "Kunnr"]
+        assert suggest("VBELN", names) == " Did you mean: Vbeln?"
+        assert suggest("Kunr", names) == " Did you mean: Kunnr?"
+        assert suggest("Material", names) == ""
+
+    def test_select(self):
+        """Test that unknown fields are reported and navigation paths accepted"""
+        assert check_select(["Vbeln", "ToItems/ItemId"], ORDER, "OrderSet") == []
+        assert check_select(["Vbeln", "NetValue", "Kunr"], ORDER, "OrderSet") == [
+            "Unknown property 'NetValue' of OrderSet.",
+            "Unknown property 'Kunr' of OrderSet. Did you mean: Kunnr?",
+        ]
+
+    def test_filter_properties(self):
+        """Test that unknown properties in a filter are reported once"""
+        errors = check_filter(
+            "startswith(kunnr,'A') and kunnr ne 'B'", ORDER, "OrderSet"
+        )
+        assert errors == ["Unknown property 'kunnr' of OrderSet. Did you mean: Kunnr?"]
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "Vbeln eq '0000012345'",
+            "Netwr gt 100 and Netwr lt 99.5M",
+            "Posnr le 20L",
+            "Erdat ge datetime'2024-01-01T00:00:00'",
+            "Kunnr eq null",
+            "'A' eq Kunnr",
+        ],
+    )
+    def test_filter_literal_types_accepted(self, expression):
+        """Test that literals of a matching type pass"""
+        assert check_filter(expression, ORDER, "OrderSet") == []
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["Erdat ge 2024-01-01", "ToItems/any(i:i/Qty gt 1)", "Vbeln in ('1','2')"],
+    )
+    def test_unparsed_filter_is_not_checked(self, expression):
+        """Test that filters outside the parser's grammar are left to SAP"""
+        assert check_filter(expression, ORDER, "OrderSet") == []
+
+    @pytest.mark.parametrize(
+        "expression, hint",
+        [
+            ("Vbeln eq 12345", "'text'"),
+            ("Netwr gt '100'", "a number"),
+            ("Posnr eq 1.5", "a number"),
+            ("'2024-01-01' le Erdat", "datetime'2024-01-01T00:00:00'"),
+        ],
+    )
+    def test_filter_literal_types_rejected(self, expression, hint):
+        """Test that literals of the wrong type are reported with a hint"""
+        (error,) = check_filter(expression, ORDER, "OrderSet")
+        assert error.endswith(f"write the value as {hint}")
+
+    def test_keys(self):
+        """Test that key values are checked against the key type"""
+        assert check_key("0000012345", ORDER, "OrderSet") == []
+        assert check_key("00000123456", ORDER, "OrderSet") == [
+            "Key '00000123456' does not fit OrderSet key Vbeln (Edm.String): "
+            "expected at most 10 characters"
+        ]
+        guid = "0050568d-393c-1ed4-9d97-e29c4c1f3a7b"
+        assert check_key(guid, ITEM, "ItemSet") == []
+        assert check_key("42", ITEM, "ItemSet")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestValidateRequest:
+    """Tests for validating a read before it is sent"""
+
+    async def test_reports_all_problems(self):
+        """Test that every problem is reported in one error"""
+        with pytest.raises(SAPValidationError) as excinfo:
+            await validate_request(
+                SchemaClient(),
+                SERVICE,
+                "OrderSet",
+                ValidationConfig(),
+                select=["Vblen"],
+                filter_expr="Netwr gt '5'",
+            )
+        message = str(excinfo.value)
+        assert "Unknown property 'Vblen' of OrderSet. Did you mean: Vbeln?" in message
+        assert "Property 'Netwr' is Edm.Decimal" in message
+
+    async def test_unknown_entity_set(self):
+        """Test that an unknown entity set is reported with suggestions"""
+        with pytest.raises(SAPValidationError, match="Did you mean: OrderSet?"):
+            await validate_request(
+                SchemaClient(), SERVICE, "OrdersSet", ValidationConfig()
+            )
+
+    async def test_valid_request_passes(self):
+        """Test that a valid read is not rejected"""
+        await validate_request(
+            SchemaClient(),
+            SERVICE,
+            "OrderSet",
+            ValidationConfig(),
+            select=["Vbeln", "Netwr"],
+            filter_expr="Netwr gt 5",
+            entity_key="1",
+        )
+
+    async def test_skipped_without_metadata_or_when_disabled(self):
+        """Test that reads are not blocked when they cannot be checked"""
+        failing = SchemaClient(SAPRequestError("503"))
+        await validate_request(
+            failing, SERVICE, "OrderSet", ValidationConfig(), select=["Nope"]
+        )
+        await validate_request(
+            SchemaClient(),
+            SERVICE,
+            "OrderSet",
+            ValidationConfig(enabled=False),
+            select=["Nope"],
+        )
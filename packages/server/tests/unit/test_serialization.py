@@ -0,0 +1,75 @@
+"""Unit tests for the JSON serialization backends"""
+
+from datetime import date
+
+import pytest
+
+from sap_mcp_server.utils import serialization
+from sap_mcp_server.utils.serialization import available_backends, set_backend
+
+BACKENDS = list(available_backends())
+DOCUMENT = {
+    "d": {
+        "results": [
+            {
+                "__metadata": {"uri": "OrderSet('1')", "etag": 'W/"v1"'},
+                "Vbeln": "1",
+                "Erdat": "/Date(1714521600000)/",
+                "Netwr": "13.37",
+                "Bstnk": "PO-ÄÖÜ",
+                "Items": {"__deferred": {"uri": "OrderSet('1')/Items"}},
+            }
+        ],
+        "__count": "1",
+    }
+}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Select each installed backend, restoring the previous one afterwards"""
+    previous = serialization.backend_name
+    set_backend(request.param)
+    yield request.param
+    set_backend(previous)
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Tests for loads/dumps across backends"""
+
+    def test_round_trip_matches_stdlib(self, backend):
+        """Test that every backend decodes and encodes like the stdlib"""
+        text = serialization.dumps(DOCUMENT)
+
+        assert serialization.loads(text) == DOCUMENT
+        assert serialization.loads(text.encode("utf-8")) == DOCUMENT
+
+    def test_output_is_compact_utf8(self, backend):
+        """Test that output has no whitespace and non-ASCII is not escaped"""
+        assert serialization.dumps({"a": [1, 2], "b": "Ä"}) == '{"a":[1,2],"b":"Ä"}'
+
+    def test_invalid_json_raises_value_error(self, backend):
+        """Test that decode errors surface as ValueError"""
+        with pytest.raises(ValueError):
+            serialization.loads('{"d": ')
+
+    def test_default_hook(self, backend):
+        """Test that unsupported objects go through the default hook"""
+        text = serialization.dumps({"day": date(2024, 5, 1)}, default=str)
+        assert serialization.loads(text) == {"day": "2024-05-01"}
+
+    def test_unknown_backend_rejected(self):
+        """Test that an unknown backend name raises ValueError"""
+        previous = serialization.backend_name
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            set_backend("simdjson")
+        assert serialization.backend_name == previous
+
+    def test_auto_prefers_fastest(self):
+        """Test that auto selects the first installed backend in order"""
+        previous = serialization.backend_name
+        try:
+            assert set_backend("auto") == BACKENDS[0]
+        finally:
+            set_backend(previous)
@@ -3,6 +3,7 @@
 import pytest
 
 from sap_mcp_server.utils.validators import (
+    compile_tool_validator,
     sanitize_input,
     validate_entity_key,
     validate_field_name,
@@ -11,6 +12,7 @@ from sap_mcp_server.utils.validators import (
     validate_port,
     validate_select_fields,
     validate_service_path,
+    validate_tool_arguments,
     validate_url,
 )
 
@@ -173,3 +175,68 @@ class TestInputSanitization:
         """Test non-string input"""
         with pytest.raises(ValueError, match="must be a string"):
             sanitize_input(12345)  # type: ignore
+
+
+TOOL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "service": {"type": "string"},
+        "top": {"type": "integer", "minimum": 1, "maximum": 1000},
+        "format": {"type": "string", "enum": ["json", "json_compact"]},
+        "use_batch": {"type": "boolean"},
+        "entity_keys": {
+            "type": "array",
+            "items": {"type": "string"},
+            "minItems": 1,
+            "maxItems": 3,
+        },
+    },
+    "required": ["service"],
+}
+
+
+@pytest.mark.unit
+class TestToolArgumentValidation:
+    """Tests for compiled tool argument validators"""
+
+    def test_valid_arguments_pass_through(self):
+        """Test that valid arguments are returned unchanged"""
+        validate = compile_tool_validator(TOOL_SCHEMA)
+        arguments = {
+            "service": "Z_ORDER_SRV",
+            "top": 10,
+            "format": "json",
+            "use_batch": True,
+            "entity_keys": ["1", "2"],
+            "unknown": object(),
+        }
+        assert validate(arguments) is arguments
+
+    @pytest.mark.parametrize(
+        "arguments, message",
+        [
+            ({}, "Missing required argument: service"),
+            ({"service": 1}, "'service' must be a string"),
+            ({"service": "S", "top": "10"}, "'top' must be an integer"),
+            ({"service": "S", "top": True}, "'top' must be an integer"),
+            ({"service": "S", "top": 0}, "'top' must be at least 1"),
+            ({"service": "S", "top": 5000}, "'top' must be at most 1000"),
+            ({"service": "S", "format": "xml"}, "must be one of: json, json_compact"),
+            ({"service": "S", "use_batch": "yes"}, "must be a boolean"),
+            ({"service": "S", "entity_keys": []}, "at least 1 items"),
+            ({"service": "S", "entity_keys": ["1"] * 4}, "at most 3 items"),
+            ({"service": "S", "entity_keys": ["1", 2]}, "must be a string"),
+        ],
+    )
+    def test_invalid_arguments_rejected(self, arguments, message):
+        """Test that each schema violation raises ValueError"""
+        with pytest.raises(ValueError, match=message):
+            compile_tool_validator(TOOL_SCHEMA)(arguments)
+
+    def test_validate_tool_arguments(self):
+        """Test the one-shot helper"""
+        assert validate_tool_arguments({"service": "S"}, TOOL_SCHEMA) == {
+            "service": "S"
+        }
+        with pytest.raises(ValueError, match="Missing required argument"):
+            validate_tool_arguments({}, TOOL_SCHEMA)